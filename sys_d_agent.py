@@ -0,0 +1,601 @@
+import os
+import sys
+import io
+import ssl
+import hmac
+import time
+import argparse
+import threading
+import contextlib
+import ipaddress
+import socketserver
+import psutil
+from collections import OrderedDict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sys_d_v21 as scanner
+from sys_d_v21 import print_status, dumps_json
+
+# Seconds a collector result stays fresh. Unlisted collectors fall back to their
+# registered volatility class, then to DEFAULT_MAX_AGE for per-scan collectors.
+AGENT_MAX_AGE = {
+    "PROCESS SNAPSHOT": 5,
+    "TASK MANAGER - RUNNING PROCESSES": 5,
+    "PROCESS TREE": 5,
+    "PROCESS FAMILIES": 5,
+    "REMOTE ACCESS DETECTION": 30,
+    "SAMPLING WINDOW": 15,
+    "PROCESS CPU": 15,
+    "PRESSURE SIGNALS": 15,
+    "HEALTH METRICS": 15,
+    "HEALTH SCORE": 15,
+    "SYSTEM OVERVIEW": 15,
+    "NETWORK CONNECTIONS": 10,
+    "LISTENING PORTS": 30,
+    "SYSTEM PERFORMANCE": 30,
+    "GPU UTILIZATION": 15,
+    "STORAGE ANALYSIS": 60,
+    "HARDWARE DETAILS": 3600,
+    "USER ACCOUNTS": 3600,
+}
+DEFAULT_MAX_AGE = 300
+BOOT_MAX_AGE = 24 * 3600  # The agent lives within one boot; this is only a safety net
+
+
+# -------------------------------------------------------------------
+#  OPENMETRICS EXPORTER - RENDERED ONCE PER SAMPLE, SERVED FROM MEMORY
+# -------------------------------------------------------------------
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_METRICS_INTERVAL = 15
+
+# (name, type, help) in exposition order; counters get the _total suffix on their samples
+METRIC_FAMILIES = [
+    ("sysd_health_score", "gauge", "Scanner health score (0-100)"),
+    ("sysd_cpu_usage_percent", "gauge", "CPU usage since the previous sample"),
+    ("sysd_cpu_core_usage_percent", "gauge", "Per-core CPU usage since the previous sample"),
+    ("sysd_cpu_frequency_mhz", "gauge", "Current CPU frequency"),
+    ("sysd_memory_total_bytes", "gauge", "Physical memory"),
+    ("sysd_memory_used_bytes", "gauge", "Physical memory in use"),
+    ("sysd_memory_available_bytes", "gauge", "Physical memory available without swapping"),
+    ("sysd_memory_usage_percent", "gauge", "Physical memory usage"),
+    ("sysd_load_per_core", "gauge", "Load average divided by logical cores"),
+    ("sysd_pressure_stall_percent", "gauge", "Share of time tasks stalled on a resource (Linux PSI)"),
+    ("sysd_swap_total_bytes", "gauge", "Swap space"),
+    ("sysd_swap_used_bytes", "gauge", "Swap space in use"),
+    ("sysd_disk_read_bytes", "counter", "Bytes read from all disks"),
+    ("sysd_disk_written_bytes", "counter", "Bytes written to all disks"),
+    ("sysd_network_sent_bytes", "counter", "Bytes sent on all interfaces"),
+    ("sysd_network_received_bytes", "counter", "Bytes received on all interfaces"),
+    ("sysd_temperature_celsius", "gauge", "Hardware sensor temperature"),
+    ("sysd_filesystem_size_bytes", "gauge", "Filesystem size"),
+    ("sysd_filesystem_used_bytes", "gauge", "Filesystem space in use"),
+    ("sysd_filesystem_free_bytes", "gauge", "Filesystem space free"),
+    ("sysd_filesystem_usage_percent", "gauge", "Filesystem usage"),
+    ("sysd_processes", "gauge", "Processes by state"),
+    ("sysd_process_cpu_usage_percent", "gauge", "Per-process CPU usage"),
+    ("sysd_process_resident_memory_bytes", "gauge", "Per-process resident memory"),
+    ("sysd_process_threads", "gauge", "Per-process thread count"),
+]
+
+
+def format_metric_value(value):
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class LabelCache:
+    """Builds each series' `{name="value",...}` string once and keeps it while the series exists"""
+
+    def __init__(self, *names):
+        self.names = names
+        self.labels = {}
+        self.used = set()
+
+    def get(self, *values):
+        label = self.labels.get(values)
+        if label is None:
+            pairs = []
+            for name, value in zip(self.names, values):
+                value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+                pairs.append(f'{name}="{value}"')
+            label = "{" + ",".join(pairs) + "}"
+            self.labels[values] = label
+        self.used.add(values)
+        return label
+
+    def sweep(self):
+        """Forget series that were not seen in the last sample (exited processes, unmounted filesystems)"""
+        self.labels = {values: self.labels[values] for values in self.used if values in self.labels}
+        self.used = set()
+
+
+class MetricsExporter:
+    """Samples raw numbers (not the formatted report strings) and renders the exposition once per sample.
+
+    Each family's text is cached alongside its samples; a family whose samples did
+    not change since the last render reuses its previous text, so a scrape is just
+    a copy of the current body regardless of how many processes or mounts exist.
+    """
+
+    def __init__(self):
+        self.core_labels = LabelCache("core")
+        self.sensor_labels = LabelCache("sensor", "label")
+        self.filesystem_labels = LabelCache("device", "mountpoint", "fstype")
+        self.state_labels = LabelCache("state")
+        self.load_labels = LabelCache("window")
+        self.pressure_labels = LabelCache("resource", "kind", "window")
+        self.process_labels = LabelCache("pid", "name", "user")
+        self.rendered = {}
+        self.body = b"# EOF\n"
+        self.sampled_at = None
+        self.sample_seconds = 0.0
+
+    def collect_samples(self, health_score=None, process_snapshot=None):
+        samples = {name: [] for name, _, _ in METRIC_FAMILIES}
+        if health_score is not None:
+            samples["sysd_health_score"].append(("", health_score))
+
+        samples["sysd_cpu_usage_percent"].append(("", psutil.cpu_percent(interval=None)))
+        for core, percent in enumerate(psutil.cpu_percent(interval=None, percpu=True)):
+            samples["sysd_cpu_core_usage_percent"].append((self.core_labels.get(core), percent))
+        try:
+            cpu_freq = psutil.cpu_freq()
+            if cpu_freq:
+                samples["sysd_cpu_frequency_mhz"].append(("", cpu_freq.current))
+        except Exception:
+            pass
+
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        samples["sysd_memory_total_bytes"].append(("", memory.total))
+        samples["sysd_memory_used_bytes"].append(("", memory.used))
+        samples["sysd_memory_available_bytes"].append(("", memory.available))
+        samples["sysd_memory_usage_percent"].append(("", memory.percent))
+        try:
+            cores = psutil.cpu_count(logical=True) or 1
+            for window, load in zip(("1m", "5m", "15m"), os.getloadavg()):
+                samples["sysd_load_per_core"].append((self.load_labels.get(window), round(load / cores, 3)))
+        except (AttributeError, OSError):
+            pass
+        for resource in scanner.PRESSURE_RESOURCES:
+            for kind, values in (scanner.read_pressure(resource) or {}).items():
+                for window in ("avg10", "avg60", "avg300"):
+                    label = self.pressure_labels.get(resource, kind, window)
+                    samples["sysd_pressure_stall_percent"].append((label, values[window]))
+        samples["sysd_swap_total_bytes"].append(("", swap.total))
+        samples["sysd_swap_used_bytes"].append(("", swap.used))
+
+        disk_io = psutil.disk_io_counters()
+        if disk_io:
+            samples["sysd_disk_read_bytes"].append(("", disk_io.read_bytes))
+            samples["sysd_disk_written_bytes"].append(("", disk_io.write_bytes))
+        net_io = psutil.net_io_counters()
+        if net_io:
+            samples["sysd_network_sent_bytes"].append(("", net_io.bytes_sent))
+            samples["sysd_network_received_bytes"].append(("", net_io.bytes_recv))
+
+        try:
+            for sensor, entries in (psutil.sensors_temperatures() or {}).items():
+                for index, entry in enumerate(entries):
+                    label = self.sensor_labels.get(sensor, entry.label or str(index))
+                    samples["sysd_temperature_celsius"].append((label, entry.current))
+        except Exception:
+            pass
+
+        for part in psutil.disk_partitions():
+            # Same exclusions as get_advanced_storage_details
+            if 'cdrom' in part.opts or part.fstype == '':
+                continue
+            try:
+                usage = psutil.disk_usage(part.mountpoint)
+            except Exception:
+                continue
+            label = self.filesystem_labels.get(part.device, part.mountpoint, part.fstype)
+            samples["sysd_filesystem_size_bytes"].append((label, usage.total))
+            samples["sysd_filesystem_used_bytes"].append((label, usage.used))
+            samples["sysd_filesystem_free_bytes"].append((label, usage.free))
+            samples["sysd_filesystem_usage_percent"].append((label, usage.percent))
+
+        if process_snapshot is not None:
+            states = {}
+            for info in process_snapshot:
+                states[info.get('status') or "unknown"] = states.get(info.get('status') or "unknown", 0) + 1
+                label = self.process_labels.get(info['pid'], info.get('name') or "", info.get('username') or "")
+                samples["sysd_process_cpu_usage_percent"].append((label, info.get('cpu_percent') or 0.0))
+                if info.get('memory_info'):
+                    samples["sysd_process_resident_memory_bytes"].append((label, info['memory_info'].rss))
+                if info.get('num_threads') is not None:
+                    samples["sysd_process_threads"].append((label, info['num_threads']))
+            for state, count in sorted(states.items()):
+                samples["sysd_processes"].append((self.state_labels.get(state), count))
+
+        for cache in (self.core_labels, self.sensor_labels, self.filesystem_labels,
+                      self.state_labels, self.load_labels, self.pressure_labels, self.process_labels):
+            cache.sweep()
+        return samples
+
+    def render_family(self, name, metric_type, help_text, family_samples):
+        sample_name = name + "_total" if metric_type == "counter" else name
+        lines = [f"# TYPE {name} {metric_type}", f"# HELP {name} {help_text}"]
+        lines.extend(f"{sample_name}{label} {format_metric_value(value)}" for label, value in family_samples)
+        return ("\n".join(lines) + "\n").encode('utf-8')
+
+    def sample(self, health_score=None, process_snapshot=None):
+        start = time.perf_counter()
+        samples = self.collect_samples(health_score, process_snapshot)
+        chunks = []
+        rendered = {}
+        for name, metric_type, help_text in METRIC_FAMILIES:
+            family_samples = samples[name]
+            if not family_samples:
+                continue
+            previous = self.rendered.get(name)
+            if previous is not None and previous[0] == family_samples:
+                rendered[name] = previous
+            else:
+                rendered[name] = (family_samples, self.render_family(name, metric_type, help_text, family_samples))
+            chunks.append(rendered[name][1])
+        chunks.append(b"# EOF\n")
+        self.rendered = rendered
+        self.body = b"".join(chunks)
+        self.sampled_at = time.time()
+        self.sample_seconds = time.perf_counter() - start
+
+
+# -------------------------------------------------------------------
+#  WARM STATE AND BACKGROUND REFRESH
+# -------------------------------------------------------------------
+class ScanAgent:
+    """Keeps every collector's latest result in memory and refreshes only what has gone stale.
+
+    All collection happens on one refresher thread (collectors share module-level
+    caches), while request threads only read pre-serialised responses.
+    """
+
+    def __init__(self, sections=None, max_age=None, default_max_age=DEFAULT_MAX_AGE,
+                 metrics_interval=DEFAULT_METRICS_INTERVAL):
+        self.run_order, self.selected = scanner.resolve_collectors(sections)
+        self.metrics_interval = metrics_interval
+        self.metrics_due = 0
+        self.exporter = MetricsExporter()
+        self.max_age = dict(AGENT_MAX_AGE, **(max_age or {}))
+        self.default_max_age = default_max_age
+        self.updated = {}
+        self.durations = {}
+        self.responses = {}
+        self.scan_response = None
+        self.started_at = time.time()
+        self.refreshes = 0
+        self.wake = threading.Event()
+        self.forced = set()
+        self.lock = threading.Lock()
+        self.stopping = False
+
+    def age_limit(self, name):
+        if name in self.max_age:
+            return self.max_age[name]
+        volatility_age = scanner.VOLATILITY_MAX_AGE[scanner.COLLECTOR_REGISTRY[name]["volatility"]]
+        if volatility_age is None:
+            return BOOT_MAX_AGE
+        return volatility_age or self.default_max_age
+
+    def stale_sections(self, now):
+        """(stale collectors in run order, those forced by POST /refresh)"""
+        with self.lock:
+            forced, self.forced = self.forced, set()
+        return [name for name in self.run_order
+                if name in forced or now - self.updated.get(name, 0) >= self.age_limit(name)], forced
+
+    def next_due(self, now):
+        return min([self.updated.get(name, 0) + self.age_limit(name) for name in self.run_order]
+                   + [self.metrics_due]) - now
+
+    def refresh(self, names, forced=()):
+        """Re-run the given collectors, reusing fresh dependency results already in memory.
+
+        Forced collectors also bypass the scanner's boot cache.
+        """
+        scanner.command_cache.clear()
+        for name in names:
+            scanner.collector_results.pop(name, None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name in names:
+                start = time.perf_counter()
+                try:
+                    result = scanner.get_collector_result(name, use_cache=name not in forced)
+                except Exception as e:
+                    result = [{"Error": str(e)}]
+                    scanner.collector_results[name] = result
+                self.durations[name] = time.perf_counter() - start
+                self.updated[name] = time.time()
+                if scanner.COLLECTOR_REGISTRY[name]["section"]:
+                    self.responses[name] = dumps_json(self.section_document(name))
+        scanner.boot_cache.save()
+        self.scan_response = dumps_json(self.scan_document())
+        self.refreshes += 1
+
+    def section_document(self, name):
+        return OrderedDict([
+            ("name", name),
+            ("updated_at", datetime.fromtimestamp(self.updated[name]).isoformat(timespec='seconds')),
+            ("collect_seconds", round(self.durations[name], 4)),
+            ("max_age", self.age_limit(name)),
+            ("data", scanner.collector_results.get(name)),
+        ])
+
+    def scan_document(self):
+        """Same shape as collect_scan_data(), so fleet and diff tooling can consume agent output"""
+        now = datetime.now().isoformat(timespec='seconds')
+        return {
+            "metadata": OrderedDict([
+                ("generated_at", datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds')),
+                ("completed_at", now),
+                ("device_name", scanner.socket.gethostname()),
+                ("platform", scanner.platform.platform()),
+                ("system", scanner.get_scan_platform()),
+                ("command_backend", scanner.command_backend.name),
+                ("scanner_version", scanner.Config.SCANNER_VERSION),
+                ("served_by", "agent"),
+            ]),
+            "health_score": scanner.collector_results.get("HEALTH SCORE"),
+            "health_metrics": scanner.collector_results.get("HEALTH METRICS"),
+            "sections": OrderedDict((name, scanner.collector_results[name]) for name in self.selected
+                                    if scanner.COLLECTOR_REGISTRY[name]["section"] and name in self.updated),
+        }
+
+    def sample_metrics(self):
+        """Take one exporter sample from live counters plus the warm health score and process snapshot"""
+        try:
+            self.exporter.sample(
+                scanner.collector_results.get("HEALTH SCORE") if "HEALTH SCORE" in self.updated else None,
+                scanner.collector_results.get("PROCESS SNAPSHOT") if "PROCESS SNAPSHOT" in self.updated else None)
+        except Exception as e:
+            print_status(f"Metrics sample failed: {str(e)}", "WARNING")
+        self.metrics_due = time.time() + self.metrics_interval
+
+    def request_refresh(self, names):
+        with self.lock:
+            self.forced.update(names)
+        self.wake.set()
+
+    def refresher(self):
+        while not self.stopping:
+            stale, forced = self.stale_sections(time.time())
+            if stale:
+                self.refresh(stale, forced)
+            if time.time() >= self.metrics_due:
+                self.sample_metrics()
+            self.wake.wait(timeout=max(0.5, self.next_due(time.time())))
+            self.wake.clear()
+
+    def status(self):
+        now = time.time()
+        return OrderedDict([
+            ("status", "ok" if self.scan_response else "warming"),
+            ("uptime", round(now - self.started_at, 1)),
+            ("refresh_cycles", self.refreshes),
+            ("metrics_sampled_at", datetime.fromtimestamp(self.exporter.sampled_at).isoformat(timespec='seconds')
+                                   if self.exporter.sampled_at else None),
+            ("metrics_sample_seconds", round(self.exporter.sample_seconds, 4)),
+            ("sections", [OrderedDict([("name", name),
+                                       ("age", round(now - self.updated[name], 1) if name in self.updated else None),
+                                       ("max_age", self.age_limit(name)),
+                                       ("collect_seconds", round(self.durations.get(name, 0), 4)),
+                                       ("internal", not scanner.COLLECTOR_REGISTRY[name]["section"])])
+                          for name in self.run_order]),
+        ])
+
+
+# -------------------------------------------------------------------
+#  LOCAL QUERY API - LOCALHOST HTTP OR UNIX SOCKET
+# -------------------------------------------------------------------
+class AgentRequestHandler(BaseHTTPRequestHandler):
+    """GET /health, /sections, /scan, /section/<name>, /metrics; POST /refresh?section=<name>
+
+    With a token every request needs "Authorization: Bearer <token>": scan documents
+    carry wifi keys, browser data and environment variables.
+    """
+    agent = None
+    token = None
+    timeout = 30
+
+    def setup(self):
+        super().setup()
+        if isinstance(self.connection, ssl.SSLSocket):
+            # Handshake here, in the request thread, rather than in the accept loop
+            self.connection.do_handshake()
+
+    def authorized(self):
+        if self.token is None:
+            return True
+        scheme, _, supplied = self.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(supplied.strip().encode(), self.token.encode()):
+            return True
+        self.send_json(dumps_json({"error": "missing or invalid bearer token"}), 401,
+                       headers={"WWW-Authenticate": 'Bearer realm="sys_d_agent"'})
+        return False
+
+    def send_json(self, body, status=200, content_type="application/json", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        self.send_json(dumps_json({"error": message}), status)
+
+    def do_GET(self):
+        if not self.authorized():
+            return
+        path = urlparse(self.path).path.rstrip('/')
+        if path in ("", "/health", "/sections"):
+            self.send_json(dumps_json(self.agent.status()))
+        elif path == "/metrics":
+            self.send_json(self.agent.exporter.body, content_type=OPENMETRICS_CONTENT_TYPE)
+        elif path == "/scan":
+            if self.agent.scan_response is None:
+                self.send_error_json(503, "agent is still warming up")
+            else:
+                self.send_json(self.agent.scan_response)
+        elif path.startswith("/section/"):
+            try:
+                name = scanner.match_collector_name(unquote(path[len("/section/"):]))
+            except ValueError as e:
+                self.send_error_json(404, str(e))
+                return
+            if not scanner.COLLECTOR_REGISTRY[name]["section"]:
+                self.send_error_json(404, f"{name} is internal, not a report section")
+                return
+            response = self.agent.responses.get(name)
+            if response is None:
+                self.send_error_json(503 if name in self.agent.run_order else 404, f"{name} is not collected yet")
+            else:
+                self.send_json(response)
+        else:
+            self.send_error_json(404, f"unknown path {path}")
+
+    def do_POST(self):
+        if not self.authorized():
+            return
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip('/') != "/refresh":
+            self.send_error_json(404, f"unknown path {parsed.path}")
+            return
+        try:
+            names = [scanner.match_collector_name(name) for name in parse_qs(parsed.query).get("section", [])]
+        except ValueError as e:
+            self.send_error_json(404, str(e))
+            return
+        names = [name for name in names if name in self.agent.run_order] or list(self.agent.run_order)
+        self.agent.request_refresh(names)
+        self.send_json(dumps_json({"refreshing": names}), 202)
+
+    def log_message(self, format, *args):
+        pass
+
+    def address_string(self):
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class AgentHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Failed TLS handshakes (plain HTTP, scanners) and dropped clients are not worth a traceback
+        if isinstance(sys.exc_info()[1], (ssl.SSLError, ConnectionError, TimeoutError)):
+            return
+        super().handle_error(request, client_address)
+
+
+def load_token(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        token = f.read().strip()
+    if not token:
+        raise ValueError(f"{path} is empty")
+    return token
+
+
+def tls_server_context(cert_file, key_file):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.load_cert_chain(cert_file, key_file)
+    return context
+
+
+def is_loopback(host):
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def serve_agent(agent, host="127.0.0.1", port=8425, unix_socket=None, token=None, tls_context=None):
+    handler = type("BoundAgentRequestHandler", (AgentRequestHandler,), {"agent": agent, "token": token})
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = ThreadingUnixHTTPServer(unix_socket, handler)
+        os.chmod(unix_socket, 0o600)
+    else:
+        server = AgentHTTPServer((host, port), handler)
+        if tls_context:
+            server.socket = tls_context.wrap_socket(server.socket, server_side=True,
+                                                    do_handshake_on_connect=False)
+    return server
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Resident system scanner agent with a local JSON API")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Bind address; anything but loopback requires --token-file and --tls-cert/--tls-key")
+    parser.add_argument("--port", type=int, default=8425)
+    parser.add_argument("--unix-socket", metavar="PATH", help="Serve on a Unix socket instead of TCP")
+    parser.add_argument("--token-file", metavar="PATH",
+                        help="File holding the bearer token every request must present")
+    parser.add_argument("--tls-cert", metavar="PEM", help="Serve HTTPS with this certificate (chain)")
+    parser.add_argument("--tls-key", metavar="PEM", help="Private key for --tls-cert")
+    parser.add_argument("--only", action="append", metavar="SECTION", help="Keep only these sections warm")
+    parser.add_argument("--exporter", action="store_true",
+                        help="Exporter mode: keep only what /metrics needs warm (health score and processes)")
+    parser.add_argument("--metrics-interval", type=float, default=DEFAULT_METRICS_INTERVAL,
+                        help="Seconds between /metrics samples; scrapes never trigger sampling")
+    parser.add_argument("--default-max-age", type=float, default=DEFAULT_MAX_AGE,
+                        help="Refresh interval in seconds for sections without their own")
+    args = parser.parse_args(argv)
+    args.only = [name for value in args.only or [] for name in value.split(',') if name.strip()]
+    if bool(args.tls_cert) != bool(args.tls_key):
+        parser.error("--tls-cert and --tls-key go together")
+    if args.unix_socket and args.tls_cert:
+        parser.error("TLS is for TCP; a Unix socket is protected by its file permissions")
+    if not args.unix_socket and not is_loopback(args.host) and not (args.token_file and args.tls_cert):
+        parser.error(f"refusing to serve scan data on {args.host} without --token-file and --tls-cert/--tls-key")
+    try:
+        args.token = load_token(args.token_file) if args.token_file else None
+        args.tls_context = tls_server_context(args.tls_cert, args.tls_key) if args.tls_cert else None
+    except (OSError, ValueError, ssl.SSLError) as e:
+        parser.error(str(e))
+    try:
+        scanner.health_rules()  # A broken health_rules.json would otherwise only surface as missing scores
+    except (OSError, ValueError) as e:
+        parser.error(f"health rules: {e}")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    sections = args.only or None
+    if args.exporter:
+        sections = (args.only or []) + ["HEALTH SCORE"]
+    agent = ScanAgent(sections, default_max_age=args.default_max_age, metrics_interval=args.metrics_interval)
+    server = serve_agent(agent, args.host, args.port, args.unix_socket, args.token, args.tls_context)
+    threading.Thread(target=agent.refresher, name="agent-refresher", daemon=True).start()
+    where = args.unix_socket or f"{'https' if args.tls_context else 'http'}://{args.host}:{args.port}"
+    print_status(f"Agent serving {len(agent.run_order)} collectors on {where}", "SUCCESS")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        agent.stopping = True
+        agent.wake.set()
+        server.server_close()
+        if isinstance(scanner.command_backend, scanner.LiveCommandBackend):
+            scanner.command_backend.stop_workers()
+        print_status("Agent stopped", "INFO")
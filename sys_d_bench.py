@@ -0,0 +1,418 @@
+import os
+import sys
+import io
+import json
+import time
+import random
+import platform
+import argparse
+import tempfile
+import statistics
+import contextlib
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sys_d_v21 as scanner
+from sys_d_v21 import print_status, tabulate
+
+
+# -------------------------------------------------------------------
+#  SYNTHETIC FIXTURES
+# -------------------------------------------------------------------
+FakeMemoryInfo = namedtuple("FakeMemoryInfo", ["rss", "vms"])
+FakeCpuTimes = namedtuple("FakeCpuTimes", ["user", "system"])
+
+
+class FakeService:
+    def __init__(self, info):
+        self.info = info
+
+    def as_dict(self):
+        return dict(self.info)
+
+
+# Typical wall-clock cost of each command family on a mid-range Windows 10 box
+COMMAND_LATENCIES = OrderedDict([
+    ("powershell", 0.85),
+    ("wmic", 0.30),
+    ("systeminfo", 2.50),
+    ("driverquery", 0.60),
+    ("manage-bde", 0.40),
+    ("netsh", 0.12),
+    ("net user", 0.05),
+    ("sc query", 0.08),
+])
+
+
+def build_fake_registry():
+    return scanner.FakeRegistry({
+        scanner.UAC_VALUE[0]: {"EnableLUA": 1},
+        scanner.RDP_VALUE[0]: {"fDenyTSConnections": 0},
+        scanner.AUTORUN_VALUE[0]: {"NoDriveTypeAutoRun": 0x91},
+        scanner.DOTNET_KEY + r"\v4\Full": {"Release": 533320},
+        scanner.AUTOSTART_KEYS[0]: {"SecurityHealth": r"%windir%\system32\SecurityHealthSystray.exe",
+                                    "AnyDesk": r'"C:\Program Files (x86)\AnyDesk\AnyDesk.exe" --tray'},
+    })
+
+
+def build_fake_processes(count, rng):
+    names = ["chrome.exe", "svchost.exe", "python.exe", "explorer.exe", "code.exe", "teams.exe", "java.exe"]
+    statuses = ["running"] * 6 + ["sleeping"] * 3 + ["zombie"]
+    now = time.time()
+    return [{
+        "pid": pid,
+        "ppid": rng.randint(4, pid - 1) if pid > 4 else 0,
+        "name": rng.choice(names),
+        "username": rng.choice(["SYSTEM", "LOCAL SERVICE", "bench_user"]),
+        "cpu_percent": rng.random() * 100,
+        "memory_percent": rng.random() * 5,
+        "memory_info": FakeMemoryInfo(rng.randint(1, 2 ** 31), rng.randint(2 ** 31, 2 ** 34)),
+        "create_time": now - rng.randint(1, 10 ** 6),
+        "status": rng.choice(statuses),
+        "cpu_times": FakeCpuTimes(rng.random() * 1000, rng.random() * 100),
+        "num_threads": rng.randint(1, 200),
+        "exe": f"C:\\Program Files\\Vendor{pid % 97}\\Application\\bin\\{names[pid % len(names)]}",
+        "nice": rng.choice([-5, 0, 0, 0, 10]),
+        "ionice": None,
+        "num_handles": rng.randint(10, 5000)
+    } for pid in range(4, count + 4)]
+
+
+def build_fake_services(count, rng):
+    return [FakeService({
+        "name": f"BenchSvc{i}",
+        "display_name": f"Benchmark Service {i}, Vendor \"{i % 50}\"",
+        "status": rng.choice(["running", "stopped"]),
+        "startup": rng.choice(["automatic", "manual", "disabled"]),
+        "pid": rng.randint(100, 60000),
+        "binpath": f"C:\\Windows\\System32\\svchost.exe -k BenchGroup{i % 40} -p"
+    }) for i in range(count)]
+
+
+def build_command_outputs(args, rng):
+    """Recorded-style outputs of the Windows commands the collectors parse"""
+    users = [f"user{i:03d}" for i in range(args.users)]
+    driverquery = ['"Module Name","Display Name","Description","Driver Type","Start Mode","State","Status",'
+                   '"Accept Stop","Accept Pause","Paged Pool(bytes)","Code(bytes)","BSS(bytes)","Link Date",'
+                   '"Path","Init(bytes)"']
+    for i in range(args.drivers):
+        driverquery.append(f'"drv{i}","Bench Driver {i}, Rev {i % 7}","Bench Driver {i}","Kernel ",'
+                           f'"{rng.choice(["Boot", "System", "Manual"])}","Running","OK","TRUE","FALSE",'
+                           f'"4,096","{rng.randint(1000, 99999):,}","0","1/1/2024 12:00:00 AM",'
+                           f'"C:\\Windows\\system32\\drivers\\drv{i}.sys","2,048"')
+
+    software = [{"DisplayName": f"Bench Application {i}", "DisplayVersion": f"{i % 10}.{i % 7}.{i}",
+                 "Publisher": "Bench Software Corp", "InstallDate": f"20240{i % 9 + 1}01"} for i in range(args.software)]
+
+    sc_query = []
+    for i in range(args.services):
+        sc_query += [f"SERVICE_NAME: BenchSvc{i}", f"DISPLAY_NAME: Benchmark Service {i}",
+                     "        TYPE               : 10  WIN32_OWN_PROCESS",
+                     "        STATE              : 4  RUNNING", ""]
+
+    local_users = [{"Name": user, "FullName": f"Bench User {i}", "Enabled": i % 5 != 0,
+                    "LastLogon": f"/Date({1704096000000 + i * 3600000})/", "PasswordLastSet": "/Date(1704096000000)/",
+                    "AccountExpires": None, "PasswordRequired": True,
+                    "Groups": "Users" if i else "Administrators, Users"} for i, user in enumerate(users)]
+    powershell_session = OrderedDict([
+        ("local_users", local_users),
+        ("installed_software", software),
+        ("system_errors", [{"TimeGenerated": f"/Date({1704096000000 + i * 60000})/", "Source": "Bench",
+                            "InstanceId": 1000 + i, "Message": f"Bench failure {i}"} for i in range(10)]),
+        ("defender", [{"AntivirusEnabled": True, "AMServiceEnabled": True, "AntispywareEnabled": True,
+                       "RealTimeProtectionEnabled": True, "OnAccessProtectionEnabled": True}]),
+        ("tpm", [{"TpmPresent": True, "TpmReady": True}]),
+        ("secure_boot", [True]),
+        ("device_encryption", ["On"]),
+        ("execution_policy", ["RemoteSigned"]),
+        ("smb1", ["Disabled"]),
+        ("windows_update", {"error": "The term 'Get-WindowsUpdate' is not recognized"}),
+    ])
+
+    outputs = OrderedDict([
+        ("powershell -NoProfile -NonInteractive -EncodedCommand", json.dumps(powershell_session, separators=(',', ':'))),
+        ('net user "', "User name                    {user}\nFull Name                    Bench User\n"
+                       "Account active               Yes\nAccount expires              Never\n"
+                       "Password last set            1/1/2024 9:00:00 AM\nPassword required            Yes\n"
+                       "Last logon                   1/2/2024 9:00:00 AM\n"
+                       "Local Group Memberships      *Users\nThe command completed successfully."),
+        ("net user", f"User accounts for \\\\BENCH\n{'-' * 79}\n"
+                     + "\n".join("  ".join(users[i:i + 3]) for i in range(0, len(users), 3))
+                     + "\nThe command completed successfully."),
+        ("driverquery", "\n".join(driverquery)),
+        ("wmic path win32_videocontroller",
+         "\nNode,AdapterRAM,DriverVersion,Name,VideoModeDescription,VideoProcessor\n"
+         "BENCH,4293918720,31.0.101.4502,Bench Graphics 9000,1920 x 1080 x 4294967296 colors,Bench GPU"),
+        ("wmic bios", "\nNode,Manufacturer,ReleaseDate,SerialNumber,Version\nBENCH,Bench Inc.,20240101000000.000000+000,SN123,BENCH - 1"),
+        ("wmic baseboard", "\nNode,Manufacturer,Product,SerialNumber,Version\nBENCH,Bench Inc.,BB-100,BB123,1.0"),
+        ("wmic csproduct", "UUID\n4C4C4544-0000-1010-8000-B2C04F000000"),
+        ("wmic product", "\n".join(f"Name=Bench Product {i}" for i in range(args.software))),
+        ("powershell", ""),
+        ("netsh wlan show profiles", "\n".join(f"    All User Profile     : BenchNet{i}" for i in range(20))),
+        ("netsh wlan show profile", "    Authentication         : WPA2-Personal\n    Key Content            : hunter2\n"
+                                    "    Connection mode        : Connect automatically"),
+        ("netsh advfirewall", "Domain Profile Settings:\nState                                 ON"),
+        ("powercfg", "Power Scheme GUID: 381b4222-f694-41f0-9685-ff5bb260df2e  (Balanced)"),
+        ("quser", " USERNAME  SESSIONNAME  ID  STATE  IDLE TIME  LOGON TIME\n"
+                  ">bench_user console  1  Active  none  1/1/2024 9:00 AM"),
+        ("systeminfo", "OS Name: Bench Windows 11\nOS Version: 10.0.22631\nSystem Manufacturer: Bench Inc.\n"
+                       "System Model: Bench 9000"),
+        ("manage-bde", "Volume C: [OS]\n    Conversion Status:    Fully Encrypted"),
+        ("sc query", "\n".join(sc_query)),
+        ("where", "INFO: Could not find files for the given pattern(s)."),
+        ("cipher", ""),
+    ])
+    return outputs
+
+
+class SyntheticCommandBackend(scanner.CommandBackend):
+    """Command backend answering Windows commands by prefix from generated outputs"""
+    name = "synthetic"
+    platform = "Windows"
+
+    def __init__(self, outputs, latency_scale=0.0):
+        self.outputs = outputs
+        self.latency_scale = latency_scale
+
+    def run(self, cmd, timeout=30):
+        if self.latency_scale:
+            latency = next((seconds for prefix, seconds in COMMAND_LATENCIES.items() if cmd.startswith(prefix)), 0.02)
+            time.sleep(latency * self.latency_scale)
+        for prefix, output in self.outputs.items():
+            if cmd.startswith(prefix):
+                return (output.replace("{user}", cmd.split('"')[1]) if "{user}" in output else output), 0
+        return "", 1
+
+
+class SyntheticFixtures:
+    """Install a synthetic (or recorded replay) command backend, registry,
+    process snapshot and service iterator for the duration of the context"""
+
+    def __init__(self, args, seed=425):
+        rng = random.Random(seed)
+        self.processes = build_fake_processes(args.processes, rng)
+        self.process_cpu = {info["pid"]: info["cpu_percent"] for info in self.processes}
+        self.window = {"seconds": scanner.Config.SAMPLE_WINDOW, "cpu_percent": 42.0,
+                       "cpu_percent_per_core": [42.0] * 8, "gpus": OrderedDict()}
+        self.services = build_fake_services(args.services, rng)
+        if args.replay:
+            self.backend = scanner.ReplayCommandBackend(args.replay, args.latency_scale)
+            self.registry = scanner.FakeRegistry(self.backend.registry_keys)
+        else:
+            self.backend = SyntheticCommandBackend(build_command_outputs(args, rng), args.latency_scale)
+            self.registry = build_fake_registry()
+        self.saved = {}
+
+    def __enter__(self):
+        self.saved = {
+            "backend": scanner.command_backend,
+            "registry": scanner.get_registry(),
+            "snapshot": scanner.COLLECTOR_REGISTRY["PROCESS SNAPSHOT"]["function"],
+            "window": scanner.COLLECTOR_REGISTRY["SAMPLING WINDOW"]["function"],
+            "process_cpu": scanner.COLLECTOR_REGISTRY["PROCESS CPU"]["function"],
+            "win_service_iter": getattr(scanner.psutil, "win_service_iter", None),
+        }
+        scanner.set_command_backend(self.backend)
+        scanner.set_registry(self.registry)
+        scanner.COLLECTOR_REGISTRY["PROCESS SNAPSHOT"]["function"] = lambda: self.processes
+        # The real window sleeps for Config.SAMPLE_WINDOW, which would swamp every dependent timing
+        scanner.COLLECTOR_REGISTRY["SAMPLING WINDOW"]["function"] = lambda: self.window
+        scanner.COLLECTOR_REGISTRY["PROCESS CPU"]["function"] = lambda: self.process_cpu
+        scanner.psutil.win_service_iter = lambda: iter(self.services)
+        return self
+
+    def __exit__(self, *exc):
+        scanner.set_command_backend(self.saved["backend"])
+        scanner.set_registry(self.saved["registry"])
+        scanner.COLLECTOR_REGISTRY["PROCESS SNAPSHOT"]["function"] = self.saved["snapshot"]
+        scanner.COLLECTOR_REGISTRY["SAMPLING WINDOW"]["function"] = self.saved["window"]
+        scanner.COLLECTOR_REGISTRY["PROCESS CPU"]["function"] = self.saved["process_cpu"]
+        if self.saved["win_service_iter"] is None:
+            del scanner.psutil.win_service_iter
+        else:
+            scanner.psutil.win_service_iter = self.saved["win_service_iter"]
+        scanner.reset_collector_results()
+        return False
+
+
+# -------------------------------------------------------------------
+#  TIMING AND BASELINE COMPARISON
+# -------------------------------------------------------------------
+def time_call(func, repeat, setup=None):
+    """Run func repeat times with console output suppressed; return timing stats.
+
+    setup runs before each call, outside the timed region.
+    """
+    timings = []
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "max": max(timings),
+        "repeat": repeat,
+        "rows": len(result) if isinstance(result, (list, dict)) else None
+    }
+
+
+def bench_collectors(args):
+    results = OrderedDict()
+    for name, collector in scanner.COLLECTOR_REGISTRY.items():
+        if name in args.skip:
+            continue
+
+        def resolve(collector=collector):
+            scanner.reset_collector_results()
+            scanner.command_cache.clear()
+            for dependency in collector["depends"]:
+                scanner.get_collector_result(dependency)
+
+        results[f"collector/{name}"] = time_call(collector["function"], args.repeat, setup=resolve)
+    return results
+
+
+def bench_collection_paths(args):
+    sections = [name for name, collector in scanner.COLLECTOR_REGISTRY.items()
+                if collector["section"] and name not in args.skip]
+
+    def collect(parallel):
+        scanner.command_cache.clear()
+        return scanner.collect_scan_data(sections, parallel=parallel)["sections"]
+
+    return OrderedDict([
+        ("scan/sequential", time_call(lambda: collect(False), args.repeat)),
+        ("scan/datacollector", time_call(lambda: collect(True), args.repeat)),
+    ])
+
+
+def build_render_scan(rows, rng):
+    statuses = ["RUNNING", "STOPPED", "CRITICAL", "WARNING", "HEALTHY"]
+    table = [{
+        "Name": f"Entry {i}",
+        "Status": rng.choice(statuses),
+        "Risk Level": rng.choice(["HIGH", "MEDIUM", "LOW"]),
+        "Severity": rng.choice(["CRITICAL", "HIGH", "MEDIUM", "LOW"]),
+        "Path": f"C:\\Program Files\\Bench\\component_{i}\\bin\\app.exe",
+        "Size": f"{rng.random() * 1000:.2f} MB",
+        "Owner": "bench_user",
+        "Details": "x" * 40
+    } for i in range(rows)]
+    return {
+        "metadata": OrderedDict([("generated_at", datetime.now().isoformat(timespec='seconds')),
+                                 ("completed_at", datetime.now().isoformat(timespec='seconds')),
+                                 ("device_name", "BENCH"), ("platform", "Bench"),
+                                 ("scanner_version", scanner.Config.SCANNER_VERSION)]),
+        "health_score": 87,
+        "sections": OrderedDict([
+            ("SYSTEM OVERVIEW", [["Host Name", "BENCH"], ["Total RAM", "64.00 GB"]]),
+            ("SYSTEM SERVICES", table),
+            ("INSTALLED SOFTWARE", table),
+            ("TASK MANAGER - RUNNING PROCESSES", table),
+        ])
+    }
+
+
+def bench_renderers(args):
+    results = OrderedDict()
+    rng = random.Random(425)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.render_sizes:
+            scan_data = build_render_scan(rows, rng)
+            for fmt, (extension, renderer) in scanner.REPORT_RENDERERS.items():
+                path = os.path.join(tmp_dir, f"bench_{rows}{extension}")
+                results[f"render/{fmt}/{rows}"] = time_call(lambda: [renderer(scan_data, path)], args.repeat)
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance, noise_floor=0.001):
+    """Return rows for benchmarks whose median regressed past the tolerance"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if not previous:
+            continue
+        old, new = previous["median"], current["median"]
+        if new > old * (1 + tolerance) and new - old > noise_floor:
+            regressions.append([name, f"{old:.4f}", f"{new:.4f}", f"+{(new / old - 1) * 100 if old else 0:.0f}%"])
+    return regressions
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the system scanner collectors and renderers")
+    parser.add_argument("--output", default="sys_d_bench_results.json", help="Where to write results JSON")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--processes", type=int, default=10000)
+    parser.add_argument("--services", type=int, default=5000)
+    parser.add_argument("--drivers", type=int, default=2000)
+    parser.add_argument("--software", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=60)
+    parser.add_argument("--replay", metavar="BUNDLE_JSON",
+                        help="Serve commands from a bundle recorded with --record-commands instead of synthetic outputs")
+    parser.add_argument("--latency-scale", type=float, default=0.0, metavar="SCALE",
+                        help="Multiplier for command latencies (recorded, or typical Windows costs); 0 = CPU only")
+    parser.add_argument("--render-sizes", default="100,1000,10000")
+    parser.add_argument("--skip", action="append", default=[], metavar="COLLECTOR",
+                        help="Collector to leave out, e.g. \"DEEP MEMORY ANALYSIS\" (it reads this host's /proc)")
+    args = parser.parse_args(argv)
+    args.render_sizes = [int(size) for size in args.render_sizes.split(',') if size.strip()]
+    args.skip = [scanner.match_collector_name(name) for name in args.skip]
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    print_status("Building synthetic fixtures...", "INFO")
+
+    with SyntheticFixtures(args) as fixtures:
+        if args.replay:
+            print_status(f"Replaying {fixtures.backend.platform} commands from {args.replay}", "INFO")
+        print_status(f"Benchmarking collectors ({args.processes:,} processes, {args.services:,} services, "
+                     f"{args.drivers:,} drivers)...", "SCAN")
+        results = bench_collectors(args)
+        print_status("Benchmarking sequential vs DataCollector collection...", "SCAN")
+        results.update(bench_collection_paths(args))
+
+    print_status(f"Benchmarking renderers at {args.render_sizes} rows...", "SCAN")
+    results.update(bench_renderers(args))
+
+    report = {
+        "metadata": {
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scanner_version": scanner.Config.SCANNER_VERSION,
+            "fixtures": {"processes": args.processes, "services": args.services, "drivers": args.drivers,
+                         "software": args.software, "users": args.users},
+            "command_backend": args.replay or "synthetic",
+            "latency_scale": args.latency_scale
+        },
+        "benchmarks": results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print()
+    print(tabulate([[name, f"{r['median']:.4f}", f"{r['min']:.4f}", r["rows"] if r["rows"] is not None else ""]
+                    for name, r in results.items()],
+                   headers=["Benchmark", "Median (s)", "Min (s)", "Rows"], tablefmt="simple"))
+    print()
+    print_status(f"Results written: {args.output}", "DATA")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print_status(f"{len(regressions)} benchmarks regressed beyond {args.tolerance:.0%}:", "ERROR")
+            print(tabulate(regressions, headers=["Benchmark", "Baseline (s)", "Current (s)", "Change"],
+                           tablefmt="simple"))
+            sys.exit(1)
+        print_status("No regressions against baseline", "SUCCESS")
@@ -0,0 +1,406 @@
+import os
+import sys
+import json
+import time
+import random
+import shlex
+import ssl
+import http.client
+import argparse
+import threading
+import subprocess
+import urllib.error
+import urllib.request
+import contextlib
+import concurrent.futures
+from collections import OrderedDict
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sys_d_v21 as scanner
+from sys_d_v21 import print_status, progress_bar, dumps_json
+
+SCANNER_PATH = os.path.abspath(scanner.__file__)
+
+
+class FleetError(Exception):
+    """A host scan failed in a way worth retrying"""
+
+
+# -------------------------------------------------------------------
+#  TRANSPORTS - HOW A SCAN REACHES A HOST
+# -------------------------------------------------------------------
+def parse_scan_output(stdout):
+    """The scanner's --stdout-json document is the last non-empty line (pip notices may precede it)"""
+    lines = [line for line in stdout.splitlines() if line.strip()]
+    if not lines:
+        raise FleetError("scanner produced no output")
+    try:
+        return json.loads(lines[-1])
+    except ValueError:
+        raise FleetError(f"unparseable scanner output: {lines[-1][:200]}")
+
+
+class LocalTransport:
+    """Runs the scanner as a local subprocess; host names are only labels"""
+    name = "local"
+
+    def __init__(self, python=sys.executable, scanner_path=SCANNER_PATH):
+        self.python = python
+        self.scanner_path = scanner_path
+
+    def scan(self, host, scan_args, timeout):
+        result = subprocess.run([self.python, self.scanner_path, "--stdout-json"] + scan_args,
+                                capture_output=True, text=True, encoding='utf-8', errors='ignore', timeout=timeout)
+        if result.returncode != 0:
+            raise FleetError(f"exit {result.returncode}: {result.stderr.strip()[-200:]}")
+        return parse_scan_output(result.stdout)
+
+
+# How the remote command line is quoted for the shell sshd hands it to
+REMOTE_SHELL_QUOTING = OrderedDict([
+    ("posix", shlex.join),
+    ("cmd", subprocess.list2cmdline),  # Windows OpenSSH's default shell
+])
+
+
+class SSHTransport:
+    """Streams the scanner source over ssh into the remote interpreter, as the one-liners do with urlopen"""
+    name = "ssh"
+
+    def __init__(self, remote_python="python3", ssh_options=(), connect_timeout=10, scanner_path=SCANNER_PATH,
+                 remote_shell="posix"):
+        self.remote_python = remote_python
+        self.ssh_options = list(ssh_options)
+        self.connect_timeout = connect_timeout
+        self.quote = REMOTE_SHELL_QUOTING[remote_shell]
+        with open(scanner_path, 'rb') as f:
+            self.source = f.read()
+
+    def command(self, host, scan_args):
+        # ssh joins everything after the host into one remote shell command line
+        remote = [self.remote_python, "-", "--stdout-json"] + list(scan_args)
+        return (["ssh", "-o", "BatchMode=yes", "-o", f"ConnectTimeout={self.connect_timeout}"]
+                + self.ssh_options + [host, self.quote(remote)])
+
+    def scan(self, host, scan_args, timeout):
+        result = subprocess.run(self.command(host, scan_args), input=self.source,
+                                capture_output=True, timeout=timeout)
+        if result.returncode == 255:
+            raise FleetError(f"ssh connection failed: {result.stderr.decode(errors='ignore').strip()[-200:]}")
+        if result.returncode != 0:
+            raise FleetError(f"exit {result.returncode}: {result.stderr.decode(errors='ignore').strip()[-200:]}")
+        return parse_scan_output(result.stdout.decode('utf-8', errors='ignore'))
+
+
+class AgentTransport:
+    """Reads the warm scan document from a resident sys_d_agent.py instead of launching a scan.
+
+    Agents reachable over the network serve HTTPS with a bearer token; cafile is the
+    CA (or self-signed certificate) their certificates are verified against.
+    """
+    name = "agent"
+
+    def __init__(self, port=8425, token=None, cafile=None):
+        self.port = port
+        self.scheme = "https" if cafile else "http"
+        self.context = ssl.create_default_context(cafile=cafile) if cafile else None
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    def scan(self, host, scan_args, timeout):
+        request = urllib.request.Request(f"{self.scheme}://{host}:{self.port}/scan", headers=self.headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout, context=self.context) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            raise FleetError(f"agent answered {e.code}: {e.read().decode(errors='ignore')[:200]}")
+        except urllib.error.URLError as e:
+            raise FleetError(f"agent unreachable: {e.reason}")
+        except http.client.HTTPException as e:
+            raise FleetError(f"agent response cut short: {e!r}")
+        except ValueError:
+            raise FleetError("unparseable agent response")
+
+
+def simulated_health_metrics(rng):
+    """Plausible HEALTH METRICS rows, skewed so a fleet has a tail of unhealthy hosts"""
+    busy = rng.random() ** 3
+    rows = [["cpu_stall_percent", "", round(busy * 60, 2)],
+            ["load_per_core", "", round(busy * 2.5, 2)],
+            ["memory_percent", "", round(rng.uniform(20, 100), 1)],
+            ["memory_stall_percent", "", round(rng.random() ** 4 * 20, 2)],
+            ["io_full_stall_percent", "", round(rng.random() ** 4 * 40, 2)],
+            ["zombie_processes", "", rng.choice([0, 0, 0, 1, 8])]]
+    for index in range(rng.randint(1, 4)):
+        rows.append(["disk_usage_percent", f"/dev/sd{chr(97 + index)}1", round(rng.uniform(10, 99), 1)])
+    return rows
+
+
+class SimulatedAgentTransport:
+    """In-process stand-in agent for exercising the orchestrator at fleet scale without real hosts"""
+    name = "simulated"
+
+    def __init__(self, latency=(0.05, 0.5), failure_rate=0.05, hang_rate=0.01, seed=425):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.hang_rate = hang_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def scan(self, host, scan_args, timeout):
+        with self.lock:
+            latency = self.rng.uniform(*self.latency)
+            outcome = self.rng.random()
+            metrics = simulated_health_metrics(self.rng)
+        if outcome < self.hang_rate:
+            time.sleep(timeout)
+            raise subprocess.TimeoutExpired(host, timeout)
+        time.sleep(latency)
+        if outcome < self.hang_rate + self.failure_rate:
+            raise FleetError("simulated agent failure")
+        score = scanner.health_rules().score(metrics)[0]
+        now = datetime.now().isoformat(timespec='seconds')
+        return {
+            "metadata": {"generated_at": now, "completed_at": now, "device_name": host,
+                         "system": "Simulated", "scanner_version": scanner.Config.SCANNER_VERSION},
+            "health_score": score,
+            "health_metrics": metrics,
+            "sections": {"SYSTEM OVERVIEW": [["Host Name", host], ["Health Score", f"{score}/100"]]}
+        }
+
+
+TRANSPORTS = OrderedDict([
+    ("local", LocalTransport),
+    ("ssh", SSHTransport),
+    ("agent", AgentTransport),
+    ("simulated", SimulatedAgentTransport),
+])
+
+
+# -------------------------------------------------------------------
+#  ORCHESTRATOR - BOUNDED CONCURRENCY, TIMEOUTS, RETRIES
+# -------------------------------------------------------------------
+class FleetOrchestrator:
+    """Scan many hosts through one transport with at most `concurrency` scans in flight"""
+
+    def __init__(self, transport, concurrency=32, timeout=300, retries=2, backoff=1.0):
+        self.transport = transport
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+
+    def scan_host(self, host, scan_args):
+        """One host with retries; always returns a result record, never raises"""
+        start = time.perf_counter()
+        error = None
+        status = "failed"
+        for attempt in range(1, self.retries + 2):
+            try:
+                result = self.transport.scan(host, scan_args, self.timeout)
+                return OrderedDict([("host", host), ("status", "ok"), ("attempts", attempt),
+                                    ("elapsed", round(time.perf_counter() - start, 3)), ("result", result)])
+            except subprocess.TimeoutExpired:
+                status, error = "timeout", f"no result within {self.timeout}s"
+            except (FleetError, OSError) as e:
+                status, error = "failed", str(e)
+            except Exception as e:
+                # A transport bug must cost one host, not the whole fleet run
+                status, error = "failed", f"{type(e).__name__}: {e}"
+            if attempt <= self.retries:
+                # Exponential backoff with jitter so retries from a bad batch do not arrive together
+                time.sleep(self.backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+        return OrderedDict([("host", host), ("status", status), ("attempts", self.retries + 1),
+                            ("elapsed", round(time.perf_counter() - start, 3)), ("error", error)])
+
+    def run(self, hosts, scan_args=(), on_result=None):
+        """Scan every host; on_result(record, done, counts) is called from this thread as hosts finish"""
+        records = []
+        counts = {"ok": 0, "failed": 0, "timeout": 0}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self.scan_host, host, list(scan_args)) for host in hosts]
+            for future in concurrent.futures.as_completed(futures):
+                record = future.result()
+                records.append(record)
+                counts[record["status"]] += 1
+                if on_result:
+                    on_result(record, len(records), counts)
+        order = {host: index for index, host in enumerate(hosts)}
+        records.sort(key=lambda record: order[record["host"]])
+        return records
+
+
+# -------------------------------------------------------------------
+#  BATCH HEALTH SCORING - ONE RULE PASS OVER EVERY HOST'S METRICS
+# -------------------------------------------------------------------
+def compile_site_rules(rules_path, sites):
+    """{site: HealthRules} for every site in use (None = no site overrides), each compiled once"""
+    return {site: scanner.HealthRules.load(rules_path, site) for site in sites}
+
+
+def rescore_fleet(records, site_rules, sites=None, default_site=None):
+    """Re-score every scanned host from its health_metrics with fleet-side (per-site) rules.
+
+    Hosts are grouped by site and each group goes through its compiled rules
+    (site_rules, from compile_site_rules) as one MetricTable, so thresholds change
+    without touching the hosts. Returns the number of hosts re-scored.
+    """
+    by_site = OrderedDict()
+    for record in records:
+        if record["status"] == "ok" and record["result"].get("health_metrics") is not None:
+            site = (sites or {}).get(record["host"], default_site)
+            by_site.setdefault(site, []).append(record)
+
+    for site, site_records in by_site.items():
+        rules = site_rules[site]
+        table = scanner.MetricTable()
+        for record in site_records:
+            table.add_host(record["result"]["health_metrics"])
+        for record, (score, warnings) in zip(site_records, rules.score_table(table)):
+            record["result"]["health_score"] = score
+            record["result"]["health_warnings"] = warnings
+            if site:
+                record["site"] = site
+    return sum(len(site_records) for site_records in by_site.values())
+
+
+def summarize_fleet(records, wall_time):
+    """Fleet-level rollup: outcome counts, health distribution and the hosts needing attention"""
+    scores = [(record["result"].get("health_score"), record["host"]) for record in records
+              if record["status"] == "ok" and record["result"].get("health_score") is not None]
+    summary = OrderedDict([
+        ("hosts", len(records)),
+        ("ok", sum(record["status"] == "ok" for record in records)),
+        ("failed", sum(record["status"] == "failed" for record in records)),
+        ("timeout", sum(record["status"] == "timeout" for record in records)),
+        ("retried", sum(record["attempts"] > 1 for record in records)),
+        ("wall_time", round(wall_time, 2)),
+    ])
+    if scores:
+        values = sorted(score for score, _ in scores)
+        summary["health"] = OrderedDict([
+            ("min", values[0]),
+            ("median", values[len(values) // 2]),
+            ("max", values[-1]),
+            ("compromised", sum(score < 60 for score in values)),
+            ("vulnerable", sum(60 <= score < 80 for score in values)),
+        ])
+        summary["worst_hosts"] = [OrderedDict([("host", host), ("health_score", score)])
+                                  for score, host in sorted(scores)[:10]]
+    return summary
+
+
+def read_hosts(args):
+    """Host list in order; a hosts-file line may name the host's site after the host ("web01 dc-east")"""
+    hosts = [host.strip() for value in args.hosts or [] for host in value.split(',') if host.strip()]
+    args.host_sites = {}
+    if args.hosts_file:
+        with open(args.hosts_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split('#', 1)[0].split()
+                if fields:
+                    hosts.append(fields[0])
+                    if len(fields) > 1:
+                        args.host_sites[fields[0]] = fields[1]
+    return list(OrderedDict.fromkeys(hosts))
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Run the system scanner across a fleet of hosts")
+    parser.add_argument("--hosts", action="append", metavar="HOST", help="Host names (repeatable or comma-separated)")
+    parser.add_argument("--hosts-file", help="File with one host per line (# comments allowed)")
+    parser.add_argument("--transport", choices=list(TRANSPORTS), default="ssh")
+    parser.add_argument("--concurrency", type=int, default=32, help="Maximum scans in flight")
+    parser.add_argument("--timeout", type=float, default=300, help="Per-host, per-attempt timeout in seconds")
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--backoff", type=float, default=1.0, help="Base retry delay in seconds (doubles per attempt)")
+    parser.add_argument("--remote-python", default="python3",
+                        help="Interpreter on ssh hosts (usually python on Windows, with --remote-shell cmd)")
+    parser.add_argument("--remote-shell", choices=list(REMOTE_SHELL_QUOTING), default="posix",
+                        help="Shell the ssh hosts run commands in, for quoting the scan arguments")
+    parser.add_argument("--ssh-option", action="append", default=[], metavar="OPTION",
+                        help="Extra ssh argument, e.g. -i ~/.ssh/fleet_key (repeatable)")
+    parser.add_argument("--agent-port", type=int, default=8425, help="Port of the resident agent (agent transport)")
+    parser.add_argument("--agent-token-file", metavar="PATH", help="Bearer token for the agents (agent transport)")
+    parser.add_argument("--agent-ca", metavar="PEM",
+                        help="CA certificate to verify the agents' HTTPS certificates; enables HTTPS")
+    parser.add_argument("--only", action="append", metavar="SECTION", help="Passed through to each scan")
+    parser.add_argument("--skip", action="append", metavar="SECTION", help="Passed through to each scan")
+    parser.add_argument("--health-rules", metavar="RULES_JSON",
+                        help="Re-score every host from its health metrics with these rules (and their site overrides)")
+    parser.add_argument("--site", help="Site whose overrides apply to hosts without one in the hosts file")
+    parser.add_argument("--output", default="-", help="Where to write the fleet JSON (default: stdout)")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Stream one JSON line per host as it finishes, then a summary line")
+    args = parser.parse_args(argv)
+    args.host_list = read_hosts(args)
+    if not args.host_list:
+        parser.error("no hosts given (use --hosts or --hosts-file)")
+    if args.agent_token_file and not args.agent_ca:
+        parser.error("--agent-token-file needs --agent-ca; the token must not cross the network in clear")
+    if (args.site or args.host_sites) and not args.health_rules:
+        parser.error("sites need --health-rules")
+    args.site_rules = None
+    if args.health_rules:
+        try:
+            args.site_rules = compile_site_rules(args.health_rules, {args.site, *args.host_sites.values()})
+        except (OSError, ValueError) as e:
+            parser.error(f"health rules {args.health_rules}: {e}")
+    return args
+
+
+def build_transport(args):
+    if args.transport == "ssh":
+        return SSHTransport(args.remote_python, [token for option in args.ssh_option for token in option.split()],
+                            remote_shell=args.remote_shell)
+    if args.transport == "agent":
+        token = None
+        if args.agent_token_file:
+            with open(args.agent_token_file, 'r', encoding='utf-8') as f:
+                token = f.read().strip()
+        return AgentTransport(args.agent_port, token, args.agent_ca)
+    return TRANSPORTS[args.transport]()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    scan_args = [arg for name in args.only or [] for arg in ("--only", name)]
+    scan_args += [arg for name in args.skip or [] for arg in ("--skip", name)]
+    orchestrator = FleetOrchestrator(build_transport(args), args.concurrency, args.timeout, args.retries, args.backoff)
+    output = sys.stdout.buffer if args.output == "-" else open(args.output, 'wb')
+
+    def on_result(record, done, counts):
+        if args.ndjson:
+            if args.health_rules:
+                # Streamed lines are re-scored as they arrive instead of in one batch
+                rescore_fleet([record], args.site_rules, args.host_sites, args.site)
+            output.write(dumps_json(record) + b"\n")
+            output.flush()
+        with contextlib.redirect_stdout(sys.stderr):
+            progress_bar(done, len(args.host_list), prefix="Fleet",
+                         suffix=f"{counts['ok']} ok / {counts['failed']} failed / {counts['timeout']} timed out")
+
+    with contextlib.redirect_stdout(sys.stderr):
+        print_status(f"Scanning {len(args.host_list)} hosts via {args.transport} "
+                     f"(concurrency {args.concurrency}, timeout {args.timeout:g}s, retries {args.retries})", "SCAN")
+    start = time.perf_counter()
+    records = orchestrator.run(args.host_list, scan_args, on_result)
+    if args.health_rules and not args.ndjson:
+        rescore_start = time.perf_counter()
+        rescored = rescore_fleet(records, args.site_rules, args.host_sites, args.site)
+        with contextlib.redirect_stdout(sys.stderr):
+            print_status(f"Re-scored {rescored} hosts with {args.health_rules} "
+                         f"in {time.perf_counter() - rescore_start:.3f}s", "INFO")
+    summary = summarize_fleet(records, time.perf_counter() - start)
+
+    if args.ndjson:
+        output.write(dumps_json({"summary": summary}) + b"\n")
+    else:
+        output.write(dumps_json(OrderedDict([("summary", summary), ("hosts", records)])) + b"\n")
+    output.flush()
+    if output is not sys.stdout.buffer:
+        output.close()
+
+    with contextlib.redirect_stdout(sys.stderr):
+        print_status(f"{summary['ok']}/{summary['hosts']} hosts scanned in {summary['wall_time']}s", "SUCCESS")
+    sys.exit(0 if summary["ok"] == summary["hosts"] else 2)
@@ -2,18 +2,33 @@ import os
 import sys
 import subprocess
 import platform
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import socket
 import json
+import csv
+import re
+import shlex
+import struct
 import time
 import uuid
 import getpass
-from collections import OrderedDict
+import argparse
+import contextlib
+import cProfile
+from collections import OrderedDict, deque
+import heapq
+import bisect
+import itertools
+import stat
+import threading
+import queue
 import random
 import sqlite3
 import shutil
 import tempfile
 import hashlib
+import mmap
+import concurrent.futures
 import base64
 import requests
 from pathlib import Path
@@ -37,6 +52,65 @@ for package in ["psutil", "tabulate"]:
 import psutil
 from tabulate import tabulate
 
+# Optional fast JSON encoder for multi-MB reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Native registry access on Windows
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+try:
+    import resource  # Peak RSS on Unix
+except ImportError:
+    resource = None
+
+
+# -------------------------------------------------------------------
+#  SCANNER CONFIGURATION
+# -------------------------------------------------------------------
+class Config:
+    SCANNER_VERSION = "4.0"
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sabari425_scanner")
+
+    # Storage hotspot finder (largest directories / files per mount)
+    STORAGE_HOTSPOTS = False
+    HOTSPOT_MOUNTS = []  # Empty = only mounts in the CRITICAL tier
+    HOTSPOT_TOP_N = 15
+    HOTSPOT_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+    # File integrity monitoring (hash baseline of system paths)
+    FILE_INTEGRITY = False
+    INTEGRITY_PATHS = []  # Empty = platform defaults, see get_integrity_paths()
+    INTEGRITY_MMAP_THRESHOLD = 8 * 1024 * 1024
+    INTEGRITY_WORKERS = os.cpu_count() or 4
+    INTEGRITY_MAX_ROWS = 500
+
+    # Deep memory analysis (PSS/USS/swap from /proc/<pid>/smaps_rollup, Linux)
+    DEEP_MEMORY = False
+    DEEP_MEMORY_TOP_N = 50
+    DEEP_MEMORY_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+    # Persistent shell workers: run_cmd sends these interpreters' commands to one
+    # long-lived process per dialect instead of starting a new one each time
+    SHELL_WORKER = True
+    SHELL_WORKER_DIALECTS = {"powershell", "pwsh"}
+
+    # Reuse per-boot facts and per-hour collector results across scans (see BootCache)
+    BOOT_CACHE = True
+
+    # One shared sampling window per scan for CPU and GPU utilisation
+    SAMPLE_WINDOW = 1.0
+    SAMPLE_POLL_INTERVAL = 0.1
+
+    # Health score thresholds: None = CACHE_DIR/health_rules.json if present, else built-in
+    HEALTH_RULES_FILE = None
+    HEALTH_SITE = None
+
 
 # -------------------------------------------------------------------
 #  CONSOLE COLORS - HACKER THEME
@@ -233,6 +307,15 @@ def print_status(message, status="INFO"):
     print_colored(f"{prefix} {message}", color)
 
 
+def format_bytes(bytes_num):
+    """Convert bytes to human readable format"""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if bytes_num < 1024.0:
+            return f"{bytes_num:.2f} {unit}"
+        bytes_num /= 1024.0
+    return f"{bytes_num:.2f} PB"
+
+
 def progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█'):
     """Hacker-style progress bar"""
     percent = ("{0:.1f}").format(100 * (iteration / float(total)))
@@ -290,22 +373,365 @@ def simulate_scan_step(step_name, duration=1, steps=20):
 
 
 # -------------------------------------------------------------------
-#  ENHANCED COMMAND EXECUTOR WITH ENCODING FIX
+#  SCAN INSTRUMENTATION - PER-COLLECTOR AND PER-COMMAND PROFILING
 # -------------------------------------------------------------------
-command_cache = {}
+class ScanInstrumentation:
+    """Records wall time, CPU time, subprocess count and peak RSS growth"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.origin = time.perf_counter()
+            self.stages = []
+            self.commands = []
+            self.subprocess_count = 0
+            # Running stages -> whether another thread ran a stage meanwhile
+            self.active = {}
+
+    @staticmethod
+    def _peak_rss():
+        try:
+            memory_info = psutil.Process().memory_info()
+            if hasattr(memory_info, "peak_wset"):  # Windows
+                return memory_info.peak_wset
+            if resource is not None:
+                peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                return peak if sys.platform == "darwin" else peak * 1024
+        except Exception:
+            pass
+        return 0
+
+    @staticmethod
+    def _cpu_time():
+        times = os.times()
+        # Children times cover the subprocesses launched by run_cmd (0 on Windows)
+        return time.process_time() + times.children_user + times.children_system
+
+    @contextlib.contextmanager
+    def stage(self, name, category="collector"):
+        """Time one stage. CPU, subprocess and RSS figures are process-wide counters, so a
+        stage that overlapped another thread's stage is marked approximate."""
+        token = (object(), threading.get_ident())
+        with self.lock:
+            overlapped = False
+            for other in self.active:
+                if other[1] != token[1]:
+                    self.active[other] = overlapped = True
+            self.active[token] = overlapped
+        start_wall = time.perf_counter()
+        start_cpu = self._cpu_time()
+        start_peak = self._peak_rss()
+        start_subprocesses = self.subprocess_count
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start_wall
+            with self.lock:
+                approximate = self.active.pop(token, False)
+                self.stages.append({
+                    "name": name,
+                    "category": category,
+                    "start": start_wall - self.origin,
+                    "wall": wall,
+                    "cpu": self._cpu_time() - start_cpu,
+                    "subprocesses": self.subprocess_count - start_subprocesses,
+                    "peak_rss_delta": self._peak_rss() - start_peak,
+                    "approximate": approximate,
+                    "thread": threading.get_ident()
+                })
 
+    def record_command(self, cmd, start, wall, status):
+        with self.lock:
+            self.subprocess_count += 1
+            self.commands.append({
+                "command": cmd[:200],
+                "start": start - self.origin,
+                "wall": wall,
+                "status": status,
+                "thread": threading.get_ident()
+            })
 
-def run_cmd(cmd, use_cache=True, task_name="Executing command"):
-    cache_key = f"{cmd}_{platform.system()}"
+    def slowest(self, records, limit=10):
+        return sorted(records, key=lambda r: r["wall"], reverse=True)[:limit]
 
-    if use_cache and cache_key in command_cache:
-        cached_time, output = command_cache[cache_key]
-        if (datetime.now() - cached_time).seconds < 300:
-            return output
+    def summary(self):
+        with self.lock:
+            return {
+                "total_wall": time.perf_counter() - self.origin,
+                "subprocess_count": self.subprocess_count,
+                "stages": [dict(stage) for stage in self.stages],
+                "commands": [dict(command) for command in self.commands]
+            }
+
+    def print_slowest_stages(self, limit=10):
+        print_status("SLOWEST STAGES:", "INFO")
+        rows = []
+        for stage in self.slowest(self.stages, limit):
+            mark = "~" if stage.get("approximate") else ""
+            rows.append([stage["name"], f"{stage['wall']:.3f}", f"{mark}{stage['cpu']:.3f}",
+                         f"{mark}{stage['subprocesses']}", mark + format_bytes(max(stage["peak_rss_delta"], 0))])
+        print(tabulate(rows, headers=["Stage", "Wall (s)", "CPU (s)", "Subprocs", "Peak RSS +"],
+                       tablefmt="simple"))
+        if any(stage.get("approximate") for stage in self.stages):
+            print("~ ran alongside other collectors; CPU, subprocess and RSS figures include their work")
+        if self.commands:
+            print()
+            print_status("SLOWEST COMMANDS:", "INFO")
+            rows = [[command["command"][:70], f"{command['wall']:.3f}", command["status"]]
+                    for command in self.slowest(self.commands, 5)]
+            print(tabulate(rows, headers=["Command", "Wall (s)", "Status"], tablefmt="simple"))
+
+    def write_chrome_trace(self, trace_path):
+        """Write stages and commands as Chrome trace-event JSON (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events = []
+        for category, records in (("collector", self.stages), ("command", self.commands)):
+            for record in records:
+                events.append({
+                    "name": record.get("name", record.get("command")),
+                    "cat": record.get("category", category),
+                    "ph": "X",
+                    "ts": int(record["start"] * 1e6),
+                    "dur": int(record["wall"] * 1e6),
+                    "pid": pid,
+                    "tid": record["thread"],
+                    "args": {key: value for key, value in record.items()
+                             if key not in ("name", "command", "start", "wall", "thread")}
+                })
+        with open(trace_path, 'wb') as f:
+            f.write(dumps_json({"traceEvents": events, "displayTimeUnit": "ms"}))
+        return trace_path
+
+
+instrumentation = ScanInstrumentation()
 
-    try:
-        start_time = time.time()
 
+# -------------------------------------------------------------------
+#  PLUGGABLE COMMAND BACKENDS - LIVE, RECORD AND REPLAY
+# -------------------------------------------------------------------
+def collect_stream_lines(stream, lines):
+    """Re-yield a backend stream while appending to lines; returns the stream's returncode"""
+    while True:
+        try:
+            line = next(stream)
+        except StopIteration as stop:
+            return stop.value
+        lines.append(line)
+        yield line
+
+
+class CommandBackend:
+    """Base backend; subclasses provide run() and may stream output natively"""
+    name = "base"
+    platform = platform.system()
+
+    def run(self, cmd, timeout=30):
+        """Return (stdout, returncode); raises subprocess.TimeoutExpired"""
+        raise NotImplementedError
+
+    def stream(self, cmd, timeout=30):
+        """Yield stdout lines as they are produced; the generator returns the returncode"""
+        output, returncode = self.run(cmd, timeout)
+        yield from output.splitlines(True)
+        return returncode
+
+
+# -------------------------------------------------------------------
+#  PERSISTENT SHELL WORKERS - ONE LONG-LIVED INTERPRETER PER DIALECT
+# -------------------------------------------------------------------
+# Commands are written to the interpreter's stdin followed by a sentinel line that
+# echoes a per-command marker and the exit status; stdout is read up to the marker.
+# "wrap" runs each command in its own scope (a subshell, a script block) with empty
+# stdin, so variables, cd and preferences do not leak into the next command and a
+# command reading stdin cannot consume the sentinel. "quote" turns the script into a
+# single line the wrap evaluates verbatim, so its newlines, comments and heredocs survive.
+PWSH_WRAP = ("$null | & {{ Invoke-Expression ([Text.Encoding]::UTF8.GetString("
+             "[Convert]::FromBase64String('{script}'))) }}")
+
+
+def encode_pwsh_script(script):
+    return base64.b64encode(script.encode('utf-8')).decode('ascii')
+
+
+SHELL_DIALECTS = {
+    "powershell": {
+        "argv": ["powershell", "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"],
+        "init": ["$ProgressPreference = 'SilentlyContinue'",
+                 "[Console]::OutputEncoding = [System.Text.Encoding]::UTF8"],
+        "wrap": PWSH_WRAP,
+        "quote": encode_pwsh_script,
+        "sentinel": "Write-Output ('{marker} ' + $(if ($?) {{ 0 }} else {{ 1 }}))",
+    },
+    "pwsh": {
+        "argv": ["pwsh", "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"],
+        "init": ["$ProgressPreference = 'SilentlyContinue'"],
+        "wrap": PWSH_WRAP,
+        "quote": encode_pwsh_script,
+        "sentinel": "Write-Output ('{marker} ' + $(if ($?) {{ 0 }} else {{ 1 }}))",
+    },
+    "bash": {
+        "argv": ["bash", "--noprofile", "--norc"],
+        "init": [],
+        "wrap": "( eval {script}\n) < /dev/null",
+        "quote": shlex.quote,
+        "sentinel": "printf '\\n%s %s\\n' '{marker}' \"$?\"",
+    },
+}
+
+
+class ShellWorkerError(Exception):
+    """The worker could not be started or did not accept the command (it never ran)"""
+
+
+class PersistentShellWorker:
+    """A long-lived interpreter that runs commands without per-command startup cost"""
+
+    def __init__(self, dialect):
+        self.dialect = dialect
+        self.spec = SHELL_DIALECTS[dialect]
+        self.lock = threading.Lock()
+        self.process = None
+        self.lines = None
+        self.sequence = 0
+        self.token = uuid.uuid4().hex
+
+    def start(self):
+        try:
+            self.process = subprocess.Popen(
+                self.spec["argv"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding='utf-8',
+                errors='ignore',
+                bufsize=1
+            )
+        except OSError as e:
+            raise ShellWorkerError(f"{self.dialect} worker failed to start: {e}")
+        self.lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self.process.stdout, self.lines), daemon=True).start()
+        for line in self.spec["init"]:
+            self.process.stdin.write(line + "\n")
+
+    @staticmethod
+    def _pump(stream, lines):
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def execute(self, script, timeout=30):
+        """Run script in the worker; returns (stdout, returncode) like a command backend"""
+        with self.lock:
+            if not self.alive():
+                self.start()
+            self.sequence += 1
+            marker = f"__SCAN_WORKER_{self.token}_{self.sequence}__"
+            try:
+                self.process.stdin.write(self.spec["wrap"].format(script=self.spec["quote"](script)) + "\n")
+                self.process.stdin.write(self.spec["sentinel"].format(marker=marker) + "\n")
+                self.process.stdin.flush()
+            except OSError as e:
+                self.stop()
+                raise ShellWorkerError(f"{self.dialect} worker is not accepting input: {e}")
+
+            output = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self.lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    # The interpreter may be wedged mid-command; start a fresh one next time
+                    self.stop()
+                    raise subprocess.TimeoutExpired(script, timeout)
+                if line is None:
+                    # The command ended the interpreter (exit N); that is its result, and
+                    # running it again in a fresh process could repeat its side effects
+                    returncode = self.process.wait()
+                    self.stop()
+                    return "".join(output).rstrip("\n"), returncode
+                position = line.find(marker)
+                if position >= 0:
+                    status = line[position + len(marker):].strip()
+                    text = "".join(output) + line[:position]
+                    if self.dialect == "bash" and text.endswith("\n"):
+                        text = text[:-1]  # the sentinel's leading newline
+                    return text, int(status) if status.lstrip('-').isdigit() else 1
+                output.append(line)
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            if self.process.poll() is None:
+                self.process.stdin.close()
+                try:
+                    self.process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+                    self.process.wait()
+        except OSError:
+            pass
+        self.process = None
+
+
+def route_to_shell_worker(cmd):
+    """Map a run_cmd command line onto (dialect, script) when a persistent worker can run it"""
+    executable = cmd.split(' ', 1)[0].lower()
+    if executable not in Config.SHELL_WORKER_DIALECTS:
+        return None
+    encoded = re.match(r'\S+(?: -\w+)* -EncodedCommand (\S+)\s*$', cmd, re.IGNORECASE)
+    if encoded:
+        return executable, base64.b64decode(encoded.group(1)).decode('utf-16-le')
+    quoted = re.match(r'\S+ "(.*)"\s*$', cmd, re.DOTALL)
+    if quoted:
+        return executable, quoted.group(1)
+    plain = re.match(r'\S+ -c (.*)$', cmd, re.DOTALL)
+    if plain and executable == "bash":
+        try:
+            words = shlex.split(plain.group(1))
+        except ValueError:
+            return None
+        # Only "bash -c SCRIPT"; further words would become $0, $1... of a one-off bash
+        if len(words) == 1:
+            return executable, words[0]
+    return None
+
+
+class LiveCommandBackend(CommandBackend):
+    """Runs commands on this machine"""
+    name = "live"
+
+    def __init__(self):
+        self.platform = platform.system()
+        self.workers = {}
+        self.workers_lock = threading.Lock()
+
+    def get_worker(self, dialect):
+        with self.workers_lock:
+            if dialect not in self.workers:
+                self.workers[dialect] = PersistentShellWorker(dialect)
+            return self.workers[dialect]
+
+    def stop_workers(self):
+        with self.workers_lock:
+            for worker in self.workers.values():
+                worker.stop()
+            self.workers.clear()
+
+    def run(self, cmd, timeout=30):
+        route = route_to_shell_worker(cmd) if Config.SHELL_WORKER else None
+        if route:
+            try:
+                return self.get_worker(route[0]).execute(route[1], timeout)
+            except ShellWorkerError:
+                pass  # fall back to a one-off process
         result = subprocess.run(
             cmd,
             shell=True,
@@ -313,18 +739,387 @@ def run_cmd(cmd, use_cache=True, task_name="Executing command"):
             text=True,
             encoding='utf-8',
             errors='ignore',
-            timeout=30
+            timeout=timeout
+        )
+        return result.stdout or "", result.returncode
+
+    def stream(self, cmd, timeout=30):
+        if Config.SHELL_WORKER and route_to_shell_worker(cmd):
+            return (yield from CommandBackend.stream(self, cmd, timeout))
+        process = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='ignore',
+            start_new_session=os.name != 'nt'
         )
+        timed_out = threading.Event()
+
+        def kill():
+            # The shell's children hold the pipe open, so take down the whole group
+            try:
+                if os.name != 'nt':
+                    os.killpg(process.pid, 9)
+                else:
+                    process.kill()
+            except OSError:
+                pass
+
+        def expire():
+            timed_out.set()
+            kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in process.stdout:
+                yield line
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                kill()
+                process.wait()
+            process.stdout.close()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode
+
+
+class RecordingCommandBackend(LiveCommandBackend):
+    """Runs commands live and records outputs and latencies into a fixture bundle"""
+    name = "record"
+
+    def __init__(self, bundle_path):
+        super().__init__()
+        self.bundle_path = bundle_path
+        self.lock = threading.Lock()
+        self.commands = OrderedDict()
+
+    def run(self, cmd, timeout=30):
+        start_time = time.perf_counter()
+        try:
+            output, returncode = super().run(cmd, timeout)
+        except subprocess.TimeoutExpired:
+            with self.lock:
+                self.commands[cmd] = {"stdout": "", "returncode": None, "latency": float(timeout),
+                                      "timeout": True}
+            raise
+        self.record(cmd, output, returncode, time.perf_counter() - start_time)
+        return output, returncode
+
+    def stream(self, cmd, timeout=30):
+        start_time = time.perf_counter()
+        lines = []
+        try:
+            returncode = yield from collect_stream_lines(super().stream(cmd, timeout), lines)
+        except subprocess.TimeoutExpired:
+            with self.lock:
+                self.commands[cmd] = {"stdout": "".join(lines), "returncode": None, "latency": float(timeout),
+                                      "timeout": True}
+            raise
+        self.record(cmd, "".join(lines), returncode, time.perf_counter() - start_time)
+        return returncode
+
+    def record(self, cmd, output, returncode, latency):
+        with self.lock:
+            self.commands[cmd] = {"stdout": output, "returncode": returncode, "latency": latency}
+
+    def save(self):
+        bundle = {
+            "format": 1,
+            "platform": self.platform,
+            "platform_detail": platform.platform(),
+            "hostname": socket.gethostname(),
+            "recorded_at": datetime.now().isoformat(timespec='seconds'),
+            "commands": self.commands
+        }
+        if isinstance(get_registry(), RecordingRegistry):
+            bundle["registry"] = get_registry().keys
+        with open(self.bundle_path, 'wb') as f:
+            f.write(dumps_json(bundle, indent=True))
+        return self.bundle_path
+
+
+class ReplayCommandBackend(CommandBackend):
+    """Serves commands from a recorded fixture bundle, optionally with recorded latencies.
+
+    Collectors see the platform the bundle was recorded on, so Windows
+    parsers can be exercised and profiled on Linux build machines.
+    """
+    name = "replay"
+
+    def __init__(self, bundle, latency_scale=1.0):
+        if isinstance(bundle, str):
+            with open(bundle, 'r', encoding='utf-8') as f:
+                bundle = json.load(f)
+        self.platform = bundle.get("platform", platform.system())
+        self.commands = bundle.get("commands", {})
+        self.registry_keys = bundle.get("registry", {})
+        self.latency_scale = latency_scale
+        self.misses = set()
+
+    def run(self, cmd, timeout=30):
+        record = self.commands.get(cmd)
+        if record is None:
+            self.misses.add(cmd)
+            return "", 1
+        if self.latency_scale:
+            time.sleep(min(record.get("latency", 0), timeout) * self.latency_scale)
+        if record.get("timeout"):
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return record.get("stdout", ""), record.get("returncode", 0)
+
+
+command_backend = LiveCommandBackend()
+
+
+def set_command_backend(backend):
+    """Route run_cmd through backend and clear outputs cached from the previous one"""
+    global command_backend
+    if isinstance(command_backend, LiveCommandBackend) and command_backend is not backend:
+        command_backend.stop_workers()
+    command_backend = backend
+    with command_cache_lock:
+        command_cache.clear()
+    return backend
+
+
+def get_scan_platform():
+    """Platform the collectors parse command output for (the recorded one when replaying)"""
+    return command_backend.platform
+
+
+# -------------------------------------------------------------------
+#  REGISTRY ACCESS LAYER - WINREG, IN-MEMORY FAKE AND RECORDING
+# -------------------------------------------------------------------
+REGISTRY_HIVES = {
+    "HKLM": "HKEY_LOCAL_MACHINE",
+    "HKCU": "HKEY_CURRENT_USER",
+    "HKCR": "HKEY_CLASSES_ROOT",
+    "HKU": "HKEY_USERS",
+}
+
+# Values the security collectors need, read together in one batch
+UAC_VALUE = (r"HKLM\SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\System", "EnableLUA")
+RDP_VALUE = (r"HKLM\SYSTEM\CurrentControlSet\Control\Terminal Server", "fDenyTSConnections")
+AUTORUN_VALUE = (r"HKLM\SOFTWARE\Microsoft\Windows\CurrentVersion\Policies\Explorer", "NoDriveTypeAutoRun")
+DOTNET_KEY = r"HKLM\SOFTWARE\Microsoft\NET Framework Setup\NDP"
+AUTOSTART_KEYS = [
+    r"HKLM\Software\Microsoft\Windows\CurrentVersion\Run",
+    r"HKCU\Software\Microsoft\Windows\CurrentVersion\Run",
+    r"HKLM\Software\Microsoft\Windows\CurrentVersion\RunOnce",
+    r"HKCU\Software\Microsoft\Windows\CurrentVersion\RunOnce"
+]
+
+
+def normalize_registry_path(key_path):
+    """Canonical "HKLM\\Path\\To\\Key" form used as the lookup key by every reader"""
+    hive, _, rest = key_path.strip('\\').partition('\\')
+    hive = next((alias for alias, full in REGISTRY_HIVES.items() if hive.upper() == full), hive.upper())
+    return f"{hive}\\{rest}".rstrip('\\').lower()
+
+
+class RegistryReader:
+    """Typed registry reads: DWORD/QWORD as int, SZ as str, MULTI_SZ as list, missing as None"""
+    name = "base"
+
+    def read_value(self, key_path, value_name):
+        raise NotImplementedError
+
+    def list_values(self, key_path):
+        """OrderedDict of value name -> value, empty when the key is missing"""
+        raise NotImplementedError
+
+    def list_subkeys(self, key_path):
+        raise NotImplementedError
+
+    def read_values(self, requests):
+        """Batch form of read_value: {(key_path, value_name): value}, each key opened once"""
+        by_key = OrderedDict()
+        for key_path, value_name in requests:
+            by_key.setdefault(key_path, []).append(value_name)
+        results = {}
+        for key_path, value_names in by_key.items():
+            values = self.list_values(key_path)
+            lowered = {name.lower(): value for name, value in values.items()}
+            for value_name in value_names:
+                results[(key_path, value_name)] = lowered.get(value_name.lower())
+        return results
+
+
+class WinRegRegistry(RegistryReader):
+    """In-process reads through winreg (64-bit view, so 32-bit Python is not redirected)"""
+    name = "winreg"
+
+    def _open(self, key_path):
+        hive, _, sub_key = normalize_registry_path(key_path).partition('\\')
+        root = getattr(winreg, REGISTRY_HIVES[hive.upper()])
+        return winreg.OpenKey(root, sub_key, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY)
+
+    def read_value(self, key_path, value_name):
+        try:
+            with self._open(key_path) as key:
+                return winreg.QueryValueEx(key, value_name)[0]
+        except OSError:
+            return None
+
+    def list_values(self, key_path):
+        values = OrderedDict()
+        try:
+            with self._open(key_path) as key:
+                for index in itertools.count():
+                    try:
+                        name, value, _ = winreg.EnumValue(key, index)
+                    except OSError:
+                        break
+                    values[name] = value
+        except OSError:
+            pass
+        return values
+
+    def list_subkeys(self, key_path):
+        subkeys = []
+        try:
+            with self._open(key_path) as key:
+                for index in itertools.count():
+                    try:
+                        subkeys.append(winreg.EnumKey(key, index))
+                    except OSError:
+                        break
+        except OSError:
+            pass
+        return subkeys
+
+
+class FakeRegistry(RegistryReader):
+    """In-memory registry for tests, benchmarks and replayed scans: {key_path: {value_name: value}}"""
+    name = "fake"
+
+    def __init__(self, keys=None):
+        self.keys = {}
+        self.names = {}
+        for key_path, values in (keys or {}).items():
+            self.set_key(key_path, values)
+
+    def set_key(self, key_path, values=None):
+        """Add or update a key, creating its parents so list_subkeys sees it"""
+        parts = key_path.strip('\\').split('\\')
+        for depth in range(2, len(parts) + 1):
+            path = normalize_registry_path('\\'.join(parts[:depth]))
+            self.keys.setdefault(path, OrderedDict())
+            self.names.setdefault(path, parts[depth - 1])
+        self.keys.setdefault(normalize_registry_path(key_path), OrderedDict()).update(values or {})
+
+    def read_value(self, key_path, value_name):
+        values = self.keys.get(normalize_registry_path(key_path), {})
+        return next((value for name, value in values.items() if name.lower() == value_name.lower()), None)
+
+    def list_values(self, key_path):
+        return OrderedDict(self.keys.get(normalize_registry_path(key_path), {}))
+
+    def list_subkeys(self, key_path):
+        prefix = normalize_registry_path(key_path) + '\\'
+        return [self.names.get(path, path[len(prefix):]) for path in self.keys
+                if path.startswith(prefix) and '\\' not in path[len(prefix):]]
+
+
+class RecordingRegistry(RegistryReader):
+    """Passes reads through and keeps what was seen, in FakeRegistry's layout, for fixture bundles"""
+    name = "record"
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.keys = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _serializable(value):
+        return value.hex() if isinstance(value, bytes) else value
+
+    def read_value(self, key_path, value_name):
+        value = self.inner.read_value(key_path, value_name)
+        if value is not None:
+            with self.lock:
+                self.keys.setdefault(key_path, OrderedDict())[value_name] = self._serializable(value)
+        return value
+
+    def list_values(self, key_path):
+        values = self.inner.list_values(key_path)
+        with self.lock:
+            recorded = self.keys.setdefault(key_path, OrderedDict())
+            recorded.update((name, self._serializable(value)) for name, value in values.items())
+        return values
+
+    def list_subkeys(self, key_path):
+        subkeys = self.inner.list_subkeys(key_path)
+        with self.lock:
+            for subkey in subkeys:
+                self.keys.setdefault(f"{key_path}\\{subkey}", OrderedDict())
+        return subkeys
+
+
+registry = WinRegRegistry() if winreg is not None else FakeRegistry()
+
+
+def set_registry(reader):
+    global registry
+    registry = reader
+    return reader
+
+
+def get_registry():
+    """The registry reader for the current scan (empty fake when the scan is not on Windows)"""
+    return registry
+
+
+# -------------------------------------------------------------------
+#  ENHANCED COMMAND EXECUTOR WITH ENCODING FIX
+# -------------------------------------------------------------------
+command_cache = {}
+command_cache_lock = threading.Lock()  # Parallel collectors share the cache
+
+
+def get_cached_output(cache_key):
+    with command_cache_lock:
+        entry = command_cache.get(cache_key)
+    if entry and (datetime.now() - entry[0]).seconds < 300:
+        return entry[1]
+    return None
+
+
+def store_cached_output(cache_key, output):
+    with command_cache_lock:
+        command_cache[cache_key] = (datetime.now(), output)
+
+
+def run_cmd(cmd, use_cache=True, task_name="Executing command"):
+    cache_key = f"{cmd}_{get_scan_platform()}"
+
+    if use_cache:
+        output = get_cached_output(cache_key)
+        if output is not None:
+            return output
+
+    start_time = time.perf_counter()
+    try:
+        output, returncode = command_backend.run(cmd, timeout=30)
 
-        execution_time = time.time() - start_time
-        output = result.stdout.strip()
+        execution_time = time.perf_counter() - start_time
+        instrumentation.record_command(cmd, start_time, execution_time, returncode)
+        output = output.strip()
 
         if use_cache:
-            command_cache[cache_key] = (datetime.now(), output)
+            store_cached_output(cache_key, output)
 
         return output
 
     except subprocess.TimeoutExpired:
+        instrumentation.record_command(cmd, start_time, time.perf_counter() - start_time, "timeout")
         print_status(f"{task_name} timed out", "ERROR")
         return "[TIMEOUT] Command execution timeout"
     except Exception as e:
@@ -332,6 +1127,77 @@ def run_cmd(cmd, use_cache=True, task_name="Executing command"):
         return f"[ERROR] Command failed: {str(e)}"
 
 
+def stream_cmd(cmd, use_cache=True, task_name="Executing command"):
+    """Yield output lines of cmd as the command produces them, sharing run_cmd's cache"""
+    cache_key = f"{cmd}_{get_scan_platform()}"
+
+    if use_cache:
+        output = get_cached_output(cache_key)
+        if output is not None:
+            yield from output.splitlines(True)
+            return
+
+    start_time = time.perf_counter()
+    stream = command_backend.stream(cmd, timeout=30)
+    lines = []
+    try:
+        returncode = yield from collect_stream_lines(stream, lines)
+    except subprocess.TimeoutExpired:
+        instrumentation.record_command(cmd, start_time, time.perf_counter() - start_time, "timeout")
+        print_status(f"{task_name} timed out", "ERROR")
+        return
+    except Exception as e:
+        print_status(f"{task_name} failed: {str(e)}", "ERROR")
+        return
+    finally:
+        stream.close()
+
+    instrumentation.record_command(cmd, start_time, time.perf_counter() - start_time, returncode)
+    if use_cache:
+        store_cached_output(cache_key, "".join(lines).strip())
+
+
+def iter_command_csv(cmd, task_name="Executing command"):
+    """Parse a csv-emitting command (driverquery /fo csv, wmic /format:csv) row by row.
+
+    Rows are dicts keyed by the lower-cased header, so quoted commas in values
+    and column order changes between Windows builds are handled.
+    """
+    reader = csv.reader(line for line in stream_cmd(cmd, task_name=task_name) if line.strip())
+    header = None
+    for row in reader:
+        if header is None:
+            header = [column.strip().lower() for column in row]
+            continue
+        yield {column: value.strip() for column, value in zip(header, row)}
+
+
+def decode_powershell_json(output):
+    """Decode ConvertTo-Json output into a list (a single object is not wrapped by PowerShell)"""
+    output = output.strip()
+    if not output or output[0] not in '[{':
+        return []
+    data = orjson.loads(output) if orjson is not None else json.loads(output)
+    return data if isinstance(data, list) else [data]
+
+
+def format_powershell_date(value):
+    """Format a serialized DateTime ("/Date(ms)/" from Windows PowerShell, ISO from PowerShell 7)"""
+    if isinstance(value, dict):  # Get-Date output carries DisplayHint/DateTime note properties
+        value = value.get("value")
+    if not value:
+        return None
+    try:
+        if isinstance(value, str) and value.startswith("/Date("):
+            milliseconds = int(re.match(r"/Date\((-?\d+)", value).group(1))
+            stamp = datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc).astimezone()
+        else:
+            stamp = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        return stamp.strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, AttributeError, OSError, OverflowError):
+        return str(value)
+
+
 # -------------------------------------------------------------------
 #  DETERMINE DOWNLOADS PATH
 # -------------------------------------------------------------------
@@ -345,18 +1211,69 @@ def get_downloads_folder():
 # -------------------------------------------------------------------
 #  ENHANCED TASK MANAGER WITH COMPREHENSIVE PROCESS INFORMATION
 # -------------------------------------------------------------------
+PROCESS_SNAPSHOT_ATTRS = ['pid', 'ppid', 'name', 'username', 'cpu_percent', 'memory_percent',
+                          'memory_info', 'create_time', 'status', 'cpu_times',
+                          'num_threads', 'exe', 'nice', 'ionice',
+                          'num_fds' if hasattr(psutil.Process, 'num_fds') else 'num_handles']
+
+
+# Process objects primed at the SAMPLING WINDOW start. Kept apart from process_iter's
+# cache so a PROCESS SNAPSHOT taken during the window cannot restart their interval.
+primed_processes = {}
+
+
+def prime_process_cpu():
+    """Start a cpu_percent interval for every process, read back by PROCESS CPU"""
+    primed = {}
+    for pid in psutil.pids():
+        try:
+            proc = psutil.Process(pid)
+            proc.cpu_percent(None)
+        except (psutil.Error, OSError):
+            continue
+        primed[pid] = proc
+    primed_processes.clear()
+    primed_processes.update(primed)
+
+
+def get_process_cpu():
+    """pid -> CPU % over the SAMPLING WINDOW, for the per-process CPU columns"""
+    get_collector_result("SAMPLING WINDOW")
+    usage = {}
+    for pid, proc in list(primed_processes.items()):
+        try:
+            usage[pid] = proc.cpu_percent(None)
+        except (psutil.Error, OSError):
+            continue
+    return usage
+
+
+def get_process_snapshot():
+    """Single psutil pass over all processes, shared by every process consumer.
+
+    Not primed: its cpu_percent covers the time since the previous snapshot in
+    this process (the agent's refresh) and reads 0.0 on a first call. Columns
+    that need CPU over a known interval read PROCESS CPU instead.
+    """
+    snapshot = []
+    try:
+        for proc in psutil.process_iter(PROCESS_SNAPSHOT_ATTRS):
+            snapshot.append(proc.info)
+    except Exception as e:
+        print_status(f"Process snapshot failed: {str(e)}", "ERROR")
+    return snapshot
+
+
 def get_task_manager_details():
     print("\n\t", end='')
     print_status("Collecting comprehensive process information...", "SYSTEM")
     processes = []
 
     try:
+        process_cpu = get_collector_result("PROCESS CPU")
         # Get all processes with detailed information
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent',
-                                         'memory_info', 'create_time', 'status', 'cpu_times',
-                                         'num_threads', 'exe', 'nice', 'ionice']):
+        for process_info in get_collector_result("PROCESS SNAPSHOT"):
             try:
-                process_info = proc.info
 
                 # Calculate process uptime
                 create_time = process_info['create_time']
@@ -417,7 +1334,7 @@ def get_task_manager_details():
                     "PID": process_info['pid'],
                     "Process Name": process_info['name'][:60],  # Truncate long names
                     "User": process_info['username'] or "SYSTEM",
-                    "CPU %": f"{process_info['cpu_percent'] or 0:.2f}",
+                    "CPU %": f"{process_cpu.get(process_info['pid']) or 0:.2f}",
                     "Memory %": f"{process_info['memory_percent'] or 0:.3f}",
                     "Memory Usage": memory_mb,
                     "Virtual Memory": memory_vms,
@@ -457,15 +1374,342 @@ def get_task_manager_details():
     return processes[:]
 
 
+# -------------------------------------------------------------------
+#  PROCESS TREE - PPID INDEX AND SUBTREE TOTALS FROM ONE SNAPSHOT
+# -------------------------------------------------------------------
+PROCESS_FAMILIES_TOP_N = 25
+
+
+def process_usage(info, process_cpu=None):
+    """[processes, cpu %, rss, threads, fds/handles] for one snapshot entry.
+
+    CPU comes from PROCESS CPU when given, else from the snapshot itself.
+    """
+    memory_info = info.get('memory_info')
+    cpu = info.get('cpu_percent') if process_cpu is None else process_cpu.get(info['pid'])
+    return [1, cpu or 0.0, memory_info.rss if memory_info else 0,
+            info.get('num_threads') or 0, info.get('num_fds') or info.get('num_handles') or 0]
+
+
+def build_process_tree(snapshot):
+    """ppid -> children index and bottom-up subtree totals, in O(n) over one snapshot.
+
+    Processes whose parent is missing from the snapshot (or is themselves) are
+    roots. Totals are accumulated in reverse DFS order, so every child is
+    finished before its parent; a ppid cycle from PID reuse cannot loop.
+    """
+    nodes = {info['pid']: info for info in snapshot}
+    children = {}
+    roots = []
+    for info in snapshot:
+        ppid = info.get('ppid')
+        if ppid in nodes and ppid != info['pid']:
+            children.setdefault(ppid, []).append(info['pid'])
+        else:
+            roots.append(info['pid'])
+
+    order = []
+    seen = set()
+    # Roots first; any pid still unseen afterwards sits on a ppid cycle
+    for start in itertools.chain(roots, nodes):
+        if start in seen:
+            continue
+        stack = [start]
+        while stack:
+            pid = stack.pop()
+            if pid in seen:
+                continue
+            seen.add(pid)
+            order.append(pid)
+            stack.extend(children.get(pid, ()))
+
+    totals = {}
+    for pid in reversed(order):
+        total = process_usage(nodes[pid])
+        for child in children.get(pid, ()):
+            child_total = totals.get(child)
+            if child_total:
+                total = [mine + theirs for mine, theirs in zip(total, child_total)]
+        totals[pid] = total
+
+    # A family is a same-name chain (chrome and its chrome children); its root's parent is named differently
+    family_of = {}
+    for pid in order:
+        parent = nodes[pid].get('ppid')
+        if parent in family_of and parent != pid and nodes[parent].get('name') == nodes[pid].get('name'):
+            family_of[pid] = family_of[parent]
+        else:
+            family_of[pid] = pid
+    return {"nodes": nodes, "children": children, "roots": roots, "totals": totals, "family_of": family_of}
+
+
+def get_process_tree():
+    return build_process_tree(get_collector_result("PROCESS SNAPSHOT"))
+
+
+def subtree_sum(tree, root, values):
+    """Sum of values[pid] over root and all its descendants"""
+    total = 0.0
+    seen = set()
+    stack = [root]
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += values.get(pid) or 0.0
+        stack.extend(tree["children"].get(pid, ()))
+    return total
+
+
+def get_process_families():
+    """Heaviest process families with their own totals and whole-subtree totals"""
+    print("\n\t", end='')
+    print_status("Building process tree...", "SYSTEM")
+    families_info = []
+
+    try:
+        tree = get_collector_result("PROCESS TREE")
+        process_cpu = get_collector_result("PROCESS CPU")
+        nodes, totals = tree["nodes"], tree["totals"]
+        families = {}
+        for pid, root in tree["family_of"].items():
+            family = families.setdefault(root, [0, 0.0, 0, 0, 0])
+            for index, value in enumerate(process_usage(nodes[pid], process_cpu)):
+                family[index] += value
+
+        heaviest = sorted(families.items(), key=lambda item: (item[1][1], item[1][2]), reverse=True)
+        for root, (count, cpu, rss, threads, fds) in heaviest[:PROCESS_FAMILIES_TOP_N]:
+            subtree = totals[root]
+            parent = nodes.get(nodes[root].get('ppid'))
+            families_info.append({
+                "Family": f"{nodes[root].get('name') or '?'} ({root})",
+                "Parent": f"{parent.get('name')} ({parent['pid']})" if parent and parent['pid'] != root else "-",
+                "User": nodes[root].get('username') or "SYSTEM",
+                "Processes": count,
+                "CPU %": f"{cpu:.2f}",
+                "Memory (RSS)": format_bytes(rss),
+                "Threads": threads,
+                "Handles/FDs": fds,
+                "Subtree Processes": subtree[0],
+                "Subtree CPU %": f"{subtree_sum(tree, root, process_cpu):.2f}",
+                "Subtree RSS": format_bytes(subtree[2])
+            })
+
+        print("\t", end='')
+        print_status(f"Grouped {len(nodes)} processes into {len(families)} families", "SUCCESS")
+
+    except Exception as e:
+        print_status(f"Process tree analysis failed: {str(e)}", "ERROR")
+
+    return families_info
+
+
+# -------------------------------------------------------------------
+#  DEEP MEMORY - PSS, USS AND SWAP FROM SMAPS_ROLLUP (LINUX)
+# -------------------------------------------------------------------
+SMAPS_FIELDS = {"Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty", "Swap", "SwapPss"}
+
+
+def read_smaps_rollup(pid):
+    """Memory counters in bytes for one process, or None when it has exited or is not readable.
+
+    smaps_rollup (Linux 4.14+) is the kernel's own sum over all mappings; older
+    kernels fall back to summing /proc/<pid>/smaps, which is much slower.
+    """
+    counters = dict.fromkeys(SMAPS_FIELDS, 0)
+    for name in ("smaps_rollup", "smaps"):
+        try:
+            with open(f"/proc/{pid}/{name}", 'rb') as f:
+                for line in f:
+                    field, _, rest = line.partition(b":")
+                    field = field.decode('ascii', 'ignore')
+                    if field in SMAPS_FIELDS:
+                        counters[field] += int(rest.split()[0]) * 1024
+            break
+        except FileNotFoundError:
+            if name == "smaps" or not os.path.exists(f"/proc/{pid}"):
+                return None
+        except ProcessLookupError:
+            # Kernel threads have no address space: the read fails with ESRCH while /proc/<pid> exists
+            if not os.path.exists(f"/proc/{pid}"):
+                return None
+            break
+        except (OSError, ValueError, IndexError):
+            return None
+    return {
+        "rss": counters["Rss"],
+        "pss": counters["Pss"],
+        "uss": counters["Private_Clean"] + counters["Private_Dirty"],
+        "shared": counters["Shared_Clean"] + counters["Shared_Dirty"],
+        # SwapPss splits shared swap like Pss does, so totals stay additive
+        "swap": counters["SwapPss"] or counters["Swap"],
+    }
+
+
+def read_smaps_parallel(pids, workers):
+    """pid -> read_smaps_rollup() for every pid, read on a thread pool (the reads block in the kernel)"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return {pid: usage for pid, usage in zip(pids, executor.map(read_smaps_rollup, pids)) if usage}
+
+
+def get_deep_memory_analysis():
+    """PSS/USS/swap for the heaviest processes, with per-user and per-family totals that reconcile to RAM"""
+    print("\n\t", end='')
+    print_status("Analyzing proportional memory usage...", "SYSTEM")
+    memory_rows = []
+
+    if not Config.DEEP_MEMORY:
+        print("\t", end='')
+        print_status("Deep memory analysis disabled", "INFO")
+        return memory_rows
+    if get_scan_platform() != "Linux" or not os.path.isdir("/proc/self"):
+        print("\t", end='')
+        print_status("Deep memory analysis needs /proc/<pid>/smaps_rollup (Linux)", "INFO")
+        return memory_rows
+
+    try:
+        tree = get_collector_result("PROCESS TREE")
+        nodes = tree["nodes"]
+        # Every readable process is read so the totals add up; only the top N get their own row
+        usage = read_smaps_parallel(list(nodes), Config.DEEP_MEMORY_WORKERS)
+
+        def row(scope, name, processes, totals, rss):
+            return {
+                "Scope": scope,
+                "Name": name,
+                "Processes": processes,
+                "PSS": format_bytes(totals["pss"]),
+                "USS": format_bytes(totals["uss"]),
+                "Swap": format_bytes(totals["swap"]),
+                "Shared": format_bytes(totals["shared"]),
+                "RSS": format_bytes(rss)
+            }
+
+        for pid, counters in sorted(usage.items(), key=lambda item: item[1]["pss"],
+                                    reverse=True)[:Config.DEEP_MEMORY_TOP_N]:
+            memory_rows.append(row("PROCESS", f"{nodes[pid].get('name') or '?'} ({pid})", 1, counters,
+                                   counters["rss"]))
+
+        for scope, key in (("USER", lambda pid: nodes[pid].get('username') or "SYSTEM"),
+                           ("FAMILY", lambda pid: tree["family_of"][pid])):
+            groups = {}
+            for pid, counters in usage.items():
+                group = groups.setdefault(key(pid), {"pss": 0, "uss": 0, "swap": 0, "shared": 0, "rss": 0,
+                                                     "count": 0})
+                for field in ("pss", "uss", "swap", "shared", "rss"):
+                    group[field] += counters[field]
+                group["count"] += 1
+            heaviest = sorted(groups.items(), key=lambda item: item[1]["pss"], reverse=True)
+            for group_key, totals in heaviest[:Config.DEEP_MEMORY_TOP_N]:
+                name = group_key if scope == "USER" else f"{nodes[group_key].get('name') or '?'} ({group_key})"
+                memory_rows.append(row(scope, name, totals["count"], totals, totals["rss"]))
+
+        # Reconciliation: process PSS + unreadable processes' RSS + the rest = MemTotal
+        memory = psutil.virtual_memory()
+        process_pss = sum(counters["pss"] for counters in usage.values())
+        unreadable = [info for pid, info in nodes.items() if pid not in usage]
+        unreadable_rss = sum(info['memory_info'].rss for info in unreadable if info.get('memory_info'))
+        empty = {"pss": 0, "uss": 0, "swap": 0, "shared": 0}
+        memory_rows.append(row("SYSTEM", "All readable processes (PSS)", len(usage),
+                               dict(empty, pss=process_pss,
+                                    uss=sum(counters["uss"] for counters in usage.values()),
+                                    swap=sum(counters["swap"] for counters in usage.values())),
+                               sum(counters["rss"] for counters in usage.values())))
+        memory_rows.append(row("SYSTEM", "Unreadable processes (RSS estimate)", len(unreadable),
+                               dict(empty, pss=unreadable_rss), unreadable_rss))
+        memory_rows.append(row("SYSTEM", "Kernel, page cache and free", 0,
+                               dict(empty, pss=max(0, memory.total - process_pss - unreadable_rss)), 0))
+        memory_rows.append(row("SYSTEM", "Physical memory total", len(nodes), dict(empty, pss=memory.total), 0))
+
+        print("\t", end='')
+        print_status(f"Read proportional memory of {len(usage)}/{len(nodes)} processes", "SUCCESS")
+
+    except Exception as e:
+        print_status(f"Deep memory analysis failed: {str(e)}", "ERROR")
+
+    return memory_rows
+
+
+# -------------------------------------------------------------------
+#  SHARED SAMPLING WINDOW - CPU AND GPU UTILISATION OVER ONE INTERVAL
+# -------------------------------------------------------------------
+def cpu_busy_percent(before, after):
+    """psutil.cpu_percent() arithmetic on two cpu_times samples, without touching psutil's own state"""
+    def busy_and_total(times):
+        total = sum(times)
+        # Guest time is already counted in user/nice on Linux
+        total -= getattr(times, 'guest', 0) + getattr(times, 'guest_nice', 0)
+        idle = times.idle + getattr(times, 'iowait', 0)
+        return total - idle, total
+
+    busy_before, total_before = busy_and_total(before)
+    busy_after, total_after = busy_and_total(after)
+    if total_after <= total_before:
+        return 0.0
+    return round(min(100.0, max(0.0, (busy_after - busy_before) / (total_after - total_before) * 100)), 1)
+
+
+def get_sampling_window():
+    """CPU and GPU utilisation measured over one Config.SAMPLE_WINDOW shared by every consumer.
+
+    GPU counters that are instantaneous (busy %) are polled through the window
+    and averaged; cumulative ones (idle residency) are differenced. Per-process
+    CPU is primed at the start for the PROCESS SNAPSHOT taken after it.
+    """
+    cards = list_drm_cards() if get_scan_platform() == "Linux" else []
+    gpu_samples = {card["card"]: [] for card in cards}
+    prime_process_cpu()
+    start = time.perf_counter()
+    cpu_before = psutil.cpu_times()
+    core_before = psutil.cpu_times(percpu=True)
+    idle_before = {card["card"]: read_drm_idle_ms(card) for card in cards}
+
+    deadline = start + Config.SAMPLE_WINDOW
+    while True:
+        for card in cards:
+            busy = read_drm_busy_percent(card)
+            if busy is not None:
+                gpu_samples[card["card"]].append(busy)
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        time.sleep(min(Config.SAMPLE_POLL_INTERVAL if cards else remaining, remaining))
+
+    elapsed = time.perf_counter() - start
+    cpu_after = psutil.cpu_times()
+    core_after = psutil.cpu_times(percpu=True)
+    gpus = OrderedDict()
+    for card in cards:
+        samples = gpu_samples[card["card"]]
+        idle_after = read_drm_idle_ms(card)
+        busy_avg = busy_max = None
+        if samples:
+            busy_avg, busy_max = round(sum(samples) / len(samples), 1), max(samples)
+        elif idle_before[card["card"]] is not None and idle_after is not None:
+            # i915 reports RC6 (idle) residency instead of a busy percentage
+            idle_share = (idle_after - idle_before[card["card"]]) / (elapsed * 1000)
+            busy_avg = round(min(100.0, max(0.0, (1 - idle_share) * 100)), 1)
+        gpus[card["card"]] = {"busy_avg": busy_avg, "busy_max": busy_max, "samples": len(samples)}
+
+    return {
+        "seconds": round(elapsed, 3),
+        "cpu_percent": cpu_busy_percent(cpu_before, cpu_after),
+        "cpu_percent_per_core": [cpu_busy_percent(before, after) for before, after in zip(core_before, core_after)],
+        "gpus": gpus,
+    }
+
+
 def get_system_performance():
     print("\n\t", end='')
     print_status("Analyzing real-time system performance...", "SYSTEM")
     performance = []
 
     try:
-        # CPU Information with per-core stats
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_percent_per_core = psutil.cpu_percent(interval=1, percpu=True)
+        # CPU Information with per-core stats, from the scan's shared sampling window
+        window = get_collector_result("SAMPLING WINDOW")
+        cpu_percent = window["cpu_percent"]
+        cpu_percent_per_core = window["cpu_percent_per_core"]
         cpu_count = psutil.cpu_count(logical=False)
         cpu_count_logical = psutil.cpu_count(logical=True)
         cpu_freq = psutil.cpu_freq()
@@ -516,6 +1760,17 @@ def get_system_performance():
                  "Details": f"{net_io.packets_recv:,} packets"},
             ])
 
+        signals = get_collector_result("PRESSURE SIGNALS")
+        if signals["load_per_core"]:
+            performance.append({"Metric": "Load per Core", "Value": f"{signals['load_per_core'][0]}",
+                                "Details": "1/5/15 min: " + " / ".join(map(str, signals["load_per_core"]))})
+        for resource, pressure in signals["psi"].items():
+            details = "; ".join(f"{kind} {values['avg10']}/{values['avg60']}/{values['avg300']}"
+                                for kind, values in pressure.items())
+            performance.append({"Metric": f"{PRESSURE_RESOURCES[resource]} Pressure",
+                                "Value": f"{pressure['some']['avg60']}%",
+                                "Details": f"avg10/60/300 {details}"})
+
         performance.append({
             "Metric": "Temperature Monitoring",
             "Value": "AVAILABLE" if has_temp else "UNAVAILABLE",
@@ -535,198 +1790,704 @@ def get_system_performance():
 # -------------------------------------------------------------------
 #  USERS AND ACCOUNTS INFORMATION
 # -------------------------------------------------------------------
-def get_users_information():
-    print("\n\t", end='')
-    print_status("Collecting user account information...", "SYSTEM")
-    users_info = []
+# -------------------------------------------------------------------
+#  BATCHED POWERSHELL QUERIES - ONE SESSION PER SCAN, JSON OUTPUT
+# -------------------------------------------------------------------
+# Each query's objects are collected into one ordered hashtable and emitted with a
+# single ConvertTo-Json -Compress, so PowerShell starts once instead of per check.
+# Enums are stringified because Windows PowerShell serialises them as integers.
+POWERSHELL_QUERIES = OrderedDict([
+    ("local_users",
+     "$groups = @{}; Get-LocalGroup | ForEach-Object { $group = $_.Name; "
+     "Get-LocalGroupMember -Group $group -ErrorAction SilentlyContinue | "
+     "ForEach-Object { $groups[$_.Name.Split('\\')[-1]] += @($group) } }; "
+     "Get-LocalUser | Select-Object Name, FullName, Enabled, LastLogon, PasswordLastSet, AccountExpires, "
+     "PasswordRequired, @{n='Groups'; e={$groups[$_.Name] -join ', '}}"),
+    ("installed_software",
+     "Get-ItemProperty HKLM:\\Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\*, "
+     "HKLM:\\Software\\Wow6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* -ErrorAction SilentlyContinue | "
+     "Where-Object DisplayName | Select-Object DisplayName, DisplayVersion, Publisher, InstallDate"),
+    ("system_errors",
+     "Get-EventLog -LogName System -EntryType Error -Newest 10 | "
+     "Select-Object TimeGenerated, Source, InstanceId, Message"),
+    ("defender",
+     "Get-MpComputerStatus | Select-Object AntivirusEnabled, AMServiceEnabled, AntispywareEnabled, "
+     "RealTimeProtectionEnabled, OnAccessProtectionEnabled"),
+    ("tpm", "Get-Tpm | Select-Object TpmPresent, TpmReady"),
+    ("secure_boot", "Confirm-SecureBootUEFI"),
+    ("device_encryption", "(Get-BitLockerVolume -MountPoint C:).ProtectionStatus.ToString()"),
+    ("execution_policy", "(Get-ExecutionPolicy).ToString()"),
+])
+# Servicing-stack and Windows Update queries can outlast the whole local batch, so each
+# runs as its own invocation with its own timeout and only blanks itself when slow.
+POWERSHELL_SLOW_QUERIES = OrderedDict([
+    ("smb1", "(Get-WindowsOptionalFeature -Online -FeatureName SMB1Protocol).State.ToString()"),
+    ("windows_update", "Get-WindowsUpdate | Select-Object KB, Title"),
+])
+
+
+def build_powershell_batch(queries=POWERSHELL_QUERIES):
+    """One script running every query; failures are recorded per query instead of aborting the batch"""
+    statements = ["$ErrorActionPreference = 'Stop'", "$results = [ordered]@{}"]
+    for name, query in queries.items():
+        statements.append(f"try {{ $results['{name}'] = @({query}) }} "
+                          f"catch {{ $results['{name}'] = @{{error = $_.Exception.Message}} }}")
+    statements.append("$results | ConvertTo-Json -Compress -Depth 4")
+    return "; ".join(statements)
+
+
+def powershell_command(script):
+    """Wrap a script as an -EncodedCommand invocation, which sidesteps cmd.exe quoting"""
+    encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
+    return f"powershell -NoProfile -NonInteractive -EncodedCommand {encoded}"
+
+
+def run_powershell_batch(queries, task_name):
+    """{query name: objects or {"error": ...}} for one batch; empty if it timed out or failed"""
+    output = run_cmd(powershell_command(build_powershell_batch(queries)), task_name=task_name)
+    if output.startswith(("[TIMEOUT]", "[ERROR]")):
+        return {}  # run_cmd has already reported it
+    try:
+        decoded = decode_powershell_json(output)
+    except ValueError:
+        print_status(f"{task_name} returned malformed JSON", "ERROR")
+        return {}
+    return decoded[0] if decoded and isinstance(decoded[0], dict) else {}
 
-    if platform.system() == "Windows":
-        try:
-            output = run_cmd("net user")
-            lines = output.split('\n')
-            users = []
 
-            for line in lines:
-                if 'User accounts for' not in line and '-----' not in line and 'command completed' not in line and line.strip():
-                    potential_users = [user.strip() for user in line.split() if user.strip()]
-                    for user in potential_users:
-                        if user and user not in ['The', 'command', 'completed', 'successfully.']:
-                            users.append(user)
+def get_powershell_session():
+    """Run the local PowerShell queries in one session and each slow query on its own;
+    returns {query name: list of objects or {"error": ...}}"""
+    if get_scan_platform() != "Windows":
+        return {}
+    session = run_powershell_batch(POWERSHELL_QUERIES, "PowerShell session")
+    for name, query in POWERSHELL_SLOW_QUERIES.items():
+        result = run_powershell_batch(OrderedDict([(name, query)]), f"PowerShell {name} query")
+        if name in result:
+            session[name] = result[name]
+    return session
 
-            print("\t", end='')
-            print_status(f"Found {len(users)} user accounts", "DATA")
 
-            for user in users:
-                try:
-                    user_details = run_cmd(f'net user "{user}"')
-                    user_data = {
-                        "Username": user,
-                        "Full Name": "N/A",
-                        "Account Active": "Yes",
-                        "Last Logon": "N/A",
-                        "Password Last Set": "N/A",
-                        "Account Expires": "Never",
-                        "Local Group Memberships": "N/A",
-                        "Password Required": "Yes",
-                        "Workstations Allowed": "All"
-                    }
+def get_powershell_result(name):
+    """Objects a batched query returned, or None if it failed or PowerShell is unavailable"""
+    value = get_collector_result("POWERSHELL SESSION").get(name)
+    if isinstance(value, dict) and set(value) == {"error"}:
+        return None
+    if value is None:
+        return None
+    return value if isinstance(value, list) else [value]
 
-                    for detail_line in user_details.split('\n'):
-                        detail_line_lower = detail_line.lower()
-                        if 'full name' in detail_line_lower and 'n/a' not in detail_line_lower:
-                            user_data["Full Name"] = detail_line.split('Full Name')[1].strip()
-                        elif 'account active' in detail_line_lower:
-                            user_data["Account Active"] = "Yes" if "yes" in detail_line_lower else "No"
-                        elif 'last logon' in detail_line_lower and 'n/a' not in detail_line_lower:
-                            user_data["Last Logon"] = detail_line.split('Last logon')[1].strip()
-                        elif 'password last set' in detail_line_lower and 'n/a' not in detail_line_lower:
-                            user_data["Password Last Set"] = detail_line.split('Password last set')[1].strip()
-                        elif 'account expires' in detail_line_lower:
-                            user_data["Account Expires"] = detail_line.split('Account expires')[1].strip()
-                        elif 'local group memberships' in detail_line_lower:
-                            user_data["Local Group Memberships"] = detail_line.split('Local Group Memberships')[
-                                1].strip()
-                        elif 'password required' in detail_line_lower:
-                            user_data["Password Required"] = detail_line.split('Password required')[1].strip()
-
-                    users_info.append(user_data)
-                except Exception:
-                    continue
 
-            print("\t", end='')
-            print_status(f"Collected details for {len(users_info)} users", "SUCCESS")
+LASTLOG_RECORD = struct.Struct("=i32s256s")  # ll_time, ll_line, ll_host - 292 bytes, indexed by UID
 
-        except Exception as e:
-            print_status(f"User information collection failed: {str(e)}", "ERROR")
-            users_info.append({
-                "Username": f"Error: {str(e)}",
-                "Details": "Failed to retrieve user information"
-            })
+
+def get_windows_users():
+    """All local accounts, their attributes and group memberships from the PowerShell session"""
+    users_info = []
+    for account in get_powershell_result("local_users") or []:
+        users_info.append({
+            "Username": account.get("Name"),
+            "Full Name": account.get("FullName") or "N/A",
+            "Account Active": "Yes" if account.get("Enabled") else "No",
+            "Last Logon": format_powershell_date(account.get("LastLogon")) or "Never",
+            "Password Last Set": format_powershell_date(account.get("PasswordLastSet")) or "N/A",
+            "Account Expires": format_powershell_date(account.get("AccountExpires")) or "Never",
+            "Local Group Memberships": account.get("Groups") or "N/A",
+            "Password Required": "Yes" if account.get("PasswordRequired") else "No"
+        })
+    return users_info
+
+
+def get_net_user_accounts():
+    """Fallback for hosts without Get-LocalUser: the account names from the `net user` listing"""
+    output = run_cmd("net user")
+    lines = output.split('\n')
+    start = next((i + 1 for i, line in enumerate(lines) if line.startswith('---')), len(lines))
+    return [user for line in lines[start:] if 'command completed' not in line for user in line.split()]
+
+
+def get_windows_users_net_user():
+    users_info = []
+    for user in get_net_user_accounts():
+        user_data = {
+            "Username": user,
+            "Full Name": "N/A",
+            "Account Active": "Yes",
+            "Last Logon": "N/A",
+            "Password Last Set": "N/A",
+            "Account Expires": "Never",
+            "Local Group Memberships": "N/A",
+            "Password Required": "Yes"
+        }
+        fields = {
+            "full name": "Full Name",
+            "account active": "Account Active",
+            "last logon": "Last Logon",
+            "password last set": "Password Last Set",
+            "account expires": "Account Expires",
+            "local group memberships": "Local Group Memberships",
+            "password required": "Password Required"
+        }
+        for detail_line in run_cmd(f'net user "{user}"').split('\n'):
+            label = detail_line[:29].strip().lower()
+            if label in fields and detail_line[29:].strip():
+                user_data[fields[label]] = detail_line[29:].strip()
+        users_info.append(user_data)
+    return users_info
+
+
+def read_colon_file(path):
+    """Split a colon-separated account database (/etc/passwd, /etc/shadow, /etc/group)"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return [line.rstrip('\n').split(':') for line in f if line.strip() and not line.startswith('#')]
+    except OSError:
+        return None
+
+
+def format_shadow_days(days):
+    """Shadow dates are days since the epoch"""
+    if not days or not days.isdigit():
+        return None
+    return (datetime(1970, 1, 1) + timedelta(days=int(days))).strftime("%Y-%m-%d")
+
+
+def read_lastlog_times(uids):
+    """Last login per UID from /var/log/lastlog, falling back to the lastlog2 database"""
+    times = {}
+    try:
+        with open("/var/log/lastlog", 'rb') as f:
+            for uid in uids:
+                f.seek(uid * LASTLOG_RECORD.size)
+                record = f.read(LASTLOG_RECORD.size)
+                if len(record) < LASTLOG_RECORD.size:
+                    continue
+                ll_time, ll_line, ll_host = LASTLOG_RECORD.unpack(record)
+                if ll_time > 0:
+                    host = ll_host.split(b'\0', 1)[0].decode(errors='ignore')
+                    times[uid] = datetime.fromtimestamp(ll_time).strftime("%Y-%m-%d %H:%M:%S") + (
+                        f" from {host}" if host else "")
+        return times
+    except OSError:
+        pass
+
+    try:
+        connection = sqlite3.connect("file:/var/lib/lastlog/lastlog2.db?mode=ro", uri=True)
+        try:
+            return {name: datetime.fromtimestamp(login).strftime("%Y-%m-%d %H:%M:%S")
+                    for name, login in connection.execute("SELECT Name, Time FROM Lastlog2") if login}
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        return {}
+
+
+def get_linux_users():
+    """Accounts from /etc/passwd, /etc/shadow, /etc/group and lastlog in one pass each"""
+    passwd = read_colon_file("/etc/passwd") or []
+    shadow = {fields[0]: fields for fields in read_colon_file("/etc/shadow") or [] if len(fields) >= 8}
+    groups_by_gid = {}
+    memberships = {}
+    for fields in read_colon_file("/etc/group") or []:
+        if len(fields) < 4:
+            continue
+        groups_by_gid[fields[2]] = fields[0]
+        for member in filter(None, fields[3].split(',')):
+            memberships.setdefault(member, []).append(fields[0])
+
+    accounts = [fields for fields in passwd if len(fields) >= 7 and fields[2].isdigit()]
+    last_logons = read_lastlog_times(int(fields[2]) for fields in accounts)
+
+    users_info = []
+    for name, _, uid, gid, gecos, home, shell in (fields[:7] for fields in accounts):
+        entry = shadow.get(name)
+        password = entry[1] if entry else None
+        locked = password is not None and password[:1] in ('!', '*')
+        login_shell = not shell.endswith(('nologin', '/false'))
+        groups = [groups_by_gid[gid]] if gid in groups_by_gid else []
+        groups += [group for group in memberships.get(name, []) if group not in groups]
+        users_info.append({
+            "Username": name,
+            "UID": int(uid),
+            "Full Name": gecos.split(',')[0] or "N/A",
+            "Account Active": "Yes" if login_shell and not locked else "No",
+            "Last Logon": last_logons.get(int(uid)) or last_logons.get(name) or "Never",
+            "Password Last Set": (format_shadow_days(entry[2]) or "N/A") if entry else "N/A",
+            "Account Expires": (format_shadow_days(entry[7]) or "Never") if entry else "N/A",
+            "Local Group Memberships": ", ".join(groups) or "N/A",
+            "Password Required": ("No" if password == "" else "Yes") if entry else "N/A",
+            "Home": home,
+            "Shell": shell
+        })
+    return users_info
+
+
+def get_users_information():
+    print("\n\t", end='')
+    print_status("Collecting user account information...", "SYSTEM")
+    users_info = []
+
+    try:
+        if get_scan_platform() == "Windows":
+            users_info = get_windows_users()
+            if not users_info:
+                users_info = get_windows_users_net_user()
+        elif get_scan_platform() == "Linux":
+            users_info = get_linux_users()
+
+        print("\t", end='')
+        print_status(f"Collected details for {len(users_info)} users", "SUCCESS")
+
+    except Exception as e:
+        print_status(f"User information collection failed: {str(e)}", "ERROR")
+        users_info.append({
+            "Username": f"Error: {str(e)}",
+            "Details": "Failed to retrieve user information"
+        })
 
     return users_info
 
 
 # -------------------------------------------------------------------
-#  ENHANCED SYSTEM HEALTH SCORING ALGORITHMS
+#  PRESSURE SIGNALS - PSI, LOAD AVERAGE AND RECLAIM COUNTERS
 # -------------------------------------------------------------------
-def get_system_health_score():
-    """Comprehensive system health scoring with weighted factors"""
-    score = 100
-    warnings = []
+PRESSURE_ROOT = "/proc/pressure"
+VMSTAT_PATH = "/proc/vmstat"
+PRESSURE_RESOURCES = OrderedDict([("cpu", "CPU"), ("memory", "Memory"), ("io", "I/O")])
+# Summed over zones/reclaimers: allocstall_* and pgscan_direct mean tasks stalled reclaiming memory themselves
+VMSTAT_COUNTERS = OrderedDict([
+    ("allocstall", ("allocstall_",)),
+    ("pgscan_direct", ("pgscan_direct",)),
+    ("pgscan_kswapd", ("pgscan_kswapd",)),
+    ("pgmajfault", ("pgmajfault",)),
+    ("pswpin", ("pswpin",)),
+    ("oom_kill", ("oom_kill",)),
+])
+# Previous counter reading, so a resident process (the agent) gets rates over its refresh interval
+vmstat_baseline = {}
+
+
+def read_pressure(resource):
+    """Parse /proc/pressure/<resource> into {"some": {...}, "full": {...}}; None without PSI"""
+    pressure = {}
+    try:
+        with open(os.path.join(PRESSURE_ROOT, resource)) as handle:
+            for line in handle:
+                kind, _, fields = line.partition(" ")
+                pressure[kind] = {key: float(value) for key, value in
+                                  (field.split("=", 1) for field in fields.split())}
+    except (OSError, ValueError):
+        return None
+    return pressure or None
+
+
+def read_vmstat_counters():
+    """Reclaim-related /proc/vmstat counters, cumulative since boot"""
+    counters = dict.fromkeys(VMSTAT_COUNTERS, 0)
+    try:
+        with open(VMSTAT_PATH) as handle:
+            for line in handle:
+                key, _, value = line.partition(" ")
+                for name, prefixes in VMSTAT_COUNTERS.items():
+                    # pgscan_direct_throttle counts throttling events, not scanned pages
+                    if key.startswith(prefixes) and key != "pgscan_direct_throttle":
+                        counters[name] += int(value)
+    except (OSError, ValueError):
+        return None
+    return counters
+
+
+def get_pressure_signals():
+    """Stall, load and reclaim signals read in one pass.
+
+    PSI averages and the load average are already smoothed by the kernel;
+    vmstat counters become rates against the previous reading in this
+    process (the agent's last refresh), or against boot time when there is
+    none - those are reported but not scored.
+    """
+    cores = psutil.cpu_count(logical=True) or 1
+    signals = {"psi": {}, "load_per_core": None, "reclaim": None}
 
     try:
-        # CPU Health (25 points)
-        cpu_usage = psutil.cpu_percent(interval=1)
-        if cpu_usage > 90:
-            score -= 20
-            warnings.append("[CPU Health]  CRITICAL: CPU usage very high")
-        elif cpu_usage > 80:
-            score -= 15
-            warnings.append("[CPU Health]  WARNING: CPU usage high")
-        elif cpu_usage > 70:
-            score -= 10
-            warnings.append("[CPU Health]  NOTICE: CPU usage elevated")
-        elif cpu_usage > 60:
-            score -= 5
-
-        # Memory Health (25 points)
-        memory = psutil.virtual_memory()
-        if memory.percent > 95:
-            score -= 20
-            warnings.append("[Memory Health]  CRITICAL: Memory usage very high")
-        elif memory.percent > 85:
-            score -= 15
-            warnings.append("[Memory Health]  WARNING: Memory usage high")
-        elif memory.percent > 75:
-            score -= 10
-            warnings.append("[Memory Health]  NOTICE: Memory usage elevated")
-        elif memory.percent > 65:
-            score -= 5
-
-        # Disk Health (20 points)
-        disk_warnings = 0
-        critical_disks = 0
-        for part in psutil.disk_partitions():
-            try:
-                # Skip CD-ROM and other non-writable drives
-                if 'cdrom' in part.opts or part.fstype == '':
-                    continue
+        signals["load_per_core"] = [round(load / cores, 2) for load in os.getloadavg()]
+    except (AttributeError, OSError):
+        pass  # Windows has no load average
+
+    if get_scan_platform() != "Linux":
+        return signals
+
+    for resource in PRESSURE_RESOURCES:
+        pressure = read_pressure(resource)
+        if pressure:
+            signals["psi"][resource] = pressure
+
+    counters = read_vmstat_counters()
+    if counters:
+        now = time.time()
+        previous = vmstat_baseline.get("counters")
+        since = vmstat_baseline.get("time") or psutil.boot_time()
+        elapsed = max(now - since, 1.0)
+        signals["reclaim"] = {
+            "seconds": round(elapsed, 1),
+            "since_boot": previous is None,
+            "oom_kill": counters["oom_kill"] - (previous or {}).get("oom_kill", 0),
+            "rates": {name: round((value - (previous or {}).get(name, 0)) / elapsed, 2)
+                      for name, value in counters.items() if name != "oom_kill"},
+        }
+        vmstat_baseline.update(counters=counters, time=now)
 
-                usage = psutil.disk_usage(part.mountpoint)
-                if usage.percent > 95:
-                    disk_warnings += 3
-                    critical_disks += 1
-                    warnings.append(f"[Disk Health]  CRITICAL: Disk {part.device} at {usage.percent}%")
-                elif usage.percent > 90:
-                    disk_warnings += 2
-                    warnings.append(f"[Disk Health]  WARNING: Disk {part.device} at {usage.percent}%")
-                elif usage.percent > 85:
-                    disk_warnings += 1
-                    warnings.append(f"[Disk Health]  NOTICE: Disk {part.device} at {usage.percent}%")
-            except:
-                continue
+    return signals
 
-        score -= min(disk_warnings, 15)
-        if critical_disks > 0:
-            score -= 5
 
-        # Temperature Health (15 points) - if available
-        try:
-            temps = psutil.sensors_temperatures()
-            if temps:
-                high_temp_count = 0
-                for name, entries in temps.items():
-                    for entry in entries:
-                        if entry.current > 85:
-                            high_temp_count += 3
-                            warnings.append(f"[Temperature Health]  CRITICAL: {name} temperature {entry.current}°C")
-                        elif entry.current > 75:
-                            high_temp_count += 2
-                            warnings.append(f"[Temperature Health]  WARNING: {name} temperature {entry.current}°C")
-                        elif entry.current > 65:
-                            high_temp_count += 1
-                score -= min(high_temp_count, 12)
-        except:
-            pass
+def pressure_average(signals, resource, kind="some", window="avg60"):
+    return signals["psi"].get(resource, {}).get(kind, {}).get(window)
+
+
+# -------------------------------------------------------------------
+#  HEALTH RULES ENGINE - DATA-DRIVEN THRESHOLDS, COMPILED ONCE
+# -------------------------------------------------------------------
+# Each rule maps one metric to ordered tiers; a tier's points are deducted from its
+# group, groups combine their rules by "max" (one signal counts) or "sum" (capped),
+# and bonuses add points when every condition holds (a missing metric passes).
+# A JSON file with the same keys overrides rules/groups/bonuses by id, and its
+# "sites" map holds further overrides selected with --site.
+DEFAULT_HEALTH_RULES = {
+    "base": 100,
+    "groups": OrderedDict([
+        ("cpu", {"label": "CPU Health", "combine": "max"}),
+        ("memory", {"label": "Memory Health", "combine": "max"}),
+        ("io", {"label": "I/O Health", "combine": "max"}),
+        ("disk", {"label": "Disk Health", "combine": "sum", "cap": 15}),
+        ("disk_critical", {"label": "Disk Health", "combine": "max"}),
+        ("temperature", {"label": "Temperature Health", "combine": "sum", "cap": 12}),
+        ("process", {"label": "Process Health", "combine": "sum"}),
+    ]),
+    "rules": [
+        {"id": "cpu_stall", "metric": "cpu_stall_percent", "group": "cpu", "tiers": [
+            {"above": 5, "points": 5},
+            {"above": 10, "points": 10, "level": "NOTICE", "message": "CPU pressure elevated ({value}%)"},
+            {"above": 20, "points": 15, "level": "WARNING",
+             "message": "Tasks stalled on CPU {value}% of the last minute"},
+            {"above": 40, "points": 20, "level": "CRITICAL",
+             "message": "Tasks stalled on CPU {value}% of the last minute"}]},
+        {"id": "load_per_core", "metric": "load_per_core", "group": "cpu", "tiers": [
+            {"above": 0.8, "points": 5},
+            {"above": 1.0, "points": 10, "level": "NOTICE", "message": "Load {value} per core"},
+            {"above": 1.5, "points": 15, "level": "WARNING", "message": "Load {value} per core"},
+            {"above": 2.0, "points": 20, "level": "CRITICAL", "message": "Load {value} per core"}]},
+        {"id": "cpu_usage", "metric": "cpu_percent", "group": "cpu", "tiers": [
+            {"above": 60, "points": 5},
+            {"above": 70, "points": 10, "level": "NOTICE", "message": "CPU usage elevated"},
+            {"above": 80, "points": 15, "level": "WARNING", "message": "CPU usage high"},
+            {"above": 90, "points": 20, "level": "CRITICAL", "message": "CPU usage very high"}]},
+        {"id": "memory_usage", "metric": "memory_percent", "group": "memory", "tiers": [
+            {"above": 65, "points": 5},
+            {"above": 75, "points": 10, "level": "NOTICE", "message": "Memory usage elevated"},
+            {"above": 85, "points": 15, "level": "WARNING", "message": "Memory usage high"},
+            {"above": 95, "points": 20, "level": "CRITICAL", "message": "Memory usage very high"}]},
+        {"id": "memory_full_stall", "metric": "memory_full_stall_percent", "group": "memory", "tiers": [
+            {"above": 5, "points": 20, "level": "CRITICAL",
+             "message": "All tasks stalled on memory {value}% of the last minute"}]},
+        {"id": "memory_stall", "metric": "memory_stall_percent", "group": "memory", "tiers": [
+            {"above": 2, "points": 10, "level": "NOTICE", "message": "Memory pressure elevated ({value}%)"},
+            {"above": 10, "points": 15, "level": "WARNING",
+             "message": "Tasks stalled on memory {value}% of the last minute"}]},
+        {"id": "oom_kills", "metric": "oom_kills", "group": "memory", "tiers": [
+            {"above": 0, "points": 15, "level": "WARNING", "message": "{value} OOM kills {entity}"}]},
+        {"id": "direct_reclaim", "metric": "allocstall_rate", "group": "memory", "tiers": [
+            {"above": 1, "points": 10, "level": "NOTICE", "message": "Direct reclaim stalls {value}/s {entity}"}]},
+        {"id": "io_full_stall", "metric": "io_full_stall_percent", "group": "io", "tiers": [
+            {"above": 10, "points": 5, "level": "NOTICE", "message": "I/O pressure elevated ({value}%)"},
+            {"above": 25, "points": 10, "level": "WARNING",
+             "message": "All tasks stalled on I/O {value}% of the last minute"}]},
+        # Also the STORAGE ANALYSIS status tiers, see get_storage_status()
+        {"id": "disk_usage", "metric": "disk_usage_percent", "group": "disk", "tiers": [
+            {"above": 85, "points": 1, "level": "NOTICE", "message": "Disk {entity} at {value}%"},
+            {"above": 90, "points": 2, "level": "WARNING", "message": "Disk {entity} at {value}%"},
+            {"above": 95, "points": 3, "level": "CRITICAL", "message": "Disk {entity} at {value}%"}]},
+        {"id": "disk_critical", "metric": "disk_usage_percent", "group": "disk_critical", "tiers": [
+            {"above": 95, "points": 5}]},
+        {"id": "temperature", "metric": "temperature_celsius", "group": "temperature", "tiers": [
+            {"above": 65, "points": 1},
+            {"above": 75, "points": 2, "level": "WARNING", "message": "{entity} temperature {value}°C"},
+            {"above": 85, "points": 3, "level": "CRITICAL", "message": "{entity} temperature {value}°C"}]},
+        {"id": "zombies", "metric": "zombie_processes", "group": "process", "tiers": [
+            {"above": 0, "points": 4},
+            {"above": 5, "points": 8, "level": "WARNING", "message": "{value} zombie processes"}]},
+        {"id": "high_cpu_processes", "metric": "high_cpu_processes", "group": "process", "tiers": [
+            {"above": 3, "points": 7, "level": "NOTICE", "message": "{value} high-CPU processes"}]},
+    ],
+    "bonuses": [
+        {"id": "idle", "points": 5, "when": [
+            {"metric": "cpu_stall_percent", "below": 5},
+            {"metric": "load_per_core", "below": 0.7},
+            {"metric": "cpu_percent", "below": 30},
+            {"metric": "memory_percent", "below": 50}]},
+        {"id": "no_warnings", "points": 3, "no_warnings": True},
+    ],
+}
+HEALTH_LEVELS = ["NOTICE", "WARNING", "CRITICAL"]
+HEALTH_LEVEL_COLORS = {"HEALTHY": "green", "NOTICE": "yellow", "WARNING": "orange", "CRITICAL": "red"}
+
+
+def merge_by_id(items, overrides):
+    """Replace items whose id is overridden, append new ids, drop ids overridden with {"disabled": true}"""
+    merged = OrderedDict((item["id"], item) for item in items)
+    for item in overrides:
+        merged[item["id"]] = item
+    return [item for item in merged.values() if not item.get("disabled")]
+
+
+def merge_health_rules(spec, overrides):
+    groups = OrderedDict(spec["groups"])
+    groups.update(overrides.get("groups", {}))
+    return {
+        "base": overrides.get("base", spec["base"]),
+        "groups": groups,
+        "rules": merge_by_id(spec["rules"], overrides.get("rules", [])),
+        "bonuses": merge_by_id(spec["bonuses"], overrides.get("bonuses", [])),
+    }
+
+
+class MetricTable:
+    """Metric columns of (host index, entity, value) for one or many hosts.
+
+    A host contributes rows like ("disk_usage_percent", "/dev/sda1", 91.2);
+    scoring then walks each metric's column once for all hosts together.
+    """
 
-        # Process Health (15 points)
+    def __init__(self):
+        self.hosts = 0
+        self.columns = {}
+
+    def add_host(self, rows):
+        host = self.hosts
+        self.hosts += 1
+        for metric, entity, value in rows:
+            if value is None:
+                continue
+            column = self.columns.get(metric)
+            if column is None:
+                column = self.columns[metric] = ([], [], [])
+            column[0].append(host)
+            column[1].append(entity)
+            column[2].append(value)
+        return host
+
+
+class HealthRules:
+    """A rule spec compiled to sorted threshold arrays, evaluated column-wise with bisect"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.base = spec["base"]
+        self.groups = OrderedDict()
+        for name, group in spec["groups"].items():
+            if group.get("combine", "sum") not in ("sum", "max"):
+                raise ValueError(f"health group {name}: combine must be 'sum' or 'max'")
+            self.groups[name] = (group.get("label", name), group.get("combine", "sum"), group.get("cap"))
+
+        self.rules = []
+        self.by_id = {}
+        for rule in spec["rules"]:
+            if rule["group"] not in self.groups:
+                raise ValueError(f"health rule {rule['id']}: unknown group {rule['group']}")
+            directions = {"above" if "above" in tier else "below" for tier in rule["tiers"]}
+            if len(directions) != 1:
+                raise ValueError(f"health rule {rule['id']}: tiers must all use 'above' or all 'below'")
+            # "below" tiers are stored negated so both directions are one ascending bisect
+            sign = 1 if directions == {"above"} else -1
+            tiers = sorted(rule["tiers"], key=lambda tier: sign * tier.get("above", tier.get("below")))
+            for tier in tiers:
+                if tier.get("level") not in (None, *HEALTH_LEVELS):
+                    raise ValueError(f"health rule {rule['id']}: unknown level {tier.get('level')}")
+                if tier.get("message"):
+                    try:
+                        tier["message"].format(value=0.0, entity="")
+                    except (KeyError, IndexError, ValueError, AttributeError):
+                        raise ValueError(f"health rule {rule['id']}: message {tier['message']!r} "
+                                         f"may only use {{value}} and {{entity}}")
+            compiled = (rule["metric"], rule["group"], sign,
+                        [sign * tier.get("above", tier.get("below")) for tier in tiers],
+                        [(tier.get("points", 0), tier.get("level"), tier.get("message")) for tier in tiers])
+            self.rules.append(compiled)
+            self.by_id[rule["id"]] = compiled
+
+        self.bonuses = [(bonus.get("points", 0), bool(bonus.get("no_warnings")),
+                         [(condition["metric"], "above" in condition,
+                           condition.get("above", condition.get("below"))) for condition in bonus.get("when", [])])
+                        for bonus in spec["bonuses"]]
+
+    @classmethod
+    def load(cls, path=None, site=None):
+        """Defaults, then the rules file, then the file's overrides for `site`"""
+        spec = DEFAULT_HEALTH_RULES
+        if not path:
+            if site:
+                raise ValueError(f"site {site} given without a health rules file")
+            return cls(spec)
+        with open(path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
         try:
-            zombie_count = 0
-            high_cpu_processes = 0
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'status']):
-                try:
-                    info = proc.info
-                    if info['status'] == psutil.STATUS_ZOMBIE:
-                        zombie_count += 1
-                    if info.get('cpu_percent', 0) > 50:  # Processes using >50% CPU
-                        high_cpu_processes += 1
-                except:
+            spec = merge_health_rules(spec, overrides)
+            if site:
+                if site not in overrides.get("sites", {}):
+                    raise ValueError(f"site {site} is not defined in {path}")
+                spec = merge_health_rules(spec, overrides["sites"][site])
+            return cls(spec)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"malformed health rules in {path} ({type(e).__name__}: {e})")
+
+    def level(self, rule_id, value):
+        """The tier level `value` reaches in one rule ("HEALTHY" below every tier)"""
+        rule = self.by_id.get(rule_id)
+        if rule is None:
+            return "HEALTHY"
+        _, _, sign, thresholds, tiers = rule
+        tier = bisect.bisect_left(thresholds, sign * value)
+        return (tiers[tier - 1][1] or "HEALTHY") if tier else "HEALTHY"
+
+    def score_table(self, table):
+        """[(score, warnings)] per host of a MetricTable"""
+        points = {name: [0] * table.hosts for name in self.groups}
+        warnings = [[] for _ in range(table.hosts)]
+
+        for metric, group, sign, thresholds, tiers in self.rules:
+            column = table.columns.get(metric)
+            if not column:
+                continue
+            hosts, entities, values = column
+            # Tier index per row: how many thresholds the value exceeds
+            reached = [bisect.bisect_left(thresholds, sign * value) for value in values]
+            label, combine, _ = self.groups[group]
+            group_points = points[group]
+            for row, tier in enumerate(reached):
+                if not tier:
                     continue
+                host = hosts[row]
+                tier_points, level, message = tiers[tier - 1]
+                if combine == "max":
+                    group_points[host] = max(group_points[host], tier_points)
+                else:
+                    group_points[host] += tier_points
+                if message:
+                    text = message.format(value=values[row], entity=entities[row])
+                    warnings[host].append(f"[{label}]  {level}: {text}")
 
-            if zombie_count > 5:
-                score -= 8
-                warnings.append(f"[Process Health]  WARNING: {zombie_count} zombie processes")
-            elif zombie_count > 0:
-                score -= 4
+        scores = [self.base] * table.hosts
+        for name, (_, _, cap) in self.groups.items():
+            for host, group_points in enumerate(points[name]):
+                scores[host] -= group_points if cap is None else min(group_points, cap)
+
+        for bonus_points, no_warnings, conditions in self.bonuses:
+            failed = set()
+            for metric, above, threshold in conditions:
+                column = table.columns.get(metric)
+                if column:
+                    failed.update(host for host, value in zip(column[0], column[2])
+                                  if not (value > threshold if above else value < threshold))
+            for host in range(table.hosts):
+                if host not in failed and not (no_warnings and warnings[host]):
+                    scores[host] += bonus_points
+
+        return [(max(0, min(100, int(score))), host_warnings) for score, host_warnings in zip(scores, warnings)]
+
+    def score(self, rows):
+        """(score, warnings) for one host's metric rows"""
+        table = MetricTable()
+        table.add_host(rows)
+        return self.score_table(table)[0]
+
+
+health_rules_cache = {}
 
-            if high_cpu_processes > 3:
-                score -= 7
-                warnings.append(f"[Process Health]  NOTICE: {high_cpu_processes} high-CPU processes")
-        except:
-            pass
 
-        # Apply bonus for good conditions
-        if cpu_usage < 30 and memory.percent < 50:
-            score += 5  # Bonus for excellent performance
-        if len(warnings) == 0:
-            score += 3  # Bonus for no warnings
+def health_rules(path=None, site=None):
+    """Compiled rules for the configured (or given) file and site, compiled once per process.
 
+    An unreadable file or unknown site raises (OSError/ValueError) rather than
+    quietly scoring with the built-in thresholds; entry points check it up front.
+    """
+    path = path or Config.HEALTH_RULES_FILE
+    if path is None and os.path.exists(os.path.join(Config.CACHE_DIR, "health_rules.json")):
+        path = os.path.join(Config.CACHE_DIR, "health_rules.json")
+    site = site or Config.HEALTH_SITE
+    rules = health_rules_cache.get((path, site))
+    if rules is None:
+        rules = health_rules_cache[(path, site)] = HealthRules.load(path, site)
+    return rules
+
+
+# -------------------------------------------------------------------
+#  ENHANCED SYSTEM HEALTH SCORING ALGORITHMS
+# -------------------------------------------------------------------
+def get_health_metrics():
+    """The numbers health rules are evaluated against, as [metric, entity, value] rows"""
+    rows = []
+
+    try:
+        signals = get_collector_result("PRESSURE SIGNALS")
+        cpu_stall = pressure_average(signals, "cpu")
+        load_per_core = signals["load_per_core"][1] if signals["load_per_core"] else None
+        rows.append(["cpu_stall_percent", "", cpu_stall])
+        rows.append(["load_per_core", "", load_per_core])
+        if cpu_stall is None and load_per_core is None and "SAMPLING WINDOW" in collector_results:
+            # Without stall time or a load average, utilisation over an already-taken window stands in
+            rows.append(["cpu_percent", "", get_collector_result("SAMPLING WINDOW")["cpu_percent"]])
+
+        rows.append(["memory_percent", "", psutil.virtual_memory().percent])
+        rows.append(["memory_full_stall_percent", "", pressure_average(signals, "memory", "full")])
+        rows.append(["memory_stall_percent", "", pressure_average(signals, "memory")])
+        rows.append(["io_full_stall_percent", "", pressure_average(signals, "io", "full")])
+        reclaim = signals["reclaim"]
+        # Counters since boot would keep charging for an OOM kill weeks ago
+        if reclaim and not reclaim["since_boot"]:
+            period = f"in the last {reclaim['seconds']:.0f}s"
+            rows.append(["oom_kills", period, reclaim["oom_kill"]])
+            rows.append(["allocstall_rate", period, reclaim["rates"]["allocstall"]])
     except Exception as e:
-        print_status(f"Health score calculation error: {str(e)}", "WARNING")
-        warnings.append(f"Health calculation error: {str(e)}")
+        print_status(f"Health metrics error: {str(e)}", "WARNING")
+
+    for part in psutil.disk_partitions():
+        try:
+            # Skip CD-ROM and other non-writable drives
+            if 'cdrom' in part.opts or part.fstype == '':
+                continue
+            rows.append(["disk_usage_percent", part.device, psutil.disk_usage(part.mountpoint).percent])
+        except:
+            continue
+
+    try:
+        for name, entries in (psutil.sensors_temperatures() or {}).items():
+            for entry in entries:
+                rows.append(["temperature_celsius", name, entry.current])
+    except:
+        pass
 
-    # Ensure score is within bounds
-    final_score = max(0, min(100, score))
+    try:
+        zombie_count = 0
+        for info in get_collector_result("PROCESS SNAPSHOT"):
+            if info['status'] == psutil.STATUS_ZOMBIE:
+                zombie_count += 1
+        rows.append(["zombie_processes", "", zombie_count])
+        # Per-process CPU needs the sampling window; count it only when another section already took it
+        if "PROCESS CPU" in collector_results:
+            high_cpu_processes = sum(1 for percent in collector_results["PROCESS CPU"].values()
+                                     if percent > 50)  # Processes using >50% CPU
+            rows.append(["high_cpu_processes", "", high_cpu_processes])
+    except:
+        pass
+
+    return [row for row in rows if row[2] is not None]
+
+
+def get_system_health_score():
+    """Score this host's health metrics with the configured health rules; None if scoring failed"""
+    try:
+        final_score, warnings = health_rules().score(get_collector_result("HEALTH METRICS"))
+    except Exception as e:
+        print_status(f"Health score calculation error: {str(e)}", "ERROR")
+        return None
 
     # Log warnings if any
     if warnings and final_score < 80:
@@ -761,29 +2522,17 @@ def get_device_specifications():
         uptime = datetime.now() - datetime.fromtimestamp(boot_time)
         info["System Uptime"] = str(uptime).split('.')[0]
 
-        health_score = get_system_health_score()
-        info["System Health"] = f"{health_score}/100"
+        health_score = get_collector_result("HEALTH SCORE")
+        info["System Health"] = f"{health_score}/100" if health_score is not None else "N/A"
 
         # Additional system info for Windows
-        if platform.system() == "Windows":
-            try:
-                computer_info = run_cmd(
-                    "systeminfo | findstr /C:\"OS Name\" /C:\"OS Version\" /C:\"System Manufacturer\" /C:\"System Model\"")
-                for line in computer_info.split('\n'):
-                    if 'OS Name' in line:
-                        info["OS Name"] = line.split(':', 1)[1].strip()
-                    elif 'OS Version' in line:
-                        info["OS Version"] = line.split(':', 1)[1].strip()
-                    elif 'System Manufacturer' in line:
-                        info["Manufacturer"] = line.split(':', 1)[1].strip()
-                    elif 'System Model' in line:
-                        info["Model"] = line.split(':', 1)[1].strip()
-            except:
-                pass
+        try:
+            info.update(get_systeminfo_facts())
+        except:
+            pass
 
         # Add CPU core information
-        info["Physical Cores"] = psutil.cpu_count(logical=False)
-        info["Logical Cores"] = psutil.cpu_count(logical=True)
+        info["Physical Cores"], info["Logical Cores"] = get_cpu_core_counts()
 
     except Exception as e:
         print_status(f"System specs collection error: {str(e)}", "ERROR")
@@ -791,6 +2540,12 @@ def get_device_specifications():
     return [[k, v] for k, v in info.items()]
 
 
+def get_storage_status(percent):
+    """Map a partition usage percentage to its (status, color) tier from the disk_usage health rule"""
+    status = health_rules().level("disk_usage", percent)
+    return status, HEALTH_LEVEL_COLORS[status]
+
+
 def get_advanced_storage_details():
     print("\n\t", end='')
     print_status("Analyzing storage devices...", "SYSTEM")
@@ -805,18 +2560,7 @@ def get_advanced_storage_details():
             usage = psutil.disk_usage(part.mountpoint)
 
             # Determine health status based on usage
-            if usage.percent > 95:
-                status = "CRITICAL"
-                status_color = "red"
-            elif usage.percent > 90:
-                status = "WARNING"
-                status_color = "orange"
-            elif usage.percent > 85:
-                status = "NOTICE"
-                status_color = "yellow"
-            else:
-                status = "HEALTHY"
-                status_color = "green"
+            status, status_color = get_storage_status(usage.percent)
 
             disks.append({
                 "Device": part.device,
@@ -837,31 +2581,300 @@ def get_advanced_storage_details():
     return disks
 
 
+# -------------------------------------------------------------------
+#  STORAGE HOTSPOT FINDER (LARGEST DIRECTORIES AND FILES)
+# -------------------------------------------------------------------
+class StorageHotspotScanner:
+    """Parallel du-style walk of one filesystem.
+
+    Every worker thread owns a deque of pending directories, pops from its
+    own tail and steals from the head of the other deques when it runs dry.
+    The walk never crosses into another filesystem. Per-directory results
+    are cached by directory mtime, so a rescan only re-lists directories
+    whose entries changed (a file growing in place does not bump the
+    directory mtime and is picked up the next time that directory changes).
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, root, top_n=15, workers=8, cache_path=None):
+        self.root = os.path.abspath(root)
+        self.top_n = top_n
+        self.workers = max(1, workers)
+        self.cache_path = cache_path
+        self.old_cache = {}
+        self.device = None
+
+        self.queues = [deque() for _ in range(self.workers)]
+        self.dir_sizes = [{} for _ in range(self.workers)]
+        self.file_heaps = [[] for _ in range(self.workers)]
+        self.new_caches = [{} for _ in range(self.workers)]
+        self.listed = [0] * self.workers
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == self.CACHE_VERSION and data.get("root") == self.root:
+                self.old_cache = data.get("dirs", {})
+        except Exception:
+            self.old_cache = {}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        dirs = {}
+        for cache in self.new_caches:
+            dirs.update(cache)
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.CACHE_VERSION, "root": self.root, "dirs": dirs},
+                          f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print_status(f"Could not save hotspot cache: {str(e)}", "WARNING")
+
+    def _push(self, worker, path, st):
+        with self.lock:
+            self.pending += 1
+        self.queues[worker].append((path, st))
+
+    def _finish_one(self):
+        with self.lock:
+            self.pending -= 1
+            if self.pending == 0:
+                self.done.set()
+
+    def _next_task(self, worker):
+        try:
+            return self.queues[worker].pop()
+        except IndexError:
+            pass
+        for offset in range(1, self.workers):
+            try:
+                return self.queues[(worker + offset) % self.workers].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _offer_file(self, worker, size, path):
+        heap = self.file_heaps[worker]
+        if len(heap) < self.top_n:
+            heapq.heappush(heap, (size, path))
+        elif size > heap[0][0]:
+            heapq.heapreplace(heap, (size, path))
+
+    def _scan_directory(self, worker, path, st):
+        children = []
+        cached = self.old_cache.get(path)
+
+        if cached and cached[0] == st.st_mtime_ns:
+            _, own_bytes, top_files, subdirs = cached
+            for name in subdirs:
+                child = os.path.join(path, name)
+                try:
+                    child_st = os.stat(child, follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.S_ISDIR(child_st.st_mode) and child_st.st_dev == self.device:
+                    children.append((child, child_st))
+        else:
+            own_bytes = 0
+            local_files = []
+            subdirs = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                entry_st = entry.stat(follow_symlinks=False)
+                                # DirEntry.stat() reports st_dev 0 on Windows
+                                if entry_st.st_dev and entry_st.st_dev != self.device:
+                                    continue
+                                subdirs.append(entry.name)
+                                children.append((entry.path, entry_st))
+                            elif entry.is_file(follow_symlinks=False):
+                                size = entry.stat(follow_symlinks=False).st_size
+                                own_bytes += size
+                                if len(local_files) < self.top_n:
+                                    heapq.heappush(local_files, (size, entry.name))
+                                elif size > local_files[0][0]:
+                                    heapq.heapreplace(local_files, (size, entry.name))
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            self.listed[worker] += 1
+            top_files = [[size, name] for size, name in local_files]
+
+        self.new_caches[worker][path] = [st.st_mtime_ns, own_bytes, top_files, subdirs]
+        self.dir_sizes[worker][path] = own_bytes
+        for size, name in top_files:
+            self._offer_file(worker, size, os.path.join(path, name))
+        for child, child_st in children:
+            self._push(worker, child, child_st)
+
+    def _worker_loop(self, worker):
+        idle_spins = 0
+        while not self.done.is_set():
+            task = self._next_task(worker)
+            if task is None:
+                idle_spins += 1
+                time.sleep(0.0005 if idle_spins < 100 else 0.005)
+                continue
+            idle_spins = 0
+            try:
+                self._scan_directory(worker, *task)
+            finally:
+                self._finish_one()
+
+    def scan(self):
+        start_time = time.time()
+        root_st = os.stat(self.root)
+        self.device = root_st.st_dev
+        self._load_cache()
+
+        self._push(0, self.root, root_st)
+        threads = [threading.Thread(target=self._worker_loop, args=(i,), daemon=True)
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Roll directory sizes up from the deepest level to the root
+        totals = {}
+        for sizes in self.dir_sizes:
+            totals.update(sizes)
+        for path in sorted(totals, key=lambda p: p.count(os.sep), reverse=True):
+            if path != self.root:
+                parent = os.path.dirname(path)
+                if parent in totals:
+                    totals[parent] += totals[path]
+
+        top_dirs = heapq.nlargest(self.top_n, ((size, path) for path, size in totals.items()
+                                               if path != self.root))
+        top_files = heapq.nlargest(self.top_n, (item for heap in self.file_heaps for item in heap))
+
+        self._save_cache()
+        return {
+            "root": self.root,
+            "total_bytes": totals.get(self.root, 0),
+            "directories": top_dirs,
+            "files": top_files,
+            "dirs_scanned": len(totals),
+            "dirs_listed": sum(self.listed),
+            "elapsed": time.time() - start_time
+        }
+
+
+def get_storage_hotspots():
+    """Find the largest directories and files on nearly-full partitions"""
+    print("\n\t", end='')
+    print_status("Locating storage hotspots...", "SYSTEM")
+    hotspots = []
+
+    if not Config.STORAGE_HOTSPOTS:
+        print("\t", end='')
+        print_status("Storage hotspot scan disabled", "INFO")
+        return hotspots
+
+    mounts = list(Config.HOTSPOT_MOUNTS)
+    if not mounts:
+        for part in psutil.disk_partitions():
+            try:
+                if 'cdrom' in part.opts or part.fstype == '':
+                    continue
+                if get_storage_status(psutil.disk_usage(part.mountpoint).percent)[0] == "CRITICAL":
+                    mounts.append(part.mountpoint)
+            except:
+                continue
+
+    for mount in mounts:
+        try:
+            cache_name = f"hotspots_{hashlib.sha1(os.path.abspath(mount).encode()).hexdigest()[:12]}.json"
+            scanner = StorageHotspotScanner(mount, Config.HOTSPOT_TOP_N, Config.HOTSPOT_WORKERS,
+                                            os.path.join(Config.CACHE_DIR, cache_name))
+            result = scanner.scan()
+            used = result["total_bytes"] or 1
+
+            for kind, items in (("DIRECTORY", result["directories"]), ("FILE", result["files"])):
+                for size, path in items:
+                    hotspots.append({
+                        "Mountpoint": mount,
+                        "Type": kind,
+                        "Path": path,
+                        "Size": format_bytes(size),
+                        "Share of Scanned": f"{size / used * 100:.1f}%"
+                    })
+
+            print("\t", end='')
+            print_status(f"{mount}: {result['dirs_scanned']:,} directories "
+                         f"({result['dirs_listed']:,} re-listed) in {result['elapsed']:.1f}s", "DATA")
+        except Exception as e:
+            print_status(f"Hotspot scan of {mount} failed: {str(e)}", "ERROR")
+
+    print("\t", end='')
+    print_status(f"Storage hotspot scan completed for {len(mounts)} mounts", "SUCCESS")
+    return hotspots
+
+
+def get_gpu_utilization():
+    """GPU busy percentage, VRAM use, clocks and sensors sampled over the shared window"""
+    print("\n\t", end='')
+    print_status("Sampling GPU utilization...", "SYSTEM")
+    gpu_usage = []
+
+    if get_scan_platform() == "Linux":
+        try:
+            gpu_usage = get_linux_gpu_utilization()
+            print("\t", end='')
+            print_status(f"Sampled {len(gpu_usage)} GPUs over "
+                         f"{get_collector_result('SAMPLING WINDOW')['seconds']}s", "SUCCESS")
+        except Exception as e:
+            print_status(f"GPU utilization sampling failed: {str(e)}", "ERROR")
+
+    return gpu_usage if gpu_usage else [
+        {"GPU": "No GPU utilization counters available", "Details": "Requires a DRM driver exposing sysfs statistics"}]
+
+
 def get_comprehensive_graphics_info():
     print("\n\t", end='')
     print_status("Collecting graphics card information...", "SYSTEM")
     gpu_info = []
 
-    if platform.system() == "Windows":
+    if get_scan_platform() == "Windows":
         try:
-            output = run_cmd(
-                "wmic path win32_videocontroller get name, adapterram, driverversion, videoprocessor, videomodedescription /format:csv")
-            if output and "No Instance" not in output:
-                lines = output.split('\n')
-                for line in lines:
-                    if ',' in line and 'Node' not in line:
-                        parts = line.split(',')
-                        if len(parts) >= 5:
-                            gpu_info.append({
-                                "Graphics Card": parts[2],
-                                "Adapter RAM": f"{int(parts[3]) / (1024 ** 3):.2f} GB" if parts[
-                                    3].strip().isdigit() else "UNKNOWN",
-                                "Driver Version": parts[4],
-                                "Video Processor": parts[5] if len(parts) > 5 else "UNKNOWN",
-                                "Current Resolution": parts[6] if len(parts) > 6 else "UNKNOWN"
-                            })
-                print("\t", end='')
-                print_status(f"Found {len(gpu_info)} graphics cards", "SUCCESS")
+            for row in iter_command_csv(
+                    "wmic path win32_videocontroller get name, adapterram, driverversion, videoprocessor, videomodedescription /format:csv",
+                    "Graphics query"):
+                if not row.get("name"):
+                    continue
+                adapter_ram = row.get("adapterram", "")
+                gpu_info.append({
+                    "Graphics Card": row["name"],
+                    "Adapter RAM": f"{int(adapter_ram) / (1024 ** 3):.2f} GB" if adapter_ram.isdigit() else "UNKNOWN",
+                    "Driver Version": row.get("driverversion") or "UNKNOWN",
+                    "Video Processor": row.get("videoprocessor") or "UNKNOWN",
+                    "Current Resolution": row.get("videomodedescription") or "UNKNOWN"
+                })
+            print("\t", end='')
+            print_status(f"Found {len(gpu_info)} graphics cards", "SUCCESS")
+        except Exception as e:
+            print_status(f"GPU information collection failed: {str(e)}", "ERROR")
+
+    elif get_scan_platform() == "Linux":
+        try:
+            gpu_info = get_linux_graphics_adapters()
+            print("\t", end='')
+            print_status(f"Found {len(gpu_info)} graphics adapters", "SUCCESS")
         except Exception as e:
             print_status(f"GPU information collection failed: {str(e)}", "ERROR")
 
@@ -935,7 +2948,7 @@ def get_comprehensive_wifi_analysis():
     print_status("Scanning WiFi networks...", "SYSTEM")
     wifi_info = []
 
-    if platform.system() == "Windows":
+    if get_scan_platform() == "Windows":
         try:
             profiles_output = run_cmd("netsh wlan show profiles")
             profiles = []
@@ -1012,58 +3025,664 @@ def get_advanced_system_details():
         advanced_info.append({"Category": "MEMORY_TOTAL", "Detail": f"{memory.total / (1024 ** 3):.2f} GB"})
         advanced_info.append({"Category": "MEMORY_AVAILABLE", "Detail": f"{memory.available / (1024 ** 3):.2f} GB"})
 
-        # CPU details
-        advanced_info.append({"Category": "CPU_PHYSICAL_CORES", "Detail": psutil.cpu_count(logical=False)})
-        advanced_info.append({"Category": "CPU_LOGICAL_CORES", "Detail": psutil.cpu_count(logical=True)})
+        # CPU details
+        physical_cores, logical_cores = get_cpu_core_counts()
+        advanced_info.append({"Category": "CPU_PHYSICAL_CORES", "Detail": physical_cores})
+        advanced_info.append({"Category": "CPU_LOGICAL_CORES", "Detail": logical_cores})
+
+        # Process information
+        processes = len(psutil.pids())
+        advanced_info.append({"Category": "RUNNING_PROCESSES", "Detail": processes})
+
+        # Disk information
+        total_disk_space = 0
+        for part in psutil.disk_partitions():
+            try:
+                usage = psutil.disk_usage(part.mountpoint)
+                total_disk_space += usage.total
+            except:
+                continue
+        advanced_info.append({"Category": "TOTAL_DISK_SPACE", "Detail": f"{total_disk_space / (1024 ** 4):.2f} TB"})
+
+        # Windows-specific advanced details
+        if get_scan_platform() == "Windows":
+            try:
+                # Same per-boot facts as HARDWARE DETAILS, so each query runs once
+                system_uuid = get_system_uuid()
+                if system_uuid:
+                    advanced_info.append({"Category": "SYSTEM_UUID", "Detail": system_uuid})
+
+                bios = get_bios_info()
+                if bios:
+                    advanced_info.append({"Category": "BIOS_MANUFACTURER", "Detail": bios["manufacturer"] or "N/A"})
+                    advanced_info.append({"Category": "BIOS_VERSION", "Detail": bios["version"] or "N/A"})
+
+            except Exception as e:
+                advanced_info.append({"Category": "WINDOWS_ADVANCED_ERROR", "Detail": str(e)})
+
+        print("\t", end='')
+        print_status("Advanced system details collected", "SUCCESS")
+
+    except Exception as e:
+        print_status(f"Advanced details collection failed: {str(e)}", "ERROR")
+
+    return advanced_info
+
+
+# -------------------------------------------------------------------
+#  LINUX NATIVE SOURCES - PROCFS, SYSFS, SYSTEMD, DPKG AND THE JOURNAL
+# -------------------------------------------------------------------
+SYSTEMD_SERVICE_PROPERTIES = "Id,Description,ActiveState,SubState,UnitFileState,MainPID,ExecStart"
+
+
+def read_sysfs(path, default=None):
+    """First line of a procfs/sysfs attribute, or default when absent or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.readline().strip()
+    except OSError:
+        return default
+
+
+def get_linux_services():
+    """Every systemd service: unit names from two listings, properties from one batched systemctl show"""
+    names = OrderedDict()
+    for line in run_cmd("systemctl list-units --type=service --all --no-legend --plain --no-pager",
+                        task_name="Unit listing").split('\n'):
+        if line.split() and line.split()[0].endswith('.service'):
+            names[line.split()[0]] = None
+    for line in run_cmd("systemctl list-unit-files --type=service --no-legend --no-pager",
+                        task_name="Unit file listing").split('\n'):
+        parts = line.split()
+        if parts and parts[0].endswith('.service') and not parts[0].endswith('@.service'):
+            names[parts[0]] = None
+    if not names:
+        return []
+
+    output = run_cmd(f"systemctl show --no-pager -p {SYSTEMD_SERVICE_PROPERTIES} "
+                     + " ".join(shlex.quote(name) for name in names),
+                     task_name="Unit properties")
+    services = []
+    for block in output.split('\n\n'):
+        unit = dict(line.split('=', 1) for line in block.split('\n') if '=' in line)
+        if not unit.get("Id"):
+            continue
+        argv = re.search(r"argv\[\]=([^;]*)", unit.get("ExecStart", ""))
+        services.append({
+            "Service Name": unit["Id"],
+            "Display Name": unit.get("Description", "N/A"),
+            "Status": unit.get("SubState") or unit.get("ActiveState", "N/A"),
+            "Startup Type": unit.get("UnitFileState") or "N/A",
+            "PID": int(unit["MainPID"]) if unit.get("MainPID", "0").isdigit() and unit["MainPID"] != "0" else "N/A",
+            "Binary Path": argv.group(1).strip()[:500] if argv else "N/A"
+        })
+    return services
+
+
+def get_linux_kernel_modules():
+    """Loaded kernel modules from /proc/modules, with versions from /sys/module"""
+    modules = []
+    try:
+        with open("/proc/modules", 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 5:
+                    continue
+                name, size, refcount, dependencies, state = parts[:5]
+                modules.append({
+                    "Module Name": name,
+                    "Size": format_bytes(int(size)) if size.isdigit() else size,
+                    "Used By": refcount,
+                    "Dependencies": dependencies.strip(',').replace(',', ', ') if dependencies != '-' else "None",
+                    "State": state,
+                    "Version": read_sysfs(f"/sys/module/{name}/version", "N/A")
+                })
+    except OSError:
+        pass
+    return modules
+
+
+def get_journal_errors(count=10):
+    """Newest error-priority journal entries"""
+    events = []
+    for line in run_cmd(f"journalctl -p err -n {count} -o json --no-pager", task_name="Journal query").split('\n'):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        message = entry.get("MESSAGE", "")
+        if isinstance(message, list):  # non-UTF-8 messages are serialized as byte arrays
+            message = bytes(message).decode('utf-8', errors='ignore')
+        stamp = entry.get("__REALTIME_TIMESTAMP", "")
+        when = datetime.fromtimestamp(int(stamp) / 1e6).strftime('%Y-%m-%d %H:%M:%S') if stamp.isdigit() else "N/A"
+        source = entry.get("SYSLOG_IDENTIFIER") or entry.get("_COMM") or "kernel"
+        details = f"{when} {source}: {message}"
+        events.append({
+            "Event Type": "System Error",
+            "Details": details[:400] + "..." if len(details) > 400 else details
+        })
+    return events
+
+
+def get_linux_security_features():
+    """MAC, ASLR and kernel hardening state from sysfs and procfs"""
+    features = []
+
+    enforce = read_sysfs("/sys/fs/selinux/enforce")
+    features.append({"Security Feature": "SELINUX_STATUS",
+                     "Status": {"1": "Enforcing", "0": "Permissive"}.get(enforce, "Disabled")})
+
+    apparmor = read_sysfs("/sys/module/apparmor/parameters/enabled")
+    status = "Enabled" if apparmor == "Y" else "Disabled"
+    try:
+        with open("/sys/kernel/security/apparmor/profiles", 'r') as f:
+            profiles = [line for line in f if line.strip()]
+        status += f" ({len(profiles)} profiles, {sum('(enforce)' in line for line in profiles)} enforcing)"
+    except OSError:
+        pass
+    features.append({"Security Feature": "APPARMOR_STATUS", "Status": status})
+
+    aslr = read_sysfs("/proc/sys/kernel/randomize_va_space")
+    features.append({"Security Feature": "ASLR_STATUS",
+                     "Status": {"2": "Full", "1": "Partial", "0": "Disabled"}.get(aslr, "Unknown")})
+
+    lockdown = read_sysfs("/sys/kernel/security/lockdown")
+    if lockdown:
+        selected = re.search(r"\[(\w+)\]", lockdown)
+        features.append({"Security Feature": "KERNEL_LOCKDOWN", "Status": selected.group(1) if selected else lockdown})
+
+    for setting in ("kptr_restrict", "dmesg_restrict"):
+        value = read_sysfs(f"/proc/sys/kernel/{setting}")
+        if value is not None:
+            features.append({"Security Feature": setting.upper(), "Status": "Enabled" if value != "0" else "Disabled"})
+    return features
+
+
+def get_linux_power_supplies():
+    """Batteries, AC adapters and the CPU frequency governor from sysfs"""
+    power_info = []
+    root = "/sys/class/power_supply"
+    try:
+        supplies = sorted(os.listdir(root))
+    except OSError:
+        supplies = []
+
+    for supply in supplies:
+        path = os.path.join(root, supply)
+        supply_type = read_sysfs(f"{path}/type")
+        if supply_type == "Mains":
+            power_info.append({"Power Setting": "POWER_SOURCE",
+                               "Value": "Plugged In" if read_sysfs(f"{path}/online") == "1" else "Battery"})
+        elif supply_type == "Battery":
+            power_info.append({"Power Setting": f"{supply}_PERCENTAGE", "Value": f"{read_sysfs(f'{path}/capacity', '?')}%"})
+            power_info.append({"Power Setting": f"{supply}_STATUS", "Value": read_sysfs(f"{path}/status", "Unknown")})
+            full = read_sysfs(f"{path}/energy_full") or read_sysfs(f"{path}/charge_full")
+            design = read_sysfs(f"{path}/energy_full_design") or read_sysfs(f"{path}/charge_full_design")
+            if full and design and full.isdigit() and design.isdigit() and int(design):
+                power_info.append({"Power Setting": f"{supply}_HEALTH",
+                                   "Value": f"{int(full) / int(design) * 100:.1f}% of design capacity"})
+            cycles = read_sysfs(f"{path}/cycle_count")
+            if cycles and cycles != "0":
+                power_info.append({"Power Setting": f"{supply}_CYCLE_COUNT", "Value": cycles})
+
+    governor = read_sysfs("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor")
+    if governor:
+        power_info.append({"Power Setting": "CPU_FREQUENCY_GOVERNOR", "Value": governor})
+    profile = read_sysfs("/sys/firmware/acpi/platform_profile")
+    if profile:
+        power_info.append({"Power Setting": "ACTIVE_POWER_PLAN", "Value": profile})
+    return power_info
+
+
+# -------------------------------------------------------------------
+#  LINUX HARDWARE FROM SYSFS - DMI, PCI AND USB WITHOUT DMIDECODE/LSPCI
+# -------------------------------------------------------------------
+SYSFS_ROOT = "/sys"
+PCI_IDS_PATHS = ["/usr/share/hwdata/pci.ids", "/usr/share/misc/pci.ids", "/usr/share/pci.ids"]
+USB_IDS_PATHS = ["/usr/share/hwdata/usb.ids", "/usr/share/misc/usb.ids", "/var/lib/usbutils/usb.ids"]
+# Attributes under /sys/class/dmi/id; serials and the UUID are root-only and simply come back empty
+DMI_FIELDS = ["bios_vendor", "bios_version", "bios_date", "bios_release", "board_vendor", "board_name",
+              "board_version", "board_serial", "sys_vendor", "product_name", "product_version",
+              "product_serial", "product_uuid", "chassis_vendor", "chassis_type"]
+PCI_DISPLAY_CLASS = 0x03
+
+
+class HardwareIdIndex:
+    """Name lookups in a memory-mapped pci.ids/usb.ids database.
+
+    Loading maps the file and records only where each vendor's block and the
+    device class section start; device and class names are then found by
+    searching inside that one block, so nothing else of the file is parsed.
+    """
+
+    # Anchored on the preceding newline rather than ^ with re.M, which is several times slower
+    VENDOR_LINE = re.compile(rb'\n([0-9a-f]{4})  ([^\n]*)')
+    CLASS_LINE = re.compile(rb'\nC ([0-9a-f]{2})  ([^\n]*)')
+    FIRST_VENDOR_LINE = re.compile(rb'([0-9a-f]{4})  ([^\n]*)')
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.vendors = {}
+        self.classes = {}
+        # The class section follows the vendors; stop vendor scanning where it begins.
+        # Only offsets are kept here: names are decoded when they are looked up.
+        first_class = self.CLASS_LINE.search(self.data)
+        vendors_end = first_class.start() if first_class else len(self.data)
+        previous = None
+        first_vendor = self.FIRST_VENDOR_LINE.match(self.data)
+        for match in itertools.chain([first_vendor] if first_vendor else [],
+                                     self.VENDOR_LINE.finditer(self.data, 0, vendors_end)):
+            if previous:
+                self.vendors[previous.group(1)] = (previous.start(2), previous.end(2), match.start())
+            previous = match
+        if previous:
+            self.vendors[previous.group(1)] = (previous.start(2), previous.end(2), vendors_end)
+        if first_class:
+            matches = list(self.CLASS_LINE.finditer(self.data, vendors_end))
+            for index, match in enumerate(matches):
+                end = matches[index + 1].start() if index + 1 < len(matches) else len(self.data)
+                self.classes[match.group(1)] = (match.start(2), match.end(2), end)
+
+    @staticmethod
+    def _child(data, start, end, code, depth=1):
+        marker = b"\n" + b"\t" * depth + code.encode() + b"  "
+        position = data.find(marker, start, end)
+        if position < 0:
+            return None
+        line_end = data.find(b"\n", position + len(marker), end)
+        return data[position + len(marker):line_end if line_end >= 0 else end].decode('utf-8', 'ignore').strip()
+
+    def _name(self, entry):
+        return self.data[entry[0]:entry[1]].decode('utf-8', 'ignore').strip()
+
+    def vendor(self, vendor_id):
+        entry = self.vendors.get(vendor_id.lower().encode())
+        return self._name(entry) if entry else None
+
+    def device(self, vendor_id, device_id):
+        entry = self.vendors.get(vendor_id.lower().encode())
+        return self._child(self.data, entry[1], entry[2], device_id.lower()) if entry else None
+
+    def device_class(self, class_id, subclass_id=None):
+        entry = self.classes.get(class_id.lower().encode())
+        if not entry:
+            return None
+        if subclass_id:
+            return self._child(self.data, entry[1], entry[2], subclass_id.lower()) or self._name(entry)
+        return self._name(entry)
+
+
+_hardware_id_indexes = {}
+
+
+def get_hardware_id_index(paths):
+    """Shared HardwareIdIndex for the first existing database in paths, or None"""
+    for path in paths:
+        if path in _hardware_id_indexes:
+            return _hardware_id_indexes[path]
+        if os.path.exists(path):
+            try:
+                _hardware_id_indexes[path] = HardwareIdIndex(path)
+            except (OSError, ValueError):
+                _hardware_id_indexes[path] = None
+            return _hardware_id_indexes[path]
+    return None
+
+
+def read_dmi_info():
+    """Readable /sys/class/dmi/id attributes (empty on hosts without SMBIOS)"""
+    info = {}
+    for field in DMI_FIELDS:
+        value = read_sysfs(os.path.join(SYSFS_ROOT, "class", "dmi", "id", field))
+        if value and value.lower() not in ("", "none", "default string", "to be filled by o.e.m."):
+            info[field] = value
+    return info
+
+
+def read_sysfs_link_name(path):
+    try:
+        return os.path.basename(os.readlink(path))
+    except OSError:
+        return None
+
+
+def iter_pci_devices():
+    """PCI functions from /sys/bus/pci/devices with names resolved through pci.ids"""
+    root = os.path.join(SYSFS_ROOT, "bus", "pci", "devices")
+    index = get_hardware_id_index(PCI_IDS_PATHS)
+    try:
+        slots = sorted(os.listdir(root))
+    except OSError:
+        return
+    for slot in slots:
+        path = os.path.join(root, slot)
+        vendor_id = (read_sysfs(os.path.join(path, "vendor")) or "").replace("0x", "")
+        device_id = (read_sysfs(os.path.join(path, "device")) or "").replace("0x", "")
+        class_code = (read_sysfs(os.path.join(path, "class")) or "").replace("0x", "").rjust(6, "0")
+        if not vendor_id or not device_id:
+            continue
+        yield {
+            "slot": slot,
+            "path": path,
+            "vendor_id": vendor_id,
+            "device_id": device_id,
+            "class_code": int(class_code, 16) if re.fullmatch(r"[0-9a-fA-F]{6}", class_code) else 0,
+            "vendor": (index and index.vendor(vendor_id)) or f"Vendor {vendor_id}",
+            "device": (index and index.device(vendor_id, device_id)) or f"Device {device_id}",
+            "class": (index and index.device_class(class_code[:2], class_code[2:4])) or f"Class {class_code[:4]}",
+            "driver": read_sysfs_link_name(os.path.join(path, "driver")),
+        }
+
+
+def iter_usb_devices():
+    """USB devices (not interfaces) from /sys/bus/usb/devices, names from the device or usb.ids"""
+    root = os.path.join(SYSFS_ROOT, "bus", "usb", "devices")
+    index = get_hardware_id_index(USB_IDS_PATHS)
+    try:
+        entries = sorted(os.listdir(root))
+    except OSError:
+        return
+    for entry in entries:
+        path = os.path.join(root, entry)
+        vendor_id = read_sysfs(os.path.join(path, "idVendor"))
+        product_id = read_sysfs(os.path.join(path, "idProduct"))
+        if not vendor_id or not product_id:
+            continue
+        device_class = read_sysfs(os.path.join(path, "bDeviceClass"), "00")
+        yield {
+            "port": entry,
+            "vendor_id": vendor_id,
+            "product_id": product_id,
+            "vendor": (read_sysfs(os.path.join(path, "manufacturer"))
+                       or (index and index.vendor(vendor_id)) or f"Vendor {vendor_id}"),
+            "product": (read_sysfs(os.path.join(path, "product"))
+                        or (index and index.device(vendor_id, product_id)) or f"Product {product_id}"),
+            "class": (index and device_class != "00" and index.device_class(device_class)) or None,
+            "speed": read_sysfs(os.path.join(path, "speed")),
+        }
+
+
+def get_linux_hardware_rows():
+    """PCI and USB inventory rows for HARDWARE DETAILS"""
+    hardware = []
+    for device in iter_pci_devices():
+        driver = f" (driver: {device['driver']})" if device["driver"] else ""
+        hardware.append({"Category": "PCI_DEVICE",
+                         "Detail": f"{device['slot']} {device['class']}: {device['vendor']} {device['device']} "
+                                   f"[{device['vendor_id']}:{device['device_id']}]{driver}"})
+    for device in iter_usb_devices():
+        speed = f", {device['speed']} Mb/s" if device["speed"] else ""
+        device_class = f" {device['class']}:" if device["class"] else ""
+        hardware.append({"Category": "USB_DEVICE",
+                         "Detail": f"{device['port']}{device_class} {device['vendor']} {device['product']} "
+                                   f"[{device['vendor_id']}:{device['product_id']}]{speed}"})
+    return hardware
+
+
+def get_linux_graphics_adapters():
+    """Display-class PCI devices as GRAPHICS CARD INFORMATION rows"""
+    adapters = []
+    for device in iter_pci_devices():
+        if device["class_code"] >> 16 != PCI_DISPLAY_CLASS:
+            continue
+        driver = device["driver"]
+        driver_version = read_sysfs(os.path.join(SYSFS_ROOT, "module", driver, "version")) if driver else None
+        vram_total = read_sysfs_int(os.path.join(device["path"], "mem_info_vram_total"))
+        adapters.append({
+            "Graphics Card": f"{device['vendor']} {device['device']}",
+            "Adapter RAM": f"{vram_total / (1024 ** 3):.2f} GB" if vram_total else "UNKNOWN",
+            "Driver Version": f"{driver} {driver_version}" if driver and driver_version else driver or "UNKNOWN",
+            "Video Processor": device["class"],
+            "Current Resolution": "UNKNOWN"
+        })
+    return adapters
+
+
+def list_drm_cards():
+    """DRM GPUs (/sys/class/drm/cardN, not their connectors) with their PCI identity"""
+    root = os.path.join(SYSFS_ROOT, "class", "drm")
+    index = get_hardware_id_index(PCI_IDS_PATHS)
+    try:
+        names = sorted(name for name in os.listdir(root) if re.fullmatch(r"card\d+", name))
+    except OSError:
+        return []
+    cards = []
+    for name in names:
+        path = os.path.join(root, name)
+        device = os.path.join(path, "device")
+        vendor_id = (read_sysfs(os.path.join(device, "vendor")) or "").replace("0x", "")
+        device_id = (read_sysfs(os.path.join(device, "device")) or "").replace("0x", "")
+        cards.append({
+            "card": name,
+            "path": path,
+            "device": device,
+            "slot": read_sysfs_link_name(device),
+            "name": " ".join(filter(None, [(index and index.vendor(vendor_id)) or (vendor_id and f"Vendor {vendor_id}"),
+                                           (index and index.device(vendor_id, device_id))
+                                           or (device_id and f"Device {device_id}")])) or name,
+            "driver": read_sysfs_link_name(os.path.join(device, "driver")),
+        })
+    return cards
+
+
+def read_sysfs_int(path):
+    value = read_sysfs(path)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def read_drm_busy_percent(card):
+    """Instantaneous engine busy percentage (amdgpu)"""
+    return read_sysfs_int(os.path.join(card["device"], "gpu_busy_percent"))
+
+
+def read_drm_idle_ms(card):
+    """Cumulative RC6 idle residency in ms (i915)"""
+    for path in (os.path.join(card["path"], "power", "rc6_residency_ms"),
+                 os.path.join(card["path"], "gt", "gt0", "rc6_residency_ms")):
+        value = read_sysfs_int(path)
+        if value is not None:
+            return value
+    return None
+
+
+def read_dpm_level(path):
+    """Active level of an amdgpu pp_dpm_* table ("1: 1800Mhz *")"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                if line.rstrip().endswith('*'):
+                    return line.split(':', 1)[-1].replace('*', '').strip()
+    except OSError:
+        pass
+    return None
+
+
+def read_drm_hwmon(card):
+    """(temperature in C, power in W) from the GPU's hwmon node, where exposed"""
+    temperature = power = None
+    hwmon_root = os.path.join(card["device"], "hwmon")
+    try:
+        hwmons = sorted(os.listdir(hwmon_root))
+    except OSError:
+        return temperature, power
+    for hwmon in hwmons:
+        path = os.path.join(hwmon_root, hwmon)
+        millidegrees = read_sysfs_int(os.path.join(path, "temp1_input"))
+        microwatts = read_sysfs_int(os.path.join(path, "power1_average"))
+        if microwatts is None:
+            microwatts = read_sysfs_int(os.path.join(path, "power1_input"))
+        if millidegrees is not None and temperature is None:
+            temperature = millidegrees / 1000
+        if microwatts is not None and power is None:
+            power = microwatts / 1e6
+    return temperature, power
+
+
+def read_drm_state(card):
+    """VRAM, clocks, temperature and power for one DRM card; missing attributes are None"""
+    device = card["device"]
+    temperature, power = read_drm_hwmon(card)
+    core_clock = read_dpm_level(os.path.join(device, "pp_dpm_sclk"))
+    if core_clock is None:
+        mhz = read_sysfs_int(os.path.join(card["path"], "gt_act_freq_mhz"))
+        if mhz is None:
+            mhz = read_sysfs_int(os.path.join(card["path"], "gt_cur_freq_mhz"))
+        core_clock = f"{mhz}Mhz" if mhz is not None else None
+    return {
+        "vram_total": read_sysfs_int(os.path.join(device, "mem_info_vram_total")),
+        "vram_used": read_sysfs_int(os.path.join(device, "mem_info_vram_used")),
+        "memory_busy": read_sysfs_int(os.path.join(device, "mem_busy_percent")),
+        "core_clock": core_clock,
+        "memory_clock": read_dpm_level(os.path.join(device, "pp_dpm_mclk")),
+        "temperature": temperature,
+        "power": power,
+    }
+
+
+def get_linux_gpu_utilization():
+    """One row per DRM card: busy % over the shared window plus point-in-time VRAM, clocks and sensors"""
+    window = get_collector_result("SAMPLING WINDOW")
+    rows = []
+    for card in list_drm_cards():
+        state = read_drm_state(card)
+        usage = window["gpus"].get(card["card"], {})
+        busy = "N/A"
+        if usage.get("busy_avg") is not None:
+            busy = f"{usage['busy_avg']}%"
+            if usage.get("busy_max") is not None:
+                busy += f" (peak {usage['busy_max']}%)"
+        vram = "N/A"
+        if state["vram_total"]:
+            vram = f"{format_bytes(state['vram_used'] or 0)} / {format_bytes(state['vram_total'])}"
+            if state["vram_used"] is not None:
+                vram += f" ({state['vram_used'] / state['vram_total'] * 100:.1f}%)"
+        rows.append({
+            "GPU": f"{card['card']}: {card['name']}",
+            "Driver": card["driver"] or "N/A",
+            "Utilization": busy,
+            "Memory Busy": f"{state['memory_busy']}%" if state["memory_busy"] is not None else "N/A",
+            "VRAM Used": vram,
+            "Core Clock": state["core_clock"] or "N/A",
+            "Memory Clock": state["memory_clock"] or "N/A",
+            "Temperature": f"{state['temperature']:.1f}°C" if state["temperature"] is not None else "N/A",
+            "Power": f"{state['power']:.1f} W" if state["power"] is not None else "N/A",
+        })
+    return rows
 
-        # Process information
-        processes = len(psutil.pids())
-        advanced_info.append({"Category": "RUNNING_PROCESSES", "Detail": processes})
 
-        # Disk information
-        total_disk_space = 0
-        for part in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(part.mountpoint)
-                total_disk_space += usage.total
-            except:
-                continue
-        advanced_info.append({"Category": "TOTAL_DISK_SPACE", "Detail": f"{total_disk_space / (1024 ** 4):.2f} TB"})
+# -------------------------------------------------------------------
+#  INSTALLED PACKAGE DATABASES - DPKG STATUS AND RPM SQLITE
+# -------------------------------------------------------------------
+DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+RPM_SQLITE_PATH = "/var/lib/rpm/rpmdb.sqlite"
+DPKG_FIELDS = {"Package", "Status", "Version", "Maintainer", "Architecture"}
+# Header tags: NAME, VERSION, RELEASE, EPOCH, INSTALLTIME, VENDOR, ARCH
+RPM_TAGS = {1000: "name", 1001: "version", 1002: "release", 1003: "epoch",
+            1008: "installtime", 1011: "vendor", 1022: "arch"}
+RPM_INT32, RPM_STRING, RPM_STRING_ARRAY, RPM_I18NSTRING = 4, 6, 8, 9
+
+
+def iter_dpkg_status(status_path=DPKG_STATUS_PATH):
+    """Stream installed packages from the dpkg status database one paragraph at a time"""
+    fields = {}
+    with open(status_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in itertools.chain(f, ('\n',)):
+            if line == '\n':
+                if fields.get("Package") and fields.get("Status", "").endswith(" installed"):
+                    yield {
+                        "Software Name": fields["Package"],
+                        "Version": fields.get("Version", "Unknown"),
+                        "Publisher": fields.get("Maintainer", "Unknown"),
+                        "Architecture": fields.get("Architecture", "Unknown")
+                    }
+                fields = {}
+            elif line[0] not in ' \t':
+                key, _, value = line.partition(':')
+                if key in DPKG_FIELDS:
+                    fields[key] = value.strip()
+
+
+def parse_rpm_header(blob):
+    """Pull the RPM_TAGS values out of an on-disk rpm header blob (index entries + data store)"""
+    index_count, data_length = struct.unpack_from('>II', blob, 0)
+    data_start = 8 + index_count * 16
+    header = {}
+    for entry in range(index_count):
+        tag, tag_type, offset, count = struct.unpack_from('>iIiI', blob, 8 + entry * 16)
+        if tag not in RPM_TAGS:
+            continue
+        position = data_start + offset
+        if tag_type == RPM_INT32:
+            header[RPM_TAGS[tag]] = struct.unpack_from('>i', blob, position)[0]
+        elif tag_type in (RPM_STRING, RPM_STRING_ARRAY, RPM_I18NSTRING):
+            header[RPM_TAGS[tag]] = bytes(blob[position:blob.find(b'\0', position)]).decode('utf-8', errors='ignore')
+    return header
 
-        # Windows-specific advanced details
-        if platform.system() == "Windows":
-            try:
-                # Get system UUID
-                output = run_cmd("wmic csproduct get uuid")
-                if "UUID" in output:
-                    lines = output.split('\n')
-                    for line in lines:
-                        if line.strip() and 'UUID' not in line:
-                            uuid_value = line.strip()
-                            if uuid_value:
-                                advanced_info.append({"Category": "SYSTEM_UUID", "Detail": uuid_value})
-                                break
-
-                # Get BIOS information
-                bios_info = run_cmd("wmic bios get serialnumber,version,manufacturer /format:csv")
-                for line in bios_info.split('\n'):
-                    if ',' in line and 'Node' not in line:
-                        parts = line.split(',')
-                        if len(parts) >= 4:
-                            advanced_info.append({"Category": "BIOS_MANUFACTURER", "Detail": parts[1]})
-                            advanced_info.append({"Category": "BIOS_VERSION", "Detail": parts[3]})
-                            break
 
-            except Exception as e:
-                advanced_info.append({"Category": "WINDOWS_ADVANCED_ERROR", "Detail": str(e)})
+def iter_rpm_sqlite(db_path=RPM_SQLITE_PATH):
+    """Stream installed packages straight from the rpm sqlite database"""
+    try:
+        connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        connection.execute("SELECT 1 FROM Packages LIMIT 1")
+    except sqlite3.Error:
+        # Unprivileged users cannot create the WAL index; read the file as a snapshot instead
+        connection = sqlite3.connect(f"file:{db_path}?immutable=1", uri=True)
+    try:
+        for (blob,) in connection.execute("SELECT blob FROM Packages"):
+            header = parse_rpm_header(blob)
+            if not header.get("name") or header["name"] == "gpg-pubkey":
+                continue
+            version = f"{header.get('version', '')}-{header.get('release', '')}"
+            if header.get("epoch"):
+                version = f"{header['epoch']}:{version}"
+            yield {
+                "Software Name": header["name"],
+                "Version": version,
+                "Publisher": header.get("vendor") or "Unknown",
+                "Architecture": header.get("arch", "Unknown"),
+                "Install Date": datetime.fromtimestamp(header["installtime"]).strftime('%Y-%m-%d')
+                if header.get("installtime") else "Unknown"
+            }
+    finally:
+        connection.close()
+
+
+def get_rpm_query_packages():
+    """Fallback for Berkeley DB / NDB rpm databases: one rpm query"""
+    output = run_cmd("rpm -qa --queryformat '%{NAME}\\t%{EPOCHNUM}:%{VERSION}-%{RELEASE}\\t%{VENDOR}\\t%{ARCH}\\n'",
+                     task_name="RPM query")
+    packages = []
+    for line in output.split('\n'):
+        parts = line.split('\t')
+        if len(parts) == 4 and parts[0] != "gpg-pubkey":
+            packages.append({
+                "Software Name": parts[0],
+                "Version": parts[1][2:] if parts[1].startswith("0:") else parts[1],
+                "Publisher": parts[2] if parts[2] != "(none)" else "Unknown",
+                "Architecture": parts[3]
+            })
+    return packages
 
-        print("\t", end='')
-        print_status("Advanced system details collected", "SUCCESS")
 
+def get_package_inventory():
+    """Installed Linux packages, read directly from the package manager database"""
+    if get_scan_platform() != "Linux":
+        return []
+    try:
+        if os.path.exists(DPKG_STATUS_PATH):
+            return list(iter_dpkg_status())
+        if os.path.exists(RPM_SQLITE_PATH):
+            return list(iter_rpm_sqlite())
+        if shutil.which("rpm"):
+            return get_rpm_query_packages()
     except Exception as e:
-        print_status(f"Advanced details collection failed: {str(e)}", "ERROR")
-
-    return advanced_info
+        print_status(f"Package database read failed: {str(e)}", "ERROR")
+    return []
 
 
 # -------------------------------------------------------------------
@@ -1103,25 +3722,23 @@ def get_installed_software():
     print_status("Collecting installed software information...", "SYSTEM")
     software_list = []
 
-    if platform.system() == "Windows":
+    if get_scan_platform() == "Windows":
         try:
-            # Get installed programs from registry
-            output = run_cmd(
-                'powershell "Get-ItemProperty HKLM:\\Software\\Wow6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* | '
-                'Select-Object DisplayName, DisplayVersion, Publisher, InstallDate | Format-Table -AutoSize"'
-            )
-
-            lines = output.split('\n')
-            for line in lines:
-                if line.strip() and 'DisplayName' not in line and '---' not in line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        software_list.append({
-                            "Software Name": ' '.join(parts[:-3]) if len(parts) > 3 else line.strip(),
-                            "Version": parts[-3] if len(parts) > 3 else "Unknown",
-                            "Publisher": parts[-2] if len(parts) > 2 else "Unknown",
-                            "Install Date": parts[-1] if len(parts) > 1 else "Unknown"
-                        })
+            # Installed programs from both registry views
+            seen = set()
+            for program in get_powershell_result("installed_software") or []:
+                key = (program.get("DisplayName"), program.get("DisplayVersion"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                install_date = str(program.get("InstallDate") or "")
+                software_list.append({
+                    "Software Name": program.get("DisplayName"),
+                    "Version": program.get("DisplayVersion") or "Unknown",
+                    "Publisher": program.get("Publisher") or "Unknown",
+                    "Install Date": f"{install_date[:4]}-{install_date[4:6]}-{install_date[6:8]}"
+                    if len(install_date) == 8 and install_date.isdigit() else install_date or "Unknown"
+                })
 
             print("\t", end='')
             print_status(f"Found {len(software_list)} installed programs", "SUCCESS")
@@ -1129,6 +3746,14 @@ def get_installed_software():
         except Exception as e:
             print_status(f"Software collection failed: {str(e)}", "ERROR")
 
+    elif get_scan_platform() == "Linux":
+        try:
+            software_list = get_collector_result("PACKAGE INVENTORY")
+            print("\t", end='')
+            print_status(f"Found {len(software_list)} installed packages", "SUCCESS")
+        except Exception as e:
+            print_status(f"Software collection failed: {str(e)}", "ERROR")
+
     return software_list[:]
 
 
@@ -1138,22 +3763,19 @@ def get_system_drivers():
     print_status("Collecting driver information...", "SYSTEM")
     drivers = []
 
-    if platform.system() == "Windows":
+    if get_scan_platform() == "Windows":
         try:
-            output = run_cmd("driverquery /v /fo csv")
-            lines = output.split('\n')
-            for line in lines[1:]:  # Skip header
-                if line.strip():
-                    parts = line.split(',')
-                    if len(parts) >= 6:
-                        drivers.append({
-                            "Module Name": parts[0].strip('"'),
-                            "Display Name": parts[1].strip('"'),
-                            "Driver Type": parts[2].strip('"'),
-                            "Start Mode": parts[3].strip('"'),
-                            "State": parts[4].strip('"'),
-                            "Status": parts[5].strip('"') if len(parts) > 5 else "N/A"
-                        })
+            for row in iter_command_csv("driverquery /v /fo csv", "Driver query"):
+                if not row.get("module name"):
+                    continue
+                drivers.append({
+                    "Module Name": row["module name"],
+                    "Display Name": row.get("display name", "N/A"),
+                    "Driver Type": row.get("driver type", "N/A"),
+                    "Start Mode": row.get("start mode", "N/A"),
+                    "State": row.get("state", "N/A"),
+                    "Status": row.get("status", "N/A")
+                })
 
             print("\t", end='')
             print_status(f"Collected {len(drivers)} driver entries", "SUCCESS")
@@ -1161,6 +3783,11 @@ def get_system_drivers():
         except Exception as e:
             print_status(f"Driver collection failed: {str(e)}", "ERROR")
 
+    elif get_scan_platform() == "Linux":
+        drivers = get_linux_kernel_modules()
+        print("\t", end='')
+        print_status(f"Collected {len(drivers)} kernel modules", "SUCCESS")
+
     return drivers[:]
 
 
@@ -1171,7 +3798,8 @@ def get_system_services():
     services = []
 
     try:
-        for service in psutil.win_service_iter() if platform.system() == "Windows" else []:
+        windows_services = get_scan_platform() == "Windows" and hasattr(psutil, "win_service_iter")
+        for service in psutil.win_service_iter() if windows_services else []:
             try:
                 service_info = service.as_dict()
                 services.append({
@@ -1186,6 +3814,9 @@ def get_system_services():
             except:
                 continue
 
+        if get_scan_platform() == "Linux":
+            services = get_linux_services()
+
         print("\t", end='')
         print_status(f"Collected {len(services)} services", "SUCCESS")
 
@@ -1201,21 +3832,17 @@ def get_event_logs_summary():
     print_status("Collecting event log summary...", "SYSTEM")
     event_summary = []
 
-    if platform.system() == "Windows":
+    if get_scan_platform() == "Windows":
         try:
             # Get recent system errors
-            errors = run_cmd(
-                'powershell "Get-EventLog -LogName System -EntryType Error -Newest 10 | '
-                'Select-Object TimeGenerated, Source, InstanceId, Message | Format-Table -AutoSize"'
-            )
-
-            lines = errors.split('\n')
-            for i, line in enumerate(lines[3:13]):  # Skip headers
-                if line.strip():
-                    event_summary.append({
-                        "Event Type": "System Error",
-                        "Details": line.strip()[:400] + "..." if len(line.strip()) > 200 else line.strip()
-                    })
+            for event in get_powershell_result("system_errors") or []:
+                message = " ".join(str(event.get("Message") or "").split())
+                details = (f"{format_powershell_date(event.get('TimeGenerated')) or 'N/A'} "
+                           f"{event.get('Source', 'Unknown')} ({event.get('InstanceId', '?')}): {message}")
+                event_summary.append({
+                    "Event Type": "System Error",
+                    "Details": details[:400] + "..." if len(details) > 400 else details
+                })
 
             print("\t", end='')
             print_status("Event log summary collected", "SUCCESS")
@@ -1223,6 +3850,14 @@ def get_event_logs_summary():
         except Exception as e:
             print_status(f"Event log collection failed: {str(e)}", "ERROR")
 
+    elif get_scan_platform() == "Linux":
+        try:
+            event_summary = get_journal_errors()
+            print("\t", end='')
+            print_status("Journal error summary collected", "SUCCESS")
+        except Exception as e:
+            print_status(f"Event log collection failed: {str(e)}", "ERROR")
+
     return event_summary
 
 
@@ -1234,46 +3869,42 @@ def get_hardware_details():
 
     try:
         # BIOS Information
-        if platform.system() == "Windows":
-            try:
-                bios_info = run_cmd("wmic bios get manufacturer,version,serialnumber,releasedate /format:csv")
-                for line in bios_info.split('\n'):
-                    if ',' in line and 'Node' not in line:
-                        parts = line.split(',')
-                        hardware.append({"Category": "BIOS_MANUFACTURER", "Detail": parts[1]})
-                        hardware.append({"Category": "BIOS_VERSION", "Detail": parts[2]})
-                        hardware.append({"Category": "BIOS_SERIAL", "Detail": parts[3]})
-                        hardware.append({"Category": "BIOS_DATE", "Detail": parts[4] if len(parts) > 4 else "N/A"})
-                        break
-            except:
-                pass
+        try:
+            bios = get_bios_info()
+            if bios:
+                hardware.append({"Category": "BIOS_MANUFACTURER", "Detail": bios["manufacturer"] or "N/A"})
+                hardware.append({"Category": "BIOS_VERSION", "Detail": bios["version"] or "N/A"})
+                hardware.append({"Category": "BIOS_SERIAL", "Detail": bios["serialnumber"] or "N/A"})
+                hardware.append({"Category": "BIOS_DATE", "Detail": bios["releasedate"] or "N/A"})
+        except:
+            pass
 
         # Motherboard Information
-        if platform.system() == "Windows":
-            try:
-                baseboard = run_cmd("wmic baseboard get product,manufacturer,version,serialnumber /format:csv")
-                for line in baseboard.split('\n'):
-                    if ',' in line and 'Node' not in line:
-                        parts = line.split(',')
-                        hardware.append({"Category": "MOTHERBOARD_MANUFACTURER", "Detail": parts[1]})
-                        hardware.append({"Category": "MOTHERBOARD_PRODUCT", "Detail": parts[2]})
-                        hardware.append({"Category": "MOTHERBOARD_VERSION", "Detail": parts[3]})
-                        hardware.append(
-                            {"Category": "MOTHERBOARD_SERIAL", "Detail": parts[4] if len(parts) > 4 else "N/A"})
-                        break
-            except:
-                pass
+        try:
+            baseboard = get_baseboard_info()
+            if baseboard:
+                hardware.append({"Category": "MOTHERBOARD_MANUFACTURER", "Detail": baseboard["manufacturer"] or "N/A"})
+                hardware.append({"Category": "MOTHERBOARD_PRODUCT", "Detail": baseboard["product"] or "N/A"})
+                hardware.append({"Category": "MOTHERBOARD_VERSION", "Detail": baseboard["version"] or "N/A"})
+                hardware.append({"Category": "MOTHERBOARD_SERIAL", "Detail": baseboard["serialnumber"] or "N/A"})
+        except:
+            pass
 
         # System UUID
         try:
-            system_uuid = run_cmd("wmic csproduct get uuid")
-            for line in system_uuid.split('\n'):
-                if line.strip() and 'UUID' not in line:
-                    hardware.append({"Category": "SYSTEM_UUID", "Detail": line.strip()})
-                    break
+            system_uuid = get_system_uuid()
+            if system_uuid:
+                hardware.append({"Category": "SYSTEM_UUID", "Detail": system_uuid})
         except:
             pass
 
+        # PCI and USB devices straight from sysfs
+        if get_scan_platform() == "Linux":
+            try:
+                hardware.extend(get_linux_hardware_rows())
+            except Exception:
+                pass
+
         # Battery Information (if available)
         try:
             battery = psutil.sensors_battery()
@@ -1323,6 +3954,46 @@ def get_network_connections():
     return connections[:]
 
 
+def get_listening_ports():
+    """Get listening TCP ports and bound UDP ports"""
+    print("\n\t", end='')
+    print_status("Collecting listening ports...", "SYSTEM")
+    listeners = []
+    process_names = {}
+
+    try:
+        for conn in psutil.net_connections(kind='inet'):
+            try:
+                is_tcp = conn.type == socket.SOCK_STREAM
+                if (is_tcp and conn.status != psutil.CONN_LISTEN) or (not is_tcp and conn.raddr):
+                    continue
+
+                if conn.pid and conn.pid not in process_names:
+                    try:
+                        process_names[conn.pid] = psutil.Process(conn.pid).name()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        process_names[conn.pid] = "N/A"
+
+                listeners.append({
+                    "Protocol": ("TCP" if is_tcp else "UDP") + ("6" if conn.family == socket.AF_INET6 else ""),
+                    "Address": conn.laddr.ip,
+                    "Port": conn.laddr.port,
+                    "PID": conn.pid or "N/A",
+                    "Process": process_names.get(conn.pid, "N/A")
+                })
+            except:
+                continue
+
+        listeners.sort(key=lambda x: (x["Port"], x["Protocol"], x["Address"]))
+        print("\t", end='')
+        print_status(f"Found {len(listeners)} listening ports", "SUCCESS")
+
+    except Exception as e:
+        print_status(f"Listening ports collection failed: {str(e)}", "ERROR")
+
+    return listeners
+
+
 def get_system_logs():
     """Get system logs and recent activities"""
     print("\n\t", end='')
@@ -1331,7 +4002,7 @@ def get_system_logs():
 
     try:
         # Recent login information
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             try:
                 logon_sessions = run_cmd("quser")
                 lines = logon_sessions.split('\n')
@@ -1376,25 +4047,19 @@ def get_security_information():
 
     try:
         # Windows Defender status
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             try:
-                defender_status = run_cmd(
-                    'powershell "Get-MpComputerStatus | Select-Object AntivirusEnabled, AMServiceEnabled, '
-                    'AntispywareEnabled, RealTimeProtectionEnabled, OnAccessProtectionEnabled | Format-List"'
-                )
-
-                for line in defender_status.split('\n'):
-                    if ':' in line:
-                        key, value = line.split(':', 1)
+                for defender_status in (get_powershell_result("defender") or [])[:1]:
+                    for key, value in defender_status.items():
                         security_info.append({
-                            "Security Feature": f"Defender_{key.strip()}",
-                            "Status": value.strip()
+                            "Security Feature": f"Defender_{key}",
+                            "Status": str(value)
                         })
             except:
                 pass
 
         # Firewall status
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             try:
                 firewall_status = run_cmd('netsh advfirewall show allprofiles state')
                 for line in firewall_status.split('\n'):
@@ -1408,11 +4073,9 @@ def get_security_information():
                 pass
 
         # UAC status
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             try:
-                uac_status = run_cmd(
-                    'reg query "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System" /v EnableLUA')
-                if '0x1' in uac_status:
+                if get_registry().read_value(*UAC_VALUE) == 1:
                     security_info.append({
                         "Security Feature": "UAC_STATUS",
                         "Status": "Enabled"
@@ -1420,6 +4083,9 @@ def get_security_information():
             except:
                 pass
 
+        if get_scan_platform() == "Linux":
+            security_info.extend(get_linux_security_features())
+
         print("\t", end='')
         print_status("Security information collected", "SUCCESS")
 
@@ -1437,7 +4103,7 @@ def get_power_management():
 
     try:
         # Power plan
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             try:
                 power_plan = run_cmd('powercfg /getactivescheme')
                 for line in power_plan.split('\n'):
@@ -1449,9 +4115,12 @@ def get_power_management():
             except:
                 pass
 
-        # Battery information (if available)
+        if get_scan_platform() == "Linux":
+            power_info.extend(get_linux_power_supplies())
+
+        # Battery information (if available; sysfs already covers it on Linux)
         try:
-            battery = psutil.sensors_battery()
+            battery = psutil.sensors_battery() if get_scan_platform() != "Linux" else None
             if battery:
                 power_info.append({
                     "Power Setting": "BATTERY_PERCENTAGE",
@@ -1528,11 +4197,12 @@ def get_vulnerability_assessment():
     vulnerabilities = []
 
     try:
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
+            policy_values = get_registry().read_values([UAC_VALUE, RDP_VALUE, AUTORUN_VALUE])
+
             # Check UAC status
             try:
-                uac_output = run_cmd('reg query "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System" /v EnableLUA')
-                if '0x0' in uac_output:
+                if policy_values[UAC_VALUE] == 0:
                     vulnerabilities.append({
                         "Vulnerability": "UAC Disabled",
                         "Severity": "HIGH",
@@ -1544,8 +4214,8 @@ def get_vulnerability_assessment():
 
             # Check Windows Updates status
             try:
-                update_output = run_cmd('powershell "Get-WindowsUpdate"')
-                if "No updates are available" not in update_output and "Installed" not in update_output:
+                pending_updates = get_powershell_result("windows_update")
+                if pending_updates:
                     vulnerabilities.append({
                         "Vulnerability": "Outdated Windows",
                         "Severity": "HIGH",
@@ -1557,8 +4227,7 @@ def get_vulnerability_assessment():
 
             # Check SMBv1 (vulnerable protocol)
             try:
-                smb_output = run_cmd('powershell "Get-WindowsOptionalFeature -Online -FeatureName SMB1Protocol"')
-                if "Enabled" in smb_output:
+                if (get_powershell_result("smb1") or [None])[0] == "Enabled":
                     vulnerabilities.append({
                         "Vulnerability": "SMBv1 Enabled",
                         "Severity": "CRITICAL",
@@ -1570,8 +4239,7 @@ def get_vulnerability_assessment():
 
             # Check Remote Desktop status
             try:
-                rdp_output = run_cmd('reg query "HKLM\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server" /v fDenyTSConnections')
-                if '0x0' in rdp_output:
+                if policy_values[RDP_VALUE] == 0:
                     vulnerabilities.append({
                         "Vulnerability": "RDP Enabled",
                         "Severity": "MEDIUM",
@@ -1583,8 +4251,7 @@ def get_vulnerability_assessment():
 
             # Check AutoRun for all drives
             try:
-                autorun_output = run_cmd('reg query "HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\Explorer" /v NoDriveTypeAutoRun')
-                if not autorun_output or "0x0" in autorun_output:
+                if not policy_values[AUTORUN_VALUE]:
                     vulnerabilities.append({
                         "Vulnerability": "AutoRun Enabled",
                         "Severity": "MEDIUM",
@@ -1596,8 +4263,7 @@ def get_vulnerability_assessment():
 
             # Check PowerShell Execution Policy
             try:
-                ps_policy = run_cmd('powershell "Get-ExecutionPolicy"')
-                if "Unrestricted" in ps_policy or "Bypass" in ps_policy:
+                if (get_powershell_result("execution_policy") or [None])[0] in ("Unrestricted", "Bypass"):
                     vulnerabilities.append({
                         "Vulnerability": "PowerShell Unrestricted",
                         "Severity": "HIGH",
@@ -1640,8 +4306,8 @@ def get_vulnerability_assessment():
 
         # Check .NET Framework versions (older versions vulnerable)
         try:
-            dotnet_output = run_cmd('reg query "HKLM\\SOFTWARE\\Microsoft\\NET Framework Setup\\NDP" /s')
-            if "v4." not in dotnet_output:
+            dotnet_versions = get_registry().list_subkeys(DOTNET_KEY) if get_scan_platform() == "Windows" else None
+            if dotnet_versions is not None and not any(version.lower().startswith("v4") for version in dotnet_versions):
                 vulnerabilities.append({
                     "Vulnerability": "Outdated .NET Framework",
                     "Severity": "MEDIUM",
@@ -1667,7 +4333,7 @@ def get_encryption_security_status():
     encryption_status = []
 
     try:
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             # Check BitLocker status
             try:
                 bitlocker_output = run_cmd('manage-bde -status')
@@ -1704,9 +4370,9 @@ def get_encryption_security_status():
 
             # Check TPM (Trusted Platform Module)
             try:
-                tpm_output = run_cmd('powershell "Get-Tpm"')
-                if tpm_output and "TpmPresent" in tpm_output:
-                    if "True" in tpm_output:
+                tpm_output = get_powershell_result("tpm")
+                if tpm_output:
+                    if tpm_output[0].get("TpmPresent"):
                         encryption_status.append({
                             "Drive": "TPM Chip",
                             "Encryption": "Hardware Security",
@@ -1727,8 +4393,7 @@ def get_encryption_security_status():
 
             # Check Secure Boot status
             try:
-                secureboot_output = run_cmd('powershell "Confirm-SecureBootUEFI"')
-                if secureboot_output and "True" in secureboot_output:
+                if (get_powershell_result("secure_boot") or [None])[0] is True:
                     encryption_status.append({
                         "Drive": "UEFI/Firmware",
                         "Encryption": "Secure Boot",
@@ -1749,8 +4414,7 @@ def get_encryption_security_status():
 
             # Check Device Encryption (Windows 10/11 Home)
             try:
-                device_encryption = run_cmd('powershell "(Get-BitLockerVolume -MountPoint C:).ProtectionStatus"')
-                if device_encryption and "On" in device_encryption:
+                if (get_powershell_result("device_encryption") or [None])[0] == "On":
                     encryption_status.append({
                         "Drive": "C:",
                         "Encryption": "Device Encryption",
@@ -1783,7 +4447,7 @@ def get_encryption_security_status():
         installed_encryption = []
         for software in encryption_software:
             try:
-                if platform.system() == "Windows":
+                if get_scan_platform() == "Windows":
                     output = run_cmd(f'where {software}')
                     if output and "Could not find" not in output:
                         installed_encryption.append(software.upper())
@@ -1808,6 +4472,225 @@ def get_encryption_security_status():
     return encryption_status
 
 
+# -------------------------------------------------------------------
+#  FILE INTEGRITY MONITORING (HASH BASELINE)
+# -------------------------------------------------------------------
+def get_file_hash(filepath, mmap_threshold=None):
+    """Calculate SHA-256 of a file, memory-mapping large files"""
+    try:
+        hasher = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if mmap_threshold and size >= mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            else:
+                buf = f.read(65536)
+                while len(buf) > 0:
+                    hasher.update(buf)
+                    buf = f.read(65536)
+        return hasher.hexdigest()
+    except:
+        return None
+
+
+def _hash_file_batch(paths, mmap_threshold):
+    """Process-pool task: hash a batch of files"""
+    return [(path, get_file_hash(path, mmap_threshold)) for path in paths]
+
+
+def get_integrity_paths():
+    """Paths covered by file integrity monitoring"""
+    if Config.INTEGRITY_PATHS:
+        return list(Config.INTEGRITY_PATHS)
+
+    if platform.system() == "Windows":
+        system_root = os.environ.get("SystemRoot", "C:\\Windows")
+        return [
+            os.path.join(system_root, "System32", "drivers"),
+            os.path.join(os.environ.get("APPDATA", ""), "Microsoft\\Windows\\Start Menu\\Programs\\Startup"),
+            os.path.join(os.environ.get("ProgramData", "C:\\ProgramData"),
+                         "Microsoft\\Windows\\Start Menu\\Programs\\StartUp"),
+        ]
+    return ["/etc", "/usr/bin", "/usr/sbin", "/bin", "/sbin",
+            os.path.join(os.path.expanduser("~"), ".config", "autostart")]
+
+
+class FileIntegrityIndex:
+    """Persistent hash index keyed by (inode, size, mtime).
+
+    Files whose signature is unchanged since the previous run reuse the
+    stored digest; everything else is hashed in a process pool. The first
+    completed run is frozen as the baseline that later runs are compared to.
+    """
+
+    def __init__(self, cache_dir):
+        self.index_path = os.path.join(cache_dir, "integrity_index.json")
+        self.baseline_path = os.path.join(cache_dir, "integrity_baseline.json")
+        self.index = self._load(self.index_path).get("files", {})
+        self.baseline = self._load(self.baseline_path)
+        self.unreadable = []
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _store(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def walk(roots):
+        """Yield (path, stat) for regular files below roots, once per real root"""
+        seen_roots = set()
+        for root in roots:
+            real_root = os.path.realpath(root)
+            if real_root in seen_roots or not os.path.isdir(real_root):
+                continue
+            seen_roots.add(real_root)
+            for dirpath, dirnames, filenames in os.walk(real_root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path, follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(st.st_mode):
+                        yield path, st
+
+    def _hash_many(self, paths, workers, mmap_threshold):
+        results = {}
+        if not paths:
+            return results
+        batch_size = max(1, min(64, len(paths) // (workers * 4) or 1))
+        batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                for batch in pool.map(_hash_file_batch, batches, [mmap_threshold] * len(batches)):
+                    results.update(batch)
+        except Exception:
+            # Process pools are unavailable when the scanner is exec'd from a
+            # one-liner on spawn platforms; hashlib releases the GIL on large
+            # buffers, so threads are the next best thing.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                for batch in pool.map(_hash_file_batch, batches, [mmap_threshold] * len(batches)):
+                    results.update(batch)
+        return results
+
+    def refresh(self, roots, workers=4, mmap_threshold=None):
+        """Re-hash changed files and return {path: sha256} plus the hashed count.
+
+        Files that exist but could not be hashed are left out and listed in self.unreadable.
+        """
+        current = {}
+        to_hash = []
+        for path, st in self.walk(roots):
+            signature = [st.st_ino, st.st_size, st.st_mtime_ns]
+            entry = self.index.get(path)
+            if entry and entry[:3] == signature and entry[3]:
+                current[path] = entry
+            else:
+                current[path] = signature + [None]
+                to_hash.append(path)
+
+        for path, digest in self._hash_many(to_hash, workers, mmap_threshold).items():
+            current[path][3] = digest
+
+        self.index = current
+        self.unreadable = sorted(path for path, entry in current.items() if not entry[3])
+        self._store(self.index_path, {"files": self.index})
+        return {path: entry[3] for path, entry in current.items() if entry[3]}, len(to_hash)
+
+    def compare(self, hashes):
+        """Return (added, removed, modified, unreadable) against the baseline, creating it if missing.
+
+        A baseline file that still exists but could not be read this run is
+        unreadable, not removed; unreadable files outside the baseline are skipped.
+        """
+        if not self.baseline.get("files"):
+            self.baseline = {"created": datetime.now().isoformat(), "files": hashes}
+            self._store(self.baseline_path, self.baseline)
+            return None
+
+        baseline_files = self.baseline["files"]
+        unreadable = set(self.unreadable) & set(baseline_files)
+        added = sorted(set(hashes) - set(baseline_files))
+        removed = sorted(set(baseline_files) - set(hashes) - unreadable)
+        modified = sorted(path for path in set(hashes) & set(baseline_files)
+                          if hashes[path] != baseline_files[path])
+        return added, removed, modified, sorted(unreadable)
+
+
+def get_file_integrity_status():
+    """Compare system files against the stored hash baseline"""
+    print("\n\t", end='')
+    print_status("Verifying file integrity baseline...", "SCAN")
+    integrity = []
+
+    if not Config.FILE_INTEGRITY:
+        print("\t", end='')
+        print_status("File integrity monitoring disabled", "INFO")
+        return integrity
+
+    try:
+        start_time = time.time()
+        index = FileIntegrityIndex(Config.CACHE_DIR)
+        hashes, hashed = index.refresh(get_integrity_paths(), Config.INTEGRITY_WORKERS,
+                                       Config.INTEGRITY_MMAP_THRESHOLD)
+        print("\t", end='')
+        print_status(f"Indexed {len(hashes):,} files ({hashed:,} re-hashed) in {time.time() - start_time:.1f}s",
+                     "DATA")
+
+        changes = index.compare(hashes)
+        if changes is None:
+            integrity.append({
+                "Change": "BASELINE_CREATED",
+                "Path": ", ".join(get_integrity_paths()),
+                "Baseline Hash": "N/A",
+                "Current Hash": f"{len(hashes):,} files recorded"
+            })
+        else:
+            added, removed, modified, unreadable = changes
+            baseline_files = index.baseline["files"]
+            for change, paths in (("MODIFIED", modified), ("ADDED", added), ("REMOVED", removed),
+                                  ("UNREADABLE", unreadable)):
+                for path in paths:
+                    integrity.append({
+                        "Change": change,
+                        "Path": path,
+                        "Baseline Hash": baseline_files.get(path, "N/A")[:16],
+                        "Current Hash": hashes.get(path, "N/A")[:16]
+                    })
+
+            total_changes = len(integrity)
+            if total_changes > Config.INTEGRITY_MAX_ROWS:
+                integrity = integrity[:Config.INTEGRITY_MAX_ROWS]
+                integrity.append({
+                    "Change": "TRUNCATED",
+                    "Path": f"{total_changes - Config.INTEGRITY_MAX_ROWS:,} more changes not shown",
+                    "Baseline Hash": "N/A",
+                    "Current Hash": "N/A"
+                })
+
+            print("\t", end='')
+            print_status(f"Since baseline {index.baseline.get('created', 'N/A')[:19]}: {len(modified)} modified, "
+                         f"{len(added)} added, {len(removed)} removed, {len(unreadable)} unreadable", "SUCCESS")
+
+    except Exception as e:
+        print_status(f"File integrity check failed: {str(e)}", "ERROR")
+
+    return integrity
+
+
 def extract_browser_data():
     """Extract browser data (history, bookmarks, cookies)"""
     print("\n\t", end='')
@@ -1972,10 +4855,10 @@ def detect_remote_access_tools():
         detected_tools = []
         
         # Check running processes
-        for proc in psutil.process_iter(['name', 'exe']):
+        for proc_info in get_collector_result("PROCESS SNAPSHOT"):
             try:
-                proc_name = proc.info['name'].lower()
-                proc_exe = proc.info['exe'].lower() if proc.info['exe'] else ""
+                proc_name = proc_info['name'].lower()
+                proc_exe = proc_info['exe'].lower() if proc_info['exe'] else ""
                 
                 for tool, indicators in remote_tool_indicators.items():
                     for indicator in indicators:
@@ -1984,7 +4867,7 @@ def detect_remote_access_tools():
                                 detected_tools.append(tool)
                                 remote_tools.append({
                                     "Tool Name": tool,
-                                    "Process": proc.info['name'],
+                                    "Process": proc_info['name'],
                                     "Status": "RUNNING",
                                     "Risk Level": "HIGH" if tool in ["TeamViewer", "AnyDesk", "Ammyy Admin"] else "MEDIUM",
                                     "Detection Method": "Process Analysis"
@@ -1993,7 +4876,7 @@ def detect_remote_access_tools():
                 continue
 
         # Check installed programs
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             try:
                 installed_output = run_cmd('wmic product get name /value')
                 for line in installed_output.split('\n'):
@@ -2031,19 +4914,13 @@ def detect_remote_access_tools():
                 pass
 
             # Check registry entries for auto-start
-            registry_locations = [
-                r"HKLM\Software\Microsoft\Windows\CurrentVersion\Run",
-                r"HKCU\Software\Microsoft\Windows\CurrentVersion\Run",
-                r"HKLM\Software\Microsoft\Windows\CurrentVersion\RunOnce",
-                r"HKCU\Software\Microsoft\Windows\CurrentVersion\RunOnce"
-            ]
-
-            for location in registry_locations:
+            for location in AUTOSTART_KEYS:
                 try:
-                    reg_output = run_cmd(f'reg query "{location}"')
+                    entries = get_registry().list_values(location)
+                    reg_output = " ".join(f"{name} {value}" for name, value in entries.items()).lower()
                     for tool, indicators in remote_tool_indicators.items():
                         for indicator in indicators:
-                            if indicator in reg_output.lower() and tool not in detected_tools:
+                            if indicator in reg_output and tool not in detected_tools:
                                 detected_tools.append(tool)
                                 remote_tools.append({
                                     "Tool Name": tool,
@@ -2056,10 +4933,9 @@ def detect_remote_access_tools():
                     continue
 
         # Check for RDP specific configurations
-        if platform.system() == "Windows":
+        if get_scan_platform() == "Windows":
             try:
-                rdp_reg = run_cmd('reg query "HKLM\\SYSTEM\\CurrentControlSet\\Control\\Terminal Server" /v fDenyTSConnections')
-                if '0x0' in rdp_reg:
+                if get_registry().read_value(*RDP_VALUE) == 0:
                     if "RDP" not in detected_tools:
                         remote_tools.append({
                             "Tool Name": "RDP",
@@ -2126,69 +5002,458 @@ def detect_remote_access_tools():
     return remote_tools
 
 
+# -------------------------------------------------------------------
+#  VOLATILITY CLASSES AND THE BOOT CACHE - STATIC DATA ACROSS SCANS
+# -------------------------------------------------------------------
+VOLATILITY_BOOT = "boot"  # Fixed until the next reboot (firmware, board, UUID, GPU)
+VOLATILITY_HOUR = "hour"  # Changes rarely; an hour-old answer is acceptable (inventories)
+VOLATILITY_SCAN = "scan"  # Collected fresh on every scan
+VOLATILITY_MAX_AGE = {VOLATILITY_BOOT: None, VOLATILITY_HOUR: 3600, VOLATILITY_SCAN: 0}
+
+
+class BootCache:
+    """Per-boot facts and longer-lived collector results, persisted in CACHE_DIR.
+
+    The whole file is discarded when psutil.boot_time(), the host name or the
+    scanner version changes, so nothing survives a reboot. It is only used with
+    the live command backend: record/replay runs must see every command.
+    """
+
+    VERSION = 1
+    BOOT_TIME_TOLERANCE = 2  # boot_time() is derived from uptime and can wobble by a second
+
+    def __init__(self, file_name="boot_cache.json"):
+        self.file_name = file_name
+        self.lock = threading.RLock()
+        self.loaded = False
+        self.dirty = False
+        self.facts = {}
+        self.results = {}
+
+    @property
+    def path(self):
+        return os.path.join(Config.CACHE_DIR, self.file_name)
+
+    def enabled(self):
+        return Config.BOOT_CACHE and command_backend.name == "live"
+
+    def _identity(self):
+        return {"version": self.VERSION, "hostname": socket.gethostname(),
+                "scanner_version": Config.SCANNER_VERSION}
+
+    def load(self):
+        with self.lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if (all(data.get(key) == value for key, value in self._identity().items())
+                        and abs(data.get("boot_time", 0) - psutil.boot_time()) <= self.BOOT_TIME_TOLERANCE):
+                    self.facts = data.get("facts", {})
+                    self.results = data.get("results", {})
+            except Exception:
+                self.facts, self.results = {}, {}
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            data = dict(self._identity(), boot_time=psutil.boot_time(), facts=self.facts, results=self.results)
+            try:
+                os.makedirs(Config.CACHE_DIR, exist_ok=True)
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(dumps_json(data))
+                os.replace(tmp_path, self.path)
+                self.dirty = False
+            except Exception as e:
+                print_status(f"Could not save boot cache: {str(e)}", "WARNING")
+
+    def fact(self, name, function):
+        """A value that cannot change before reboot; computed once per boot, empty answers are not kept"""
+        if not self.enabled():
+            return function()
+        self.load()
+        with self.lock:
+            if name in self.facts:
+                return self.facts[name]
+        value = function()
+        if value:
+            with self.lock:
+                self.facts[name] = value
+                self.dirty = True
+        return value
+
+    def get_result(self, name, max_age):
+        self.load()
+        with self.lock:
+            entry = self.results.get(name)
+        if entry is None or (max_age is not None and time.time() - entry["at"] > max_age):
+            return False, None
+        return True, entry["result"]
+
+    def store_result(self, name, result):
+        self.load()
+        with self.lock:
+            self.results[name] = {"at": time.time(), "result": result}
+            self.dirty = True
+
+
+boot_cache = BootCache()
+
+
+def get_system_uuid():
+    """SMBIOS system UUID (one wmic csproduct query per boot)"""
+    def query():
+        if get_scan_platform() == "Linux":
+            return read_dmi_info().get("product_uuid")
+        if get_scan_platform() != "Windows":
+            return None
+        for line in run_cmd("wmic csproduct get uuid").split('\n'):
+            if line.strip() and 'UUID' not in line:
+                return line.strip()
+        return None
+    return boot_cache.fact("system_uuid", query)
+
+
+def get_bios_info():
+    """BIOS manufacturer, version, serial number and release date"""
+    def query():
+        if get_scan_platform() == "Linux":
+            dmi = read_dmi_info()
+            if "bios_vendor" not in dmi:
+                return {}
+            return {"manufacturer": dmi.get("bios_vendor", ""), "version": dmi.get("bios_version", ""),
+                    "serialnumber": dmi.get("product_serial", ""), "releasedate": dmi.get("bios_date", "")}
+        if get_scan_platform() != "Windows":
+            return {}
+        for row in iter_command_csv("wmic bios get manufacturer,version,serialnumber,releasedate /format:csv",
+                                    "BIOS query"):
+            return {key: row.get(key) or "" for key in ("manufacturer", "version", "serialnumber", "releasedate")}
+        return {}
+    return boot_cache.fact("bios", query)
+
+
+def get_baseboard_info():
+    """Motherboard manufacturer, product, version and serial number"""
+    def query():
+        if get_scan_platform() == "Linux":
+            dmi = read_dmi_info()
+            if "board_vendor" not in dmi and "board_name" not in dmi:
+                return {}
+            return {"manufacturer": dmi.get("board_vendor", ""), "product": dmi.get("board_name", ""),
+                    "version": dmi.get("board_version", ""), "serialnumber": dmi.get("board_serial", "")}
+        if get_scan_platform() != "Windows":
+            return {}
+        for row in iter_command_csv("wmic baseboard get product,manufacturer,version,serialnumber /format:csv",
+                                    "Baseboard query"):
+            return {key: row.get(key) or "" for key in ("manufacturer", "product", "version", "serialnumber")}
+        return {}
+    return boot_cache.fact("baseboard", query)
+
+
+def get_cpu_core_counts():
+    """[physical, logical] core counts"""
+    return boot_cache.fact("cpu_cores", lambda: [psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)])
+
+
+def get_systeminfo_facts():
+    """OS name/version and system manufacturer/model from systeminfo (slow, so once per boot); DMI on Linux"""
+    def query():
+        facts = {}
+        if get_scan_platform() == "Linux":
+            dmi = read_dmi_info()
+            if "sys_vendor" in dmi:
+                facts["Manufacturer"] = dmi["sys_vendor"]
+            if "product_name" in dmi:
+                facts["Model"] = " ".join(filter(None, [dmi["product_name"], dmi.get("product_version")]))
+            return facts
+        if get_scan_platform() != "Windows":
+            return facts
+        output = run_cmd("systeminfo | findstr /C:\"OS Name\" /C:\"OS Version\" /C:\"System Manufacturer\" "
+                         "/C:\"System Model\"")
+        labels = {"OS Name": "OS Name", "OS Version": "OS Version",
+                  "System Manufacturer": "Manufacturer", "System Model": "Model"}
+        for line in output.split('\n'):
+            for prefix, label in labels.items():
+                if prefix in line and ':' in line and label not in facts:
+                    facts[label] = line.split(':', 1)[1].strip()
+        return facts
+    return boot_cache.fact("systeminfo", query)
+
+
 # -------------------------------------------------------------------
 #  HTML REPORT GENERATION - GLASS MORPHISM HACKER THEME
 # -------------------------------------------------------------------
-def generate_html_report():
+# -------------------------------------------------------------------
+#  COLLECTOR REGISTRY AND SELECTIVE EXECUTION
+# -------------------------------------------------------------------
+COLLECTOR_REGISTRY = OrderedDict()
+collector_results = {}
+
+
+def register_collector(name, function, depends=(), section=True, volatility=VOLATILITY_SCAN):
+    """Register a collector; non-section collectors only feed other collectors.
+
+    volatility says how long a result stays true: VOLATILITY_BOOT and
+    VOLATILITY_HOUR results are reused from the boot cache by later scans.
+    """
+    COLLECTOR_REGISTRY[name] = {"function": function, "depends": tuple(depends), "section": section,
+                                "volatility": volatility}
+
+
+def get_collector_result(name, use_cache=True):
+    """Return a collector's result for the current scan, running it on first use"""
+    if name not in collector_results:
+        collector = COLLECTOR_REGISTRY[name]
+        max_age = VOLATILITY_MAX_AGE[collector["volatility"]]
+        if use_cache and max_age != 0 and boot_cache.enabled():
+            found, result = boot_cache.get_result(name, max_age)
+            if found:
+                print("\n\t", end='')
+                print_status(f"{name}: reusing result cached this {collector['volatility']}", "INFO")
+                collector_results[name] = result
+                return result
+        with instrumentation.stage(name):
+            collector_results[name] = collector["function"]()
+        if max_age != 0 and boot_cache.enabled():
+            boot_cache.store_result(name, collector_results[name])
+    return collector_results[name]
+
+
+def reset_collector_results():
+    collector_results.clear()
+
+
+class DataCollector:
+    """Parallel data collection with threading (ported from v22)"""
+
+    def __init__(self):
+        self.results = {}
+        self.queue = queue.Queue()
+
+    def collect_parallel(self, functions):
+        """Collect data from multiple functions in parallel"""
+        threads = []
+
+        def worker(func, name):
+            try:
+                result = func()
+                self.queue.put((name, result))
+            except Exception as e:
+                self.queue.put((name, {"error": str(e)}))
+
+        for name, func in functions.items():
+            thread = threading.Thread(target=worker, args=(func, name))
+            thread.start()
+            threads.append(thread)
+
+        # Wait for all threads to complete
+        for thread in threads:
+            thread.join()
+
+        # Collect results
+        while not self.queue.empty():
+            name, result = self.queue.get()
+            self.results[name] = result
+
+        return self.results
+
+
+def match_collector_name(name):
+    """Resolve a user-supplied section name (case-insensitive, unique prefix allowed)"""
+    wanted = name.strip().upper()
+    if wanted in COLLECTOR_REGISTRY:
+        return wanted
+    matches = [registered for registered in COLLECTOR_REGISTRY if registered.startswith(wanted)]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise ValueError(f"Section '{name}' is ambiguous: {', '.join(matches)}")
+    raise ValueError(f"Unknown section '{name}' (see --list-sections)")
+
+
+def resolve_collectors(only=None, skip=None):
+    """Return (run order including dependencies, selected section names)"""
+    if only:
+        selected = [match_collector_name(name) for name in only]
+    else:
+        selected = list(COLLECTOR_REGISTRY)
+    skipped = {match_collector_name(name) for name in skip or []}
+    selected = [name for name in selected if name not in skipped]
+
+    run_order = []
+    visiting = set()
+
+    def visit(name):
+        if name in run_order:
+            return
+        if name in visiting:
+            raise ValueError(f"Collector dependency cycle at '{name}'")
+        visiting.add(name)
+        for dependency in COLLECTOR_REGISTRY[name]["depends"]:
+            visit(dependency)
+        visiting.discard(name)
+        run_order.append(name)
+
+    for name in selected:
+        visit(name)
+    return run_order, selected
+
+
+register_collector("PROCESS SNAPSHOT", get_process_snapshot, section=False)
+register_collector("PROCESS TREE", get_process_tree, depends=["PROCESS SNAPSHOT"], section=False)
+register_collector("POWERSHELL SESSION", get_powershell_session, section=False)
+register_collector("SAMPLING WINDOW", get_sampling_window, section=False)
+register_collector("PROCESS CPU", get_process_cpu, depends=["SAMPLING WINDOW"], section=False)
+register_collector("PRESSURE SIGNALS", get_pressure_signals, section=False)
+# Never waits for SAMPLING WINDOW: CPU health reads PSI/load, and the window's CPU figures
+# are used only when another section has already taken it
+register_collector("HEALTH METRICS", get_health_metrics, depends=["PROCESS SNAPSHOT", "PRESSURE SIGNALS"],
+                   section=False)
+register_collector("HEALTH SCORE", get_system_health_score, depends=["HEALTH METRICS"], section=False)
+register_collector("SYSTEM OVERVIEW", get_device_specifications, depends=["HEALTH SCORE"])
+register_collector("HARDWARE DETAILS", get_hardware_details)
+register_collector("STORAGE ANALYSIS", get_advanced_storage_details)
+register_collector("STORAGE HOTSPOTS", get_storage_hotspots)
+register_collector("GRAPHICS CARD INFORMATION", get_comprehensive_graphics_info, volatility=VOLATILITY_BOOT)
+register_collector("GPU UTILIZATION", get_gpu_utilization, depends=["SAMPLING WINDOW"])
+register_collector("NETWORK ANALYSIS", get_network_analysis)
+register_collector("NETWORK CONNECTIONS", get_network_connections)
+register_collector("LISTENING PORTS", get_listening_ports)
+register_collector("WIFI SECURITY ANALYSIS", get_comprehensive_wifi_analysis)
+register_collector("USER ACCOUNTS", get_users_information, depends=["POWERSHELL SESSION"])
+register_collector("SYSTEM SERVICES", get_system_services)
+register_collector("PACKAGE INVENTORY", get_package_inventory, section=False, volatility=VOLATILITY_HOUR)
+register_collector("INSTALLED SOFTWARE", get_installed_software, depends=["PACKAGE INVENTORY", "POWERSHELL SESSION"],
+                   volatility=VOLATILITY_HOUR)
+register_collector("SYSTEM DRIVERS", get_system_drivers, volatility=VOLATILITY_HOUR)
+register_collector("SECURITY INFORMATION", get_security_information, depends=["POWERSHELL SESSION"])
+register_collector("POWER MANAGEMENT", get_power_management)
+register_collector("ENVIRONMENT VARIABLES", get_system_environment_vars)
+register_collector("SYSTEM UPTIME ANALYSIS", get_system_uptime_analysis)
+register_collector("SYSTEM LOGS", get_system_logs)
+register_collector("EVENT LOGS SUMMARY", get_event_logs_summary, depends=["POWERSHELL SESSION"])
+register_collector("ADVANCED SYSTEM DETAILS", get_advanced_system_details)
+register_collector("SYSTEM PERFORMANCE", get_system_performance, depends=["SAMPLING WINDOW", "PRESSURE SIGNALS"])
+register_collector("VULNERABILITY ASSESSMENT", get_vulnerability_assessment, depends=["POWERSHELL SESSION"])
+register_collector("ENCRYPTION & SECURITY STATUS", get_encryption_security_status, depends=["POWERSHELL SESSION"])
+register_collector("FILE INTEGRITY MONITORING", get_file_integrity_status)
+register_collector("BROWSER DATA ANALYSIS", extract_browser_data)
+register_collector("REMOTE ACCESS DETECTION", detect_remote_access_tools, depends=["PROCESS SNAPSHOT"])
+register_collector("TASK MANAGER - RUNNING PROCESSES", get_task_manager_details,
+                   depends=["PROCESS SNAPSHOT", "PROCESS CPU"])
+register_collector("PROCESS FAMILIES", get_process_families, depends=["PROCESS TREE", "PROCESS CPU"])
+register_collector("DEEP MEMORY ANALYSIS", get_deep_memory_analysis, depends=["PROCESS TREE"])
+
+
+def run_collector_safely(name):
+    """get_collector_result for the scan loop: a failing collector becomes an error row, not a failed scan"""
+    try:
+        return get_collector_result(name)
+    except Exception as e:
+        print_status(f"{name} failed: {str(e)}", "ERROR")
+        collector_results[name] = [{"Error": str(e)}]
+        return collector_results[name]
+
+
+def run_collectors_parallel(run_order):
+    """Run collectors level by level, each dependency level in a DataCollector"""
+    levels = OrderedDict()
+    depth = {}
+    for name in run_order:
+        depth[name] = 1 + max((depth[dep] for dep in COLLECTOR_REGISTRY[name]["depends"]), default=-1)
+        levels.setdefault(depth[name], []).append(name)
+
+    for level in sorted(levels):
+        functions = OrderedDict((name, lambda name=name: run_collector_safely(name)) for name in levels[level])
+        for name, result in DataCollector().collect_parallel(functions).items():
+            collector_results.setdefault(name, result)
+
+
+def collect_scan_data(only=None, skip=None, parallel=False):
+    """Run the selected collectors once and return the scan data model.
+
+    The returned dict is the single source for all renderers (HTML, JSON,
+    NDJSON and text), so no collector is ever executed twice per scan.
+    Only the selected sections and the collectors they depend on are run;
+    with parallel=True independent collectors share a DataCollector pool.
+    """
+    run_order, selected = resolve_collectors(only, skip)
+
     print_banner()
     print_status("Initializing system penetration scan...", "SCAN")
 
-    # Hacker-style scanning steps
-    scan_steps = [
-        "System Architecture Recon",
-        "Hardware Fingerprinting",
-        "Network Interface Mapping",
-        "User Account Enumeration",
-        "Software Inventory Scan",
-        "Service & Process Analysis",
-        "Security Configuration Audit",
-        "Vulnerability Assessment",
-        "Encryption Status Check",
-        "Browser Data Analysis",
-        "Remote Access Detection",
-        "Performance Metrics Collection",
-        "Compiling Intelligence Report"
-    ]
-
-    for step in scan_steps:
-        simulate_scan_step(step, duration=0.5, steps=15)
-
-    downloads = get_downloads_folder()
-    html_path = os.path.join(downloads, f"Sabari425_System_Scan_{datetime.now().strftime('%d.%m.%Y_%H-%M-%S')}.html")
+    if not only and not skip:
+        # Hacker-style scanning steps
+        scan_steps = [
+            "System Architecture Recon",
+            "Hardware Fingerprinting",
+            "Network Interface Mapping",
+            "User Account Enumeration",
+            "Software Inventory Scan",
+            "Service & Process Analysis",
+            "Security Configuration Audit",
+            "Vulnerability Assessment",
+            "Encryption Status Check",
+            "Browser Data Analysis",
+            "Remote Access Detection",
+            "Performance Metrics Collection",
+            "Compiling Intelligence Report"
+        ]
+
+        for step in scan_steps:
+            simulate_scan_step(step, duration=0.5, steps=15)
+
+    started_at = datetime.now()
 
     # Gather all data
     print("\n\n\n")
-    print_status("Compiling system intelligence data...", "SCAN")
-
-    sections_data = {
-        "SYSTEM OVERVIEW": get_device_specifications(),
-        "HARDWARE DETAILS": get_hardware_details(),
-        "STORAGE ANALYSIS": get_advanced_storage_details(),
-        "GRAPHICS CARD INFORMATION": get_comprehensive_graphics_info(),
-        "NETWORK ANALYSIS": get_network_analysis(),
-        "NETWORK CONNECTIONS": get_network_connections(),
-        "WIFI SECURITY ANALYSIS": get_comprehensive_wifi_analysis(),
-        "USER ACCOUNTS": get_users_information(),
-        "SYSTEM SERVICES": get_system_services(),
-        "INSTALLED SOFTWARE": get_installed_software(),
-        "SYSTEM DRIVERS": get_system_drivers(),
-        "SECURITY INFORMATION": get_security_information(),
-        "POWER MANAGEMENT": get_power_management(),
-        "ENVIRONMENT VARIABLES": get_system_environment_vars(),
-        "SYSTEM UPTIME ANALYSIS": get_system_uptime_analysis(),
-        "SYSTEM LOGS": get_system_logs(),
-        "EVENT LOGS SUMMARY": get_event_logs_summary(),
-        "ADVANCED SYSTEM DETAILS": get_advanced_system_details(),
-        "SYSTEM PERFORMANCE": get_system_performance(),
-        "VULNERABILITY ASSESSMENT": get_vulnerability_assessment(),
-        "ENCRYPTION & SECURITY STATUS": get_encryption_security_status(),
-        "BROWSER DATA ANALYSIS": extract_browser_data(),
-        "REMOTE ACCESS DETECTION": detect_remote_access_tools(),
-        "TASK MANAGER - RUNNING PROCESSES": get_task_manager_details()
+    print_status(f"Compiling system intelligence data ({len(run_order)} collectors)...", "SCAN")
+
+    reset_collector_results()
+    instrumentation.reset()
+    if parallel:
+        run_collectors_parallel(run_order)
+    else:
+        for name in run_order:
+            run_collector_safely(name)
+    boot_cache.save()
+
+    sections_data = OrderedDict((name, collector_results[name]) for name in selected
+                                if COLLECTOR_REGISTRY[name]["section"])
+
+    return {
+        "metadata": OrderedDict([
+            ("generated_at", started_at.isoformat(timespec='seconds')),
+            ("completed_at", datetime.now().isoformat(timespec='seconds')),
+            ("device_name", socket.gethostname()),
+            ("platform", platform.platform()),
+            ("system", get_scan_platform()),
+            ("command_backend", command_backend.name),
+            ("scanned_by", getpass.getuser()),
+            ("scanner_version", Config.SCANNER_VERSION),
+            ("instrumentation", instrumentation.summary()),
+        ]),
+        "health_score": collector_results.get("HEALTH SCORE"),
+        "health_metrics": collector_results.get("HEALTH METRICS"),
+        "sections": sections_data
     }
 
-    health_score = get_system_health_score()
-    health_color = get_health_color(health_score)
+
+def render_html_report(scan_data, html_path):
+    """Render the scan data model to the hacker-theme HTML report"""
+    sections_data = scan_data["sections"]
+    metadata = scan_data["metadata"]
+    health_score = scan_data["health_score"]
+    if health_score is None:
+        health_label = "N/A"
+        health_color = "linear-gradient(135deg, #555555 0%, #333333 100%)"
+    else:
+        health_label = f"{health_score}/100"
+        health_color = get_health_color(health_score)
 
     html_content = f"""
     <!DOCTYPE html>
@@ -2870,10 +6135,10 @@ def generate_html_report():
             <div class="header">
                 <h1>System Penetration Report | Sabari_425</h1>
                 <div class="creator">Sabari_425 Organisation | Security Check Team</div>
-                <p>> SCAN INITIATED: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p>> TARGET: {socket.gethostname()} | PLATFORM: {platform.platform()}</p>
+                <p>> SCAN INITIATED: {metadata['generated_at'].replace('T', ' ')}</p>
+                <p>> TARGET: {metadata['device_name']} | PLATFORM: {metadata['platform']}</p>
                 <div class="health-score">
-                    SYSTEM INTEGRITY: {health_score}/100
+                    SYSTEM INTEGRITY: {health_label}
                 </div>
             </div>
     """
@@ -2914,9 +6179,12 @@ def generate_html_report():
         "SYSTEM OVERVIEW": "medium-table",
         "HARDWARE DETAILS": "medium-table",
         "STORAGE ANALYSIS": "wide-table",
+        "STORAGE HOTSPOTS": "wide-table",
         "GRAPHICS CARD INFORMATION": "medium-table",
+        "GPU UTILIZATION": "wide-table",
         "NETWORK ANALYSIS": "scroll-table",
         "NETWORK CONNECTIONS": "scroll-table",
+        "LISTENING PORTS": "scroll-table",
         "WIFI SECURITY ANALYSIS": "scroll-table",
         "USER ACCOUNTS": "wide-table",
         "SYSTEM SERVICES": "scroll-table",
@@ -2931,9 +6199,12 @@ def generate_html_report():
         "ADVANCED SYSTEM DETAILS": "medium-table",
         "VULNERABILITY ASSESSMENT": "wide-table",
         "ENCRYPTION & SECURITY STATUS": "wide-table",
+        "FILE INTEGRITY MONITORING": "scroll-table",
         "BROWSER DATA ANALYSIS": "medium-table",
         "REMOTE ACCESS DETECTION": "wide-table",
-        "TASK MANAGER - RUNNING PROCESSES": "task-manager-table"
+        "TASK MANAGER - RUNNING PROCESSES": "task-manager-table",
+        "PROCESS FAMILIES": "wide-table",
+        "DEEP MEMORY ANALYSIS": "wide-table"
     }
 
     # Add each section to HTML
@@ -3072,8 +6343,9 @@ def generate_html_report():
 
     html_content += """
             <div class="footer">
-                <p>> SCAN COMPLETED: """ + datetime.now().strftime('%H:%M:%S') + """</p>
-                <p>> SYSTEM SCANNER v4.0 | SABARI425 SECURITY | ACCESS LEVEL: ROOT</p>
+                <p>> SCAN COMPLETED: """ + metadata['completed_at'][11:] + """</p>
+                <p>> SCAN DURATION: """ + f"{metadata.get('instrumentation', {}).get('total_wall', 0):.1f}s | SUBPROCESSES: {metadata.get('instrumentation', {}).get('subprocess_count', 0)}" + """</p>
+                <p>> SYSTEM SCANNER v""" + Config.SCANNER_VERSION + """ | SABARI425 SECURITY | ACCESS LEVEL: ROOT</p>
                 <p style="margin-top: 10px; color: #00ff00; font-size: 0.8em;">
                     "The quieter you become, the more you are able to hear."
                 </p>
@@ -3214,17 +6486,349 @@ def generate_html_report():
     with open(html_path, 'w', encoding='utf-8') as f:
         f.write(html_content)
 
+    return html_path
+
+
+# -------------------------------------------------------------------
+#  MACHINE-READABLE AND TEXT REPORT RENDERERS
+# -------------------------------------------------------------------
+def dumps_json(data, indent=False):
+    """Serialise to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=str, option=option)
+    if indent:
+        return json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, default=str, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def normalize_row(row):
+    """Return a section row as a dict (key-value pairs become Property/Value)"""
+    if isinstance(row, dict):
+        return row
+    if isinstance(row, (list, tuple)) and len(row) == 2:
+        return {"Property": row[0], "Value": row[1]}
+    return {"Value": row}
+
+
+def iter_ndjson_records(scan_data):
+    """Yield one metadata record followed by one record per section row"""
+    metadata = dict(scan_data["metadata"])
+    metadata["health_score"] = scan_data["health_score"]
+    yield {"record": "metadata", "data": metadata}
+    for section_name, rows in scan_data["sections"].items():
+        for index, row in enumerate(rows):
+            yield {"record": "row", "section": section_name, "index": index, "data": normalize_row(row)}
+
+
+def render_json_report(scan_data, json_path):
+    """Render the scan data model as one JSON document"""
+    with open(json_path, 'wb') as f:
+        f.write(dumps_json(scan_data, indent=True))
+    return json_path
+
+
+def render_ndjson_report(scan_data, ndjson_path):
+    """Render the scan data model as newline-delimited JSON, one row per line"""
+    with open(ndjson_path, 'wb') as f:
+        for record in iter_ndjson_records(scan_data):
+            f.write(dumps_json(record))
+            f.write(b"\n")
+    return ndjson_path
+
+
+def render_text_report(scan_data, text_path):
+    """Render the scan data model as plain-text tables"""
+    metadata = scan_data["metadata"]
+    with open(text_path, 'w', encoding='utf-8') as f:
+        f.write("SYSTEM SCAN REPORT | SABARI425\n")
+        f.write("=" * 80 + "\n")
+        for key, value in metadata.items():
+            if not isinstance(value, dict):
+                f.write(f"{key.replace('_', ' ').title():<20}: {value}\n")
+        if scan_data["health_score"] is not None:
+            f.write(f"{'System Health':<20}: {scan_data['health_score']}/100\n")
+
+        for section_name, rows in scan_data["sections"].items():
+            f.write(f"\n\n> {section_name}\n")
+            f.write("-" * 80 + "\n")
+            if not rows:
+                f.write("NO DATA AVAILABLE\n")
+                continue
+            f.write(tabulate([normalize_row(row) for row in rows], headers="keys", tablefmt="simple"))
+            f.write("\n")
+
+        stages = metadata.get("instrumentation", {}).get("stages")
+        if stages:
+            f.write("\n\n> SCAN INSTRUMENTATION\n")
+            f.write("-" * 80 + "\n")
+            f.write(tabulate([[stage["name"], f"{stage['wall']:.3f}", f"{stage['cpu']:.3f}",
+                               stage["subprocesses"], stage["peak_rss_delta"]] for stage in stages],
+                             headers=["Stage", "Wall (s)", "CPU (s)", "Subprocs", "Peak RSS Delta (B)"],
+                             tablefmt="simple"))
+            f.write("\n")
+    return text_path
+
+
+REPORT_RENDERERS = OrderedDict([
+    ("html", (".html", render_html_report)),
+    ("json", (".json", render_json_report)),
+    ("ndjson", (".ndjson", render_ndjson_report)),
+    ("text", (".txt", render_text_report)),
+])
+
+
+def generate_reports(formats=("html",), output_dir=None, only=None, skip=None, parallel=False):
+    """Collect the scan once and render it in every requested format"""
+    unknown = [fmt for fmt in formats if fmt not in REPORT_RENDERERS]
+    if unknown:
+        raise ValueError(f"Unknown report format(s): {', '.join(unknown)}")
+
+    scan_data = collect_scan_data(only, skip, parallel)
+
+    output_dir = output_dir or get_downloads_folder()
+    os.makedirs(output_dir, exist_ok=True)
+    base_name = f"Sabari425_System_Scan_{datetime.now().strftime('%d.%m.%Y_%H-%M-%S')}"
+
     print("\n\n")
+    report_paths = OrderedDict()
+    for fmt in formats:
+        extension, renderer = REPORT_RENDERERS[fmt]
+        report_paths[fmt] = renderer(scan_data, os.path.join(output_dir, base_name + extension))
+        print_status(f"{fmt.upper()} report generated: {report_paths[fmt]}", "DATA")
+
     print_status("Hacker scan report generated successfully!", "SUCCESS")
-    print_status(f"Report location: {html_path}", "DATA")
+    return scan_data, report_paths
+
+
+def generate_html_report():
+    return generate_reports(("html",))[1]["html"]
+
+
+# -------------------------------------------------------------------
+#  SCAN SNAPSHOT DIFFING
+# -------------------------------------------------------------------
+# Natural identity of a row per section, and fields that churn between scans
+# without meaning anything changed (e.g. the PID of a restarted service).
+SNAPSHOT_DIFF_KEYS = OrderedDict([
+    ("SYSTEM SERVICES", (("Service Name",), ("PID",))),
+    ("INSTALLED SOFTWARE", (("Software Name", "Version"), ())),
+    ("SYSTEM DRIVERS", (("Module Name",), ())),
+    ("LISTENING PORTS", (("Protocol", "Address", "Port"), ("PID",))),
+    ("USER ACCOUNTS", (("Username",), ("Last Logon",))),
+    ("ENVIRONMENT VARIABLES", (("Variable",), ())),
+])
+
+
+def load_scan_snapshot(path):
+    """Load a scan saved with --format json or --format ndjson"""
+    if path.endswith(".ndjson"):
+        scan_data = {"metadata": {}, "health_score": None, "sections": OrderedDict()}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("record") == "metadata":
+                    scan_data["metadata"] = record["data"]
+                    scan_data["health_score"] = record["data"].get("health_score")
+                else:
+                    scan_data["sections"].setdefault(record["section"], []).append(record["data"])
+        return scan_data
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-    return html_path
+
+def index_snapshot_rows(rows, key_fields):
+    """Build a {natural key: row} hash index for one section"""
+    index = {}
+    for row in rows:
+        row = normalize_row(row)
+        index[tuple(str(row.get(field, "")) for field in key_fields)] = row
+    return index
+
+
+def diff_scan_snapshots(old_scan, new_scan, sections=None):
+    """Compute added / removed / modified rows between two scan snapshots"""
+    changes = []
+    old_sections = old_scan.get("sections", {})
+    new_sections = new_scan.get("sections", {})
+
+    for section_name, (key_fields, ignored_fields) in SNAPSHOT_DIFF_KEYS.items():
+        if sections and section_name not in sections:
+            continue
+        if section_name not in old_sections or section_name not in new_sections:
+            continue
+
+        old_index = index_snapshot_rows(old_sections[section_name], key_fields)
+        new_index = index_snapshot_rows(new_sections[section_name], key_fields)
+
+        for key in sorted(new_index.keys() - old_index.keys()):
+            changes.append({"Section": section_name, "Change": "ADDED", "Key": " | ".join(key), "Details": ""})
+        for key in sorted(old_index.keys() - new_index.keys()):
+            changes.append({"Section": section_name, "Change": "REMOVED", "Key": " | ".join(key), "Details": ""})
+
+        for key in sorted(old_index.keys() & new_index.keys()):
+            old_row, new_row = old_index[key], new_index[key]
+            if old_row == new_row:
+                continue
+            modified = [f"{field}: {old_row.get(field, 'N/A')} -> {new_row.get(field, 'N/A')}"
+                        for field in sorted(old_row.keys() | new_row.keys())
+                        if field not in ignored_fields and old_row.get(field) != new_row.get(field)]
+            if modified:
+                changes.append({"Section": section_name, "Change": "MODIFIED", "Key": " | ".join(key),
+                                "Details": "; ".join(modified)})
+
+    return changes
+
+
+def print_snapshot_diff(old_path, new_path):
+    """Print a compact change report between two saved scans"""
+    old_scan = load_scan_snapshot(old_path)
+    new_scan = load_scan_snapshot(new_path)
+    changes = diff_scan_snapshots(old_scan, new_scan)
+
+    print_status(f"Baseline: {old_path} ({old_scan.get('metadata', {}).get('generated_at', 'N/A')})", "DATA")
+    print_status(f"Current:  {new_path} ({new_scan.get('metadata', {}).get('generated_at', 'N/A')})", "DATA")
+    if old_scan.get("health_score") is not None and new_scan.get("health_score") is not None:
+        print_status(f"System Health: {old_scan['health_score']}/100 -> {new_scan['health_score']}/100", "INFO")
+
+    summary = OrderedDict()
+    for change in changes:
+        counts = summary.setdefault(change["Section"], {"ADDED": 0, "REMOVED": 0, "MODIFIED": 0})
+        counts[change["Change"]] += 1
+
+    if not changes:
+        print_status("No changes detected between snapshots", "SUCCESS")
+        return changes
+
+    print()
+    print(tabulate([[section, c["ADDED"], c["REMOVED"], c["MODIFIED"]] for section, c in summary.items()],
+                   headers=["Section", "Added", "Removed", "Modified"], tablefmt="simple"))
+    print()
+    print(tabulate([[c["Section"], c["Change"], c["Key"], c["Details"][:120]] for c in changes],
+                   headers=["Section", "Change", "Key", "Details"], tablefmt="simple"))
+    return changes
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Sabari425 System Scanner")
+    parser.add_argument("--format", default="html",
+                        help="Comma-separated report formats: " + ", ".join(REPORT_RENDERERS))
+    parser.add_argument("--output-dir", help="Directory for report files (default: Downloads folder)")
+    parser.add_argument("--no-browser", action="store_true", help="Do not open the HTML report when done")
+    parser.add_argument("--only", action="append", metavar="SECTION",
+                        help="Run only this section (repeatable or comma-separated)")
+    parser.add_argument("--skip", action="append", metavar="SECTION",
+                        help="Skip this section (repeatable or comma-separated)")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Run independent collectors in parallel threads (DataCollector)")
+    parser.add_argument("--list-sections", action="store_true", help="List available sections and exit")
+    parser.add_argument("--profile", metavar="PSTATS_FILE", help="Write a cProfile/pstats dump of the scan")
+    parser.add_argument("--trace", metavar="TRACE_JSON", help="Write a Chrome trace-event JSON of the scan")
+    parser.add_argument("--record-commands", metavar="BUNDLE_JSON",
+                        help="Record every command output and latency into a fixture bundle")
+    parser.add_argument("--replay-commands", metavar="BUNDLE_JSON",
+                        help="Serve commands from a recorded fixture bundle instead of running them")
+    parser.add_argument("--replay-latency", type=float, default=1.0, metavar="SCALE",
+                        help="Multiplier for recorded command latencies when replaying (0 = instant)")
+    parser.add_argument("--stdout-json", action="store_true",
+                        help="Print the scan as one compact JSON document on stdout (status output goes to stderr)")
+    parser.add_argument("--no-shell-worker", action="store_true",
+                        help="Start a new PowerShell process per query instead of reusing one worker")
+    parser.add_argument("--no-boot-cache", action="store_true",
+                        help="Re-query per-boot hardware facts and hourly inventories instead of reusing the cache")
+    parser.add_argument("--health-rules", metavar="RULES_JSON",
+                        help="Health score thresholds overriding the built-in rules (default: health_rules.json "
+                             "in the cache directory, if present)")
+    parser.add_argument("--site", help="Apply this site's overrides from the health rules file")
+    parser.add_argument("--print-health-rules", action="store_true",
+                        help="Print the effective health rules as JSON (a starting point for a rules file) and exit")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD_SCAN", "NEW_SCAN"),
+                        help="Compare two saved JSON/NDJSON scans instead of scanning")
+    args = parser.parse_args(argv)
+    args.only = [name for value in args.only or [] for name in value.split(',') if name.strip()]
+    args.skip = [name for value in args.skip or [] for name in value.split(',') if name.strip()]
+    args.formats = [fmt.strip().lower() for fmt in args.format.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in args.formats if fmt not in REPORT_RENDERERS]
+    if unknown or not args.formats:
+        parser.error(f"--format: unknown format(s) {', '.join(unknown) or '(none given)'}; "
+                     f"choose from {', '.join(REPORT_RENDERERS)}")
+    try:
+        # Compiled (and cached) now so a bad file or unknown site stops the scan before it starts
+        health_rules(args.health_rules, args.site)
+    except (OSError, ValueError) as e:
+        parser.error(f"health rules: {e}")
+    return args
 
 
 # -------------------------------------------------------------------
 #  MAIN EXECUTION - HACKER THEME
 # -------------------------------------------------------------------
+def configure_command_backend(args):
+    """Apply the shell worker, record and replay options"""
+    if args.no_shell_worker:
+        Config.SHELL_WORKER = False
+    if args.no_boot_cache:
+        Config.BOOT_CACHE = False
+    if args.record_commands:
+        set_command_backend(RecordingCommandBackend(args.record_commands))
+        set_registry(RecordingRegistry(get_registry()))
+    elif args.replay_commands:
+        set_command_backend(ReplayCommandBackend(args.replay_commands, args.replay_latency))
+        set_registry(FakeRegistry(command_backend.registry_keys))
+        print_status(f"Replaying {command_backend.platform} commands from {args.replay_commands}", "INFO")
+
+
+def finish_command_backend():
+    """Save recordings, report replay misses and stop shell workers"""
+    if isinstance(command_backend, RecordingCommandBackend):
+        print_status(f"Recorded {len(command_backend.commands)} commands: {command_backend.save()}", "DATA")
+    elif isinstance(command_backend, ReplayCommandBackend) and command_backend.misses:
+        print_status(f"{len(command_backend.misses)} commands were not in the replay bundle", "WARNING")
+    if isinstance(command_backend, LiveCommandBackend):
+        command_backend.stop_workers()
+
+
 if __name__ == "__main__":
+    args = parse_arguments()
+
+    if args.diff:
+        try:
+            print_snapshot_diff(*args.diff)
+        except Exception as e:
+            print_status(f"Snapshot diff failed: {str(e)}", "ERROR")
+            sys.exit(1)
+        sys.exit(0)
+
+    Config.HEALTH_RULES_FILE = args.health_rules or Config.HEALTH_RULES_FILE
+    Config.HEALTH_SITE = args.site or Config.HEALTH_SITE
+    if args.print_health_rules:
+        sys.stdout.buffer.write(dumps_json(health_rules().spec, indent=True) + b"\n")
+        sys.exit(0)
+
+    if args.list_sections:
+        for name, collector in COLLECTOR_REGISTRY.items():
+            depends = f" (needs: {', '.join(collector['depends'])})" if collector["depends"] else ""
+            kind = "" if collector["section"] else " [internal]"
+            print_colored(f"    [>] {name}{kind}{depends}", Colors.HACKER_GREEN)
+        sys.exit(0)
+
+    if args.stdout_json:
+        # Machine-readable mode for fleet runs: stdout carries only the JSON document
+        try:
+            with contextlib.redirect_stdout(sys.stderr):
+                configure_command_backend(args)
+                scan_data = collect_scan_data(args.only, args.skip, args.parallel)
+                finish_command_backend()
+        except Exception as e:
+            print(f"SCAN FAILED: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        sys.stdout.buffer.write(dumps_json(scan_data) + b"\n")
+        sys.stdout.flush()
+        sys.exit(0)
+
     print()
     print_colored("INITIATING SYSTEM PENETRATION SCAN...", Colors.MATRIX_GREEN)
     print_status("Loading hacker modules...", "INFO")
@@ -3232,7 +6836,19 @@ if __name__ == "__main__":
     browser_opened = False
 
     try:
-        html_path = generate_html_report()
+        configure_command_backend(args)
+        profiler = cProfile.Profile() if args.profile else None
+        if profiler:
+            profiler.enable()
+        scan_data, report_paths = generate_reports(args.formats, args.output_dir, args.only, args.skip, args.parallel)
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print_status(f"cProfile stats written: {args.profile}", "DATA")
+        if args.trace:
+            print_status(f"Chrome trace written: {instrumentation.write_chrome_trace(args.trace)}", "DATA")
+        finish_command_backend()
+        html_path = report_paths.get("html")
 
         print()
         print_colored("╔═══════════════════════════════════════════════════════════════════════════╗", Colors.BRIGHT_GREEN)
@@ -3242,14 +6858,18 @@ if __name__ == "__main__":
         print_colored("╚═══════════════════════════════════════════════════════════════════════════╝", Colors.BRIGHT_GREEN)
         print("\n\n\n")
 
-        health_score = get_system_health_score()
+        health_score = scan_data["health_score"]
 
         print();
         print()
         print_status("SCAN REPORT SUMMARY:", "SUCCESS")
-        print_status(f"Output File: {html_path}", "DATA")
+        for report_path in report_paths.values():
+            print_status(f"Output File: {report_path}", "DATA")
 
-        if health_score >= 80:
+        if health_score is None:
+            print("\t", end='');
+            print_status("System Health: not evaluated for this section selection", "INFO")
+        elif health_score >= 80:
             print("\t", end='');
             print_status(f"System Health: {health_score}/100 (SECURE)", "SUCCESS")
         elif health_score >= 60:
@@ -3261,17 +6881,11 @@ if __name__ == "__main__":
 
         print("\n\n")
 
+        instrumentation.print_slowest_stages()
+        print("\n\n")
+
         print_status("SCANNED MODULES:", "INFO")
-        sections = [
-            "SYSTEM OVERVIEW", "HARDWARE DETAILS", "STORAGE ANALYSIS",
-            "GRAPHICS CARD INFORMATION", "NETWORK ANALYSIS", "NETWORK CONNECTIONS",
-            "WIFI SECURITY ANALYSIS", "USER ACCOUNTS", "SYSTEM SERVICES",
-            "INSTALLED SOFTWARE", "SYSTEM DRIVERS", "SECURITY INFORMATION",
-            "POWER MANAGEMENT", "ENVIRONMENT VARIABLES", "SYSTEM UPTIME ANALYSIS",
-            "SYSTEM LOGS", "EVENT LOGS SUMMARY", "ADVANCED SYSTEM DETAILS",
-            "SYSTEM PERFORMANCE", "VULNERABILITY ASSESSMENT", "ENCRYPTION & SECURITY STATUS",
-            "BROWSER DATA ANALYSIS", "REMOTE ACCESS DETECTION", "TASK MANAGER"
-        ]
+        sections = list(scan_data["sections"])
         for section in sections:
             print_colored(f"    [>] {section}", Colors.HACKER_GREEN)
 
@@ -3279,7 +6893,9 @@ if __name__ == "__main__":
         print_status("Launching report interface...", "INFO")
 
         # Try to open the file in default browser - ONLY ONCE
-        if not browser_opened:
+        if not html_path or args.no_browser:
+            print_status("Report interface launch skipped", "INFO")
+        elif not browser_opened:
             try:
                 if platform.system() == "Windows":
                     os.startfile(html_path)
@@ -3302,3 +6918,4 @@ if __name__ == "__main__":
     except Exception as e:
         print_status(f"SCAN FAILED: {str(e)}", "ERROR")
         print_status("Check permissions and try again", "WARNING")
+        sys.exit(1)